@@ -1,36 +1,68 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from app.compression import init_compression
 from app.config import Config
+from app.logging_config import configure_logging
+from app.metrics import init_metrics
+from app.query_budget import init_query_budget
+from app.read_only import RoutingSession, init_read_only
+from app.sqlite_tuning import init_sqlite_tuning
+from sqlalchemy.engine import make_url
+import logging
 import os
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+logger = logging.getLogger(__name__)
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__)
     app.config.from_object(Config)
+    if test_config:
+        app.config.update(test_config)
+    configure_logging(app)
     
-    # ✅ CONFIGURACIÓN SQLITE CON RUTA ABSOLUTA EXPLÍCITA
-    base_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-    db_path = os.path.join(base_dir, 'data', 'salarios.db')
-    
-    # Asegurar que la carpeta existe
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    # ✅ CONFIGURACIÓN SQLITE: data/salarios.db por defecto, DATABASE_URL o test_config la reemplazan
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:'):
+        # Asegurar que la carpeta existe
+        os.makedirs(os.path.dirname(os.path.abspath(url.database)), exist_ok=True)
+    elif url.get_backend_name() == 'sqlite':
+        # Las bases en memoria usan StaticPool: no admiten opciones de pool
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            key: value for key, value in app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}).items()
+            if key not in ('pool_size', 'max_overflow', 'pool_timeout')
+        }
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     
-    print(f"🗄️ Base de datos en: {db_path}")
+    logger.info('database.path', extra={'fields': {'url': url.render_as_string(hide_password=True)}})
     
     # ✅ INICIALIZAR DB UNA SOLA VEZ
     db.init_app(app)
     
+    # ✅ PERFIL DE RENDIMIENTO SQLITE (WAL, mmap, busy_timeout, ...)
+    with app.app_context():
+        init_sqlite_tuning(app, db.engine)
+    
+    # ✅ ENGINE DE SOLO LECTURA PARA GET Y ENDPOINTS @read_only
+    init_read_only(app)
+    
     # ✅ CONFIGURAR CORS (después de db.init_app)
     CORS(app, resources={r"/api/*": {"origins": "http://localhost:4200"}})
     
+    # ✅ MÉTRICAS POR ENDPOINT (latencia, SQL, filas, bytes)
+    init_metrics(app)
+    
+    # ✅ PRESUPUESTO DE CONSULTAS POR ENDPOINT (tests / desarrollo)
+    if app.config.get('QUERY_BUDGET_ENABLED') or app.testing:
+        init_query_budget(app)
+    
+    # ✅ COMPRESIÓN GZIP/BROTLI (después de las métricas: miden los bytes comprimidos)
+    init_compression(app)
+    
     # ✅ MOVER LOS IMPORTS DE MODELOS dentro del contexto
     with app.app_context():
-        from app.models import employmentType, experienceLevel, jobTitle, location, role, user, salary
+        from app.models import employmentType, experienceLevel, jobTitle, location, role, user, salary, salaryRollup, seedImport
 
     # Registrar las rutas CRUD
     from app.routes.user_routes import user_bp
@@ -40,6 +72,7 @@ def create_app():
     from app.routes.location_routes import location_bp
     from app.routes.role_routes import role_bp
     from app.routes.salary_routes import salary_bp
+    from app.routes.metrics_routes import metrics_bp
 
     app.register_blueprint(user_bp, url_prefix='/api/users')
     app.register_blueprint(employment_type_bp, url_prefix='/api/employmentTypes')
@@ -48,5 +81,10 @@ def create_app():
     app.register_blueprint(location_bp, url_prefix='/api/locations')
     app.register_blueprint(role_bp, url_prefix='/api/roles')
     app.register_blueprint(salary_bp, url_prefix='/api/salaries')
+    app.register_blueprint(metrics_bp, url_prefix='/api/metrics')
+
+    # ✅ COMANDOS CLI: flask db-init / flask seed
+    from app.cli import register_cli
+    register_cli(app)
 
     return app
\ No newline at end of file
@@ -0,0 +1,393 @@
+"""
+Modo de servicio ASGI (async) para los endpoints de lectura.
+
+Expone los GET de salary_bp y de los blueprints de dimensiones, y los POST
+analíticos de solo lectura (/average-salary, /distribution), sobre SQLAlchemy
+async con aiosqlite. Un solo proceso puede tener muchas consultas en vuelo sin
+ocupar un hilo por petición.
+
+No duplica la lógica de las rutas Flask: usa los mismos modelos, sentencias
+SQL, FieldSet de ?fields=, armado de respuestas (app/services/salary_analytics.py)
+y decisión de compresión (app/compression.py). Lo propio de este módulo es el
+ruteo, la ejecución async de las sentencias y el CORS.
+
+Diferencias con la app Flask:
+
+- solo lectura: las escrituras, /export, /average-salary/batch,
+  /api/jobTitles/search, /api/users y /api/metrics siguen en la app Flask
+  (aquí responden 404);
+- sin métricas ni presupuesto de consultas;
+- las respuestas JSON sin ?fields= salen con claves ordenadas, como jsonify.
+
+El cubo en memoria no se usa en este modo: los promedios salen de
+salary_rollups (SALARY_ROLLUPS_ENABLED) o de la tabla salaries. Este modo no
+reconstruye los rollups (su engine es de solo lectura): al encender el flag
+los pone al día la app Flask (salary_rollups.ensure_current). Como las
+escrituras las hace otro proceso, las dimensiones se releen cada
+ASGI_DIMENSION_TTL segundos y cuando llega un nombre desconocido.
+
+Las dimensiones se cargan siempre con consultas async (load_dimensions). Los
+handlers corren dentro de dimension_registry.preloaded_only(): si alguno
+pidiera una dimensión sin precargar, falla con DimensionNotLoaded en lugar de
+consultar con db.session y bloquear el event loop.
+
+Uso (dependencias opcionales):
+    pip install aiosqlite uvicorn
+    uvicorn --factory app.asgi:create_asgi_app --port 5001
+"""
+import json
+import logging
+import re
+import time
+from urllib.parse import parse_qs
+
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from werkzeug.http import parse_accept_header
+
+from app import create_app
+from app.compression import choose_encoding, compress, is_compressible, weak_etag
+from app.fieldsets import dumps, rows_to_dicts
+from app.models.employmentType import EmploymentType
+from app.models.experienceLevel import ExperienceLevel
+from app.models.jobTitle import JobTitle
+from app.models.location import Location
+from app.models.role import Role
+from app.models.salary import Salary
+from app.read_only import read_only_url
+from app.routes.job_title_routes import JOB_TITLE_FIELDS
+from app.routes.location_routes import LOCATION_FIELDS
+from app.routes.salary_routes import SALARY_FIELDS
+from app.services import salary_analytics, salary_distribution, salary_rollups
+from app.services.dimension_registry import dimension_registry
+from app.sqlite_tuning import init_sqlite_tuning
+
+logger = logging.getLogger(__name__)
+
+# Prefijo bajo /api -> modelo (los mismos url_prefix que en create_app)
+DIMENSION_PREFIXES = {
+    'employmentTypes': EmploymentType,
+    'experienceLevels': ExperienceLevel,
+    'jobTitles': JobTitle,
+    'locations': Location,
+    'roles': Role,
+}
+
+# ?fields= de las listas de dimensiones (las mismas que en sus blueprints)
+DIMENSION_FIELDS = {
+    'jobTitles': JOB_TITLE_FIELDS,
+    'locations': LOCATION_FIELDS,
+}
+
+# Igual que la configuración de CORS de create_app
+CORS_ORIGINS = ('http://localhost:4200',)
+
+
+class AsgiRequest:
+    """Lo mínimo de una petición HTTP ASGI que necesitan los handlers."""
+
+    def __init__(self, scope, body, params):
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = {k: v[-1] for k, v in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()}
+        self.headers = {k.decode('latin-1').lower(): v.decode('latin-1') for k, v in scope.get('headers', [])}
+        self.body = body
+        self.params = params
+
+    def get_json(self):
+        try:
+            return json.loads(self.body) if self.body else None
+        except ValueError:
+            return None
+
+
+def json_response(payload, status=200, headers=None):
+    """(status, body, headers) con la misma serialización que jsonify (claves ordenadas, compacto)."""
+    body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return status, body, [('content-type', 'application/json'), *(headers or [])]
+
+
+def fields_response(payload):
+    """Respuesta de ?fields= con la misma serialización que fieldsets.json_response."""
+    return 200, dumps(payload), [('content-type', 'application/json')]
+
+
+class AsyncSalaryApp:
+    """Aplicación ASGI de solo lectura sobre un AsyncEngine."""
+
+    def __init__(self, flask_app, engine):
+        self.config = flask_app.config
+        self.engine = engine
+        # Dimensión -> instante (monotonic) de la última lectura desde la base
+        self.dimensions_read_at = {}
+        dimensions = '|'.join(DIMENSION_PREFIXES)
+        self.routes = [
+            ('GET', r'/api/salaries/?', self.list_salaries),
+            ('GET', r'/api/salaries/filters', self.filter_options),
+            ('POST', r'/api/salaries/average-salary', self.average_salary),
+            ('POST', r'/api/salaries/distribution', self.distribution),
+            ('GET', r'/api/salaries/(?P<id>\d+)', self.get_salary),
+            ('GET', rf'/api/(?P<prefix>{dimensions})/?', self.list_dimension),
+            ('GET', rf'/api/(?P<prefix>{dimensions})/(?P<id>\d+)', self.get_dimension),
+        ]
+        self.routes = [(method, re.compile(pattern + '$'), handler) for method, pattern, handler in self.routes]
+
+    # --- protocolo ASGI -------------------------------------------------
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+
+        status, payload, headers = await self.dispatch(scope, body)
+        if self.config.get('COMPRESSION_ENABLED', True):
+            payload, headers = self.compress(scope, status, payload, headers)
+        if status == 304 or scope['method'] == 'HEAD':
+            # Los handlers devuelven el cuerpo del 200 para decidir la compresión
+            payload = b''
+            if status == 304:
+                headers = [(k, v) for k, v in headers if k != 'content-type']
+        origin = dict(scope.get('headers', [])).get(b'origin', b'').decode('latin-1')
+        if origin in CORS_ORIGINS:
+            headers.append(('access-control-allow-origin', origin))
+            headers.append(('vary', 'Origin'))
+        headers.append(('content-length', str(len(payload))))
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(k.encode('latin-1'), v.encode('latin-1')) for k, v in headers],
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    def compress(self, scope, status, payload, headers):
+        """Misma decisión que el after_request de app/compression.py (Vary, ETag débil, tamaño mínimo)."""
+        content_type = next((v for k, v in headers if k == 'content-type'), None)
+        if not is_compressible(status, content_type):
+            return payload, headers
+        headers = [*headers, ('vary', 'Accept-Encoding')]
+        accept_encoding = dict(scope.get('headers', [])).get(b'accept-encoding', b'').decode('latin-1')
+        encoding = choose_encoding(status, content_type, len(payload), parse_accept_header(accept_encoding),
+                                   self.config)
+        if encoding is None:
+            return payload, headers
+        headers = [(k, weak_etag(v) if k == 'etag' else v) for k, v in headers]
+        if status == 304:
+            return payload, headers
+        return compress(payload, encoding, self.config), [*headers, ('content-encoding', encoding)]
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def dispatch(self, scope, body):
+        path_matched = False
+        for method, pattern, handler in self.routes:
+            match = pattern.match(scope['path'])
+            if not match:
+                continue
+            path_matched = True
+            if scope['method'] == 'OPTIONS':
+                return 204, b'', [('access-control-allow-methods', 'GET, POST, OPTIONS'),
+                                  ('access-control-allow-headers', 'Content-Type')]
+            if scope['method'] in (method, 'HEAD' if method == 'GET' else None):
+                request = AsgiRequest(scope, body, match.groupdict())
+                async with self.session() as session:
+                    with dimension_registry.preloaded_only():
+                        return await handler(session, request)
+        if path_matched:
+            return json_response({'message': 'Método no permitido'}, 405)
+        return json_response({'message': 'Ruta no disponible en modo async (solo lectura)'}, 404)
+
+    def session(self):
+        return AsyncSession(self.engine, expire_on_commit=False)
+
+    async def load_dimensions(self, session, dimensions=salary_analytics.FILTER_DIMENSIONS, force=False):
+        """
+        Carga en el registro de dimensiones las que falten, con consultas async.
+
+        Las escrituras pasan por la app Flask (otro proceso), que no puede
+        invalidar este registro: por eso cada dimensión se vuelve a leer si
+        pasaron más de ASGI_DIMENSION_TTL segundos desde la última lectura, o
+        siempre con force=True. refresh() solo cambia la versión (y con ella el
+        ETag de /filters) si las filas cambiaron.
+        """
+        ttl = self.config.get('ASGI_DIMENSION_TTL', 5)
+        for dimension in dimensions:
+            read_at = self.dimensions_read_at.get(dimension)
+            if (not force and dimension_registry.is_loaded(dimension)
+                    and read_at is not None and time.monotonic() - read_at < ttl):
+                continue
+            rows = (await session.execute(dimension_registry.statement(dimension))).all()
+            dimension_registry.refresh(dimension, rows)
+            self.dimensions_read_at[dimension] = time.monotonic()
+
+    async def resolve_filters(self, session, data):
+        """
+        salary_analytics.resolve_filters con el registro al día; si un nombre no
+        se encuentra (p. ej. recién creado) se relee su dimensión una vez, así
+        el filtro no se descarta en silencio.
+        """
+        await self.load_dimensions(session)
+        filters, requested = salary_analytics.resolve_filters(data, reload=False)
+        missing = [dimension for dimension in salary_analytics.unresolved_filters(data, filters)
+                   if dimension_registry.should_reload(dimension)]
+        if missing:
+            await self.load_dimensions(session, missing, force=True)
+            filters, requested = salary_analytics.resolve_filters(data, reload=False)
+        return filters, requested
+
+    # --- handlers ---------------------------------------------------------
+
+    async def list_salaries(self, session, request):
+        try:
+            if 'fields' in request.args:
+                try:
+                    names = SALARY_FIELDS.parse(request.args['fields'])
+                    statement, payload = salary_analytics.fields_query(SALARY_FIELDS, names, request.args)
+                except ValueError as e:
+                    return json_response({'message': str(e)}, 400)
+                return fields_response(payload((await session.execute(statement)).all()))
+
+            statement = Salary.select_with_dimensions()
+
+            if 'after_id' not in request.args and 'limit' not in request.args:
+                rows = (await session.execute(statement.order_by(Salary.id))).all()
+                return json_response([Salary.row_to_dict(r) for r in rows])
+
+            try:
+                after_id, limit = salary_analytics.parse_page(request.args)
+            except ValueError as e:
+                return json_response({'message': str(e)}, 400)
+
+            statement = statement.where(Salary.id > after_id).order_by(Salary.id).limit(limit + 1)
+            rows = (await session.execute(statement)).all()
+            return json_response(salary_analytics.page_payload(rows, limit, Salary.row_to_dict))
+        except Exception as e:
+            return json_response({'message': 'Error al obtener salarios', 'error': str(e)}, 500)
+
+    async def get_salary(self, session, request):
+        statement = Salary.select_with_dimensions().where(Salary.id == int(request.params['id']))
+        row = (await session.execute(statement)).first()
+        if row is None:
+            return json_response({'message': 'Salario no encontrado o error'}, 404)
+        return json_response(Salary.row_to_dict(row))
+
+    async def filter_options(self, session, request):
+        try:
+            await self.load_dimensions(session)
+            body, etag = salary_analytics.filter_options()
+        except Exception as e:
+            return json_response({'message': 'Error al obtener filtros', 'error': str(e)}, 500)
+
+        headers = [('etag', f'"{etag}"'), ('cache-control', 'public, no-cache')]
+        if_none_match = request.headers.get('if-none-match', '')
+        status = 304 if etag in [tag.strip().removeprefix('W/').strip('"') for tag in if_none_match.split(',')] else 200
+        return status, body, [('content-type', 'application/json'), *headers]
+
+    async def average_salary(self, session, request):
+        try:
+            data = request.get_json() or {}
+            filters, requested = await self.resolve_filters(session, data)
+
+            if self.config.get('SALARY_ROLLUPS_ENABLED'):
+                row = (await session.execute(salary_rollups.rollups_average_statement(**filters))).one()
+                average_salary, sample_size = salary_rollups.rollups_average_result(row)
+            else:
+                row = (await session.execute(salary_rollups.salaries_average_statement(**filters))).one()
+                average_salary, sample_size = salary_rollups.salaries_average_result(row)
+
+            response = salary_analytics.average_payload(average_salary, sample_size, requested)
+
+            if data.get('consistencyCheck') and self.config.get('SALARY_ROLLUPS_ENABLED'):
+                rollup = (await session.execute(salary_rollups.rollups_average_statement(**filters))).one()
+                raw = (await session.execute(salary_rollups.salaries_average_statement(**filters))).one()
+                response["consistency"] = salary_rollups.consistency_report(
+                    salary_rollups.rollups_average_result(rollup), salary_rollups.salaries_average_result(raw)
+                )
+            return json_response(response)
+        except Exception as e:
+            logger.exception('average_salary.error')
+            return json_response({"error": str(e)}, 500)
+
+    async def distribution(self, session, request):
+        try:
+            data = request.get_json() or {}
+            try:
+                bins = salary_analytics.parse_bins(data)
+            except ValueError as e:
+                return json_response({'message': str(e)}, 400)
+
+            filters, requested = await self.resolve_filters(session, data)
+            rows = (await session.execute(salary_distribution.salary_values_statement(**filters))).all()
+            values = salary_distribution.values_from_rows(rows)
+            return json_response(salary_analytics.distribution_payload(values, bins, requested))
+        except Exception as e:
+            return json_response({'message': 'Error al calcular la distribución', 'error': str(e)}, 500)
+
+    async def list_dimension(self, session, request):
+        model = DIMENSION_PREFIXES[request.params['prefix']]
+        fieldset = DIMENSION_FIELDS.get(request.params['prefix'])
+        if fieldset is not None and 'fields' in request.args:
+            try:
+                names = fieldset.parse(request.args['fields'])
+            except ValueError as e:
+                return json_response({'message': str(e)}, 400)
+            rows = (await session.execute(fieldset.select(names))).all()
+            return fields_response(rows_to_dicts(rows, names))
+        try:
+            items = (await session.execute(select(model))).scalars().all()
+            return json_response([item.to_dict() for item in items])
+        except Exception as e:
+            return json_response({'message': 'Error al obtener registros', 'error': str(e)}, 500)
+
+    async def get_dimension(self, session, request):
+        model = DIMENSION_PREFIXES[request.params['prefix']]
+        item = await session.get(model, int(request.params['id']))
+        if item is None:
+            return json_response({'message': 'Registro no encontrado'}, 404)
+        return json_response(item.to_dict())
+
+
+def async_database_url(database):
+    """URL aiosqlite de solo lectura (mode=ro) para el mismo archivo SQLite."""
+    return read_only_url(database).replace('sqlite://', 'sqlite+aiosqlite://', 1)
+
+
+def create_asgi_app(test_config=None):
+    """
+    Crea la app ASGI de solo lectura. Reutiliza create_app() para la
+    configuración, los modelos y el logging; la base debe ser SQLite en archivo.
+    """
+    flask_app = create_app(test_config)
+    url = make_url(flask_app.config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+        raise RuntimeError('El modo async solo soporta bases SQLite en archivo')
+
+    try:
+        engine = create_async_engine(
+            async_database_url(url.database),
+            pool_size=flask_app.config.get('DB_READ_POOL_SIZE', 16),
+            max_overflow=flask_app.config['SQLALCHEMY_ENGINE_OPTIONS'].get('max_overflow', 8),
+        )
+    except ModuleNotFoundError as e:
+        raise RuntimeError('El modo async requiere aiosqlite (pip install aiosqlite)') from e
+    init_sqlite_tuning(flask_app, engine.sync_engine, read_only=True)
+
+    logger.info('asgi.ready', extra={'fields': {'database': url.database}})
+    return AsyncSalaryApp(flask_app, engine)
@@ -0,0 +1,79 @@
+import click
+
+from app import db
+
+
+def init_database():
+    """
+    Crea las tablas que falten y añade columnas/índices nuevos a las tablas
+    existentes. Es idempotente: se puede ejecutar en cada despliegue.
+    """
+    from app.models.salaryRollup import SalaryRollup
+    from app.services.salary_rollups import rebuild_rollups
+    from app.services.schema import ensure_columns, ensure_indexes
+
+    db.create_all()
+    click.echo("Tablas creadas correctamente")
+
+    added_columns = ensure_columns()
+    if added_columns:
+        click.echo(f"Columnas añadidas: {', '.join(added_columns)}")
+    created_indexes = ensure_indexes()
+    if created_indexes:
+        click.echo(f"Índices creados: {', '.join(created_indexes)}")
+
+    # Bases creadas antes de existir salary_rollups: construir el resumen una vez
+    if SalaryRollup.query.count() == 0 and db.session.execute(db.text('SELECT 1 FROM salaries LIMIT 1')).first():
+        rebuild_rollups()
+        db.session.commit()
+        click.echo("Tabla 'salary_rollups' construida desde 'salaries'")
+
+
+def seed_database(path=None, **options):
+    """
+    Carga el Excel/CSV si la tabla salaries está vacía; si ya se importó antes
+    con huellas, hace un seed incremental (no hace nada si el archivo no cambió).
+    """
+    # pandas/openpyxl solo se cargan cuando de verdad hay que sembrar
+    from seed_from_excel import EXCEL_PATH, _seed_from_excel
+    from app.models.salary import Salary
+    from app.models.seedImport import SeedImport
+
+    path = path or EXCEL_PATH
+    salaries_count = Salary.query.count()
+    if salaries_count == 0:
+        click.echo("Tabla 'salaries' vacía → ejecutando seed...")
+        _seed_from_excel(path, **options)
+        click.echo("Seed ejecutado correctamente")
+    elif SeedImport.query.first() is not None or options.get('incremental'):
+        click.echo(f"Tabla 'salaries' ya tiene {salaries_count} registros → seed incremental.")
+        options['incremental'] = True
+        _seed_from_excel(path, **options)
+    else:
+        click.echo(f"Tabla 'salaries' ya tiene {salaries_count} registros → no se ejecuta seed.")
+
+
+@click.command('db-init')
+def db_init_command():
+    """Crea el esquema de la base de datos (tablas, columnas e índices)."""
+    init_database()
+
+
+@click.command('seed')
+@click.argument('path', required=False)
+@click.option('--stream', is_flag=True, help='leer el archivo por lotes (memoria acotada)')
+@click.option('--batch-size', type=int, default=None, help='filas por lote en modo streaming')
+@click.option('--incremental', is_flag=True, help='insertar/actualizar filas nuevas o modificadas y borrar las que ya no están')
+@click.option('--workers', type=int, default=0, help='procesos para parsear y validar en paralelo')
+def seed_command(path, stream, batch_size, incremental, workers):
+    """Crea el esquema si hace falta y carga el Excel/CSV de salarios."""
+    init_database()
+    options = {'stream': stream, 'incremental': incremental, 'workers': workers}
+    if batch_size:
+        options['batch_size'] = batch_size
+    seed_database(path, **options)
+
+
+def register_cli(app):
+    app.cli.add_command(db_init_command)
+    app.cli.add_command(seed_command)
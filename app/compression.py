@@ -0,0 +1,158 @@
+# app/compression.py
+import gzip
+import logging
+import zlib
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # opcional: sin brotli solo se ofrece gzip
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Tipos de contenido que vale la pena comprimir (JSON, exportaciones y texto)
+COMPRESSIBLE_MIMETYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'text/csv',
+    'text/plain',
+)
+
+
+def available_encodings():
+    """Codificaciones soportadas, en orden de preferencia del servidor."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(accept_encoding, encodings):
+    """
+    Elige la codificación según Accept-Encoding: la de mayor q que soporte el
+    servidor y, a igual q, la primera de encodings. Devuelve None si el
+    cliente no acepta ninguna (o solo identity).
+    """
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = accept_encoding[encoding]
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compressor(encoding, config):
+    """Objeto con compress(bytes) / flush() para comprimir por partes."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config.get('COMPRESSION_BROTLI_QUALITY', 4))
+        return _BrotliStream(compressor)
+    # wbits=31: zlib con cabecera y trailer gzip
+    return zlib.compressobj(config.get('COMPRESSION_LEVEL', 6), zlib.DEFLATED, 31)
+
+
+class _BrotliStream:
+    def __init__(self, compressor):
+        self.compressor = compressor
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.finish()
+
+
+def compress(data, encoding, config):
+    """Comprime una respuesta completa."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=config.get('COMPRESSION_BROTLI_QUALITY', 4))
+    return gzip.compress(data, compresslevel=config.get('COMPRESSION_LEVEL', 6), mtime=0)
+
+
+def _compress_stream(chunks, compressor):
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def is_compressible(status, mimetype):
+    """True si la representación depende de Accept-Encoding (lleva Vary)."""
+    return status >= 200 and status not in (204, 206) and mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def choose_encoding(status, mimetype, size, accept_encoding, config):
+    """
+    Codificación con la que se comprime una respuesta, o None. size es el
+    largo del cuerpo (None en streaming, que siempre se comprime). Un 304 se
+    evalúa con el cuerpo del 200 al que reemplaza: si este se comprimiría, el
+    304 debe llevar el mismo ETag débil. La usan Flask y el modo ASGI.
+    """
+    if not is_compressible(status, mimetype):
+        return None
+    if size is not None and size < config.get('COMPRESSION_MIN_SIZE', 1024):
+        return None
+    return negotiate(accept_encoding, available_encodings())
+
+
+def weak_etag(etag):
+    """Versión débil de un ETag entre comillas (un ETag débil queda igual)."""
+    return etag if etag.startswith('W/') else f'W/{etag}'
+
+
+def _compress_response(response):
+    config = current_app.config
+
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return response
+    if not is_compressible(response.status_code, response.mimetype):
+        return response
+    # La representación depende de Accept-Encoding aunque esta vez no se comprima
+    response.vary.add('Accept-Encoding')
+
+    size = None if response.is_streamed else len(response.get_data())
+    encoding = choose_encoding(response.status_code, response.mimetype, size, request.accept_encodings, config)
+    if encoding is None:
+        return response
+
+    if response.status_code == 304:
+        # No se envía cuerpo, pero el 304 debe llevar el mismo validador
+        # que el 200 comprimido al que reemplaza
+        _weaken_etag(response)
+        return response
+    if response.is_streamed:
+        # Exportaciones: se comprime cada lote a medida que se genera
+        response.response = _compress_stream(response.iter_encoded(), _compressor(encoding, config))
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress(response.get_data(), encoding, config))
+
+    response.headers['Content-Encoding'] = encoding
+    _weaken_etag(response)
+    return response
+
+
+def _weaken_etag(response):
+    # Un ETag fuerte identifica bytes exactos: el cuerpo comprimido ya no lo es
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def init_compression(app):
+    """
+    Comprime las respuestas JSON, NDJSON, CSV y de texto con gzip (o brotli si
+    está instalado) según el Accept-Encoding del cliente.
+
+    Las respuestas menores a COMPRESSION_MIN_SIZE bytes se envían sin
+    comprimir; las de streaming (/export) se comprimen lote a lote. Se
+    registra después de las métricas para que estas midan los bytes
+    comprimidos.
+    """
+    if not app.config.get('COMPRESSION_ENABLED', True):
+        return
+    app.after_request(_compress_response)
+    logger.info('compression.enabled', extra={'fields': {
+        'encodings': list(available_encodings()),
+        'min_size': app.config.get('COMPRESSION_MIN_SIZE', 1024),
+        'gzip_level': app.config.get('COMPRESSION_LEVEL', 6),
+    }})
@@ -6,6 +6,57 @@ class Config:
     
     # ✅ CONFIGURACIÓN SQLITE - REEMPLAZA LA CONFIGURACIÓN DE SQL SERVER
     basedir = os.path.abspath(os.path.dirname(__file__))
-    SQLALCHEMY_DATABASE_URI = f'sqlite:///{os.path.join(basedir, "..", "data", "salarios.db")}'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
+        f'sqlite:///{os.path.abspath(os.path.join(basedir, "..", "data", "salarios.db"))}'
     
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Pool de conexiones: una por hilo del servidor más margen para picos
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 8)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 8)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    }
+
+    # Segundo engine SQLite en solo lectura (mode=ro) para GET y endpoints @read_only
+    DB_READ_ONLY_ENABLED = os.environ.get('DB_READ_ONLY_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    DB_READ_POOL_SIZE = int(os.environ.get('DB_READ_POOL_SIZE', 16))
+
+    # Perfil de rendimiento de SQLite aplicado a cada conexión (app/sqlite_tuning.py)
+    SQLITE_TUNING_ENABLED = os.environ.get('SQLITE_TUNING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    # Negativo = KiB (-65536 → 64 MB de caché de páginas por conexión)
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -65536))
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_TEMP_STORE = os.environ.get('SQLITE_TEMP_STORE', 'MEMORY')
+
+    # Motor analítico en memoria (NumPy) para /api/salaries/average-salary
+    SALARY_CUBE_ENABLED = os.environ.get('SALARY_CUBE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    # Segundos hasta reconstruir el cubo (los cambios de otros workers no lo parchean)
+    SALARY_CUBE_TTL = float(os.environ.get('SALARY_CUBE_TTL', 60))
+
+    # Responder los promedios desde la tabla resumen salary_rollups
+    SALARY_ROLLUPS_ENABLED = os.environ.get('SALARY_ROLLUPS_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+
+    # Nivel de los logs estructurados (DEBUG, INFO, WARNING, ...)
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+    # Métricas por endpoint expuestas en /api/metrics
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+    # Falla las peticiones que superan su presupuesto de consultas (@query_budget); siempre activo con TESTING
+    QUERY_BUDGET_ENABLED = os.environ.get('QUERY_BUDGET_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+
+    # Compresión gzip/brotli de respuestas según Accept-Encoding
+    COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))  # bytes; las menores se envían tal cual
+    COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL', 6))  # gzip, 1-9
+    COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))  # brotli, 0-11
+
+    # Segundos que /api/jobTitles/search reutiliza los conteos de salarios por título
+    JOB_TITLE_SEARCH_TTL = int(os.environ.get('JOB_TITLE_SEARCH_TTL', 300))
+
+    # Modo ASGI: segundos que se reutilizan las dimensiones antes de releerlas (las escribe otro proceso)
+    ASGI_DIMENSION_TTL = float(os.environ.get('ASGI_DIMENSION_TTL', 5))
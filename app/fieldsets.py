@@ -0,0 +1,79 @@
+# app/fieldsets.py
+import json
+from datetime import date, datetime
+
+from flask import Response, jsonify
+from sqlalchemy import select
+
+try:
+    import orjson
+except ImportError:  # opcional: sin orjson se usa json de la librería estándar
+    orjson = None
+
+from app import db
+
+
+class FieldSet:
+    """
+    Campos seleccionables con ?fields= en un endpoint de lista.
+
+    columns mapea el nombre público del campo a la columna que lo produce y
+    joins, para los campos que vienen de otra tabla, el (modelo, condición)
+    del LEFT JOIN que necesitan. Solo se seleccionan (y se unen) las columnas
+    pedidas, y las filas se devuelven como tuplas, sin instanciar el ORM.
+    """
+
+    def __init__(self, model, columns, joins=None):
+        self.model = model
+        self.columns = columns
+        self.joins = joins or {}
+
+    def parse(self, value):
+        """Lista de campos de ?fields=a,b,c (sin repetir); lanza ValueError si alguno no existe."""
+        names = list(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+        if not names:
+            raise ValueError(f'El parámetro fields está vacío. Campos disponibles: {list(self.columns)}')
+        unknown = [name for name in names if name not in self.columns]
+        if unknown:
+            raise ValueError(f'Campos no soportados: {unknown}. Campos disponibles: {list(self.columns)}')
+        return names
+
+    def select(self, names):
+        """SELECT solo de las columnas pedidas, con los JOIN que esas columnas requieren."""
+        statement = select(*(self.columns[name].label(name) for name in names)).select_from(self.model)
+        for name in names:
+            if name in self.joins:
+                statement = statement.outerjoin(*self.joins[name])
+        return statement
+
+
+def rows_to_dicts(rows, names):
+    """Convierte tuplas en dicts con los nombres pedidos (columnas extra al final se ignoran)."""
+    return [dict(zip(names, row)) for row in rows]
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Tipo no serializable: {type(value).__name__}')
+
+
+def dumps(payload):
+    """JSON en bytes con orjson si está instalado; las fechas salen en ISO 8601 igual que to_dict()."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+
+def list_response(fieldset, value):
+    """Respuesta completa de un endpoint de lista con ?fields=value (400 si algún campo no existe)."""
+    try:
+        names = fieldset.parse(value)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    rows = db.session.execute(fieldset.select(names)).all()
+    return json_response(rows_to_dicts(rows, names))
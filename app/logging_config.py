@@ -0,0 +1,42 @@
+# app/logging_config.py
+import json
+import logging
+import time
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada registro como una línea JSON: evento, nivel, logger y los
+    campos estructurados pasados en extra={'fields': {...}}. Un campo con el
+    nombre de una clave propia (ts, level, logger, event, exception) no la
+    pisa: se escribe como field_<nombre>.
+    """
+
+    RESERVED_KEYS = ('ts', 'level', 'logger', 'event', 'exception')
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            for key, value in fields.items():
+                entry[f'field_{key}' if key in self.RESERVED_KEYS else key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(app):
+    """Configura el logger del paquete app con el nivel de LOG_LEVEL y salida JSON."""
+    logger = logging.getLogger('app')
+    logger.setLevel(app.config.get('LOG_LEVEL', 'INFO'))
+    if not any(getattr(h, '_app_json_handler', False) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        handler._app_json_handler = True
+        logger.addHandler(handler)
+    logger.propagate = False
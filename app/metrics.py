@@ -0,0 +1,179 @@
+# app/metrics.py
+import threading
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Límites superiores (en segundos) de los buckets del histograma de latencia
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointStats:
+    """Acumuladores de un endpoint: histograma de latencia, SQL, filas y bytes."""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.duration_sum = 0.0
+        self.count = 0
+        self.statements = 0
+        self.rows = 0
+        self.response_bytes = 0
+        self.status_counts = {}
+
+
+class MetricsRegistry:
+    """Registro de métricas por endpoint de blueprint, seguro entre hilos."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def observe(self, endpoint, method, status, duration, statements, rows, response_bytes):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, EndpointStats())
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    stats.bucket_counts[i] += 1
+                    break
+            stats.duration_sum += duration
+            stats.count += 1
+            stats.statements += statements
+            stats.rows += rows
+            stats.response_bytes += response_bytes
+            key = (method, status)
+            stats.status_counts[key] = stats.status_counts.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def render_prometheus(self):
+        """Devuelve todas las métricas en el formato de texto de Prometheus."""
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            lines = [
+                '# HELP http_request_duration_seconds Latencia de las peticiones por endpoint.',
+                '# TYPE http_request_duration_seconds histogram',
+            ]
+            for endpoint, stats in items:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {stats.count}')
+                lines.append(f'http_request_duration_seconds_sum{{endpoint="{endpoint}"}} {stats.duration_sum:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{endpoint="{endpoint}"}} {stats.count}')
+
+            lines += ['# HELP http_requests_total Peticiones por endpoint, método y estado.',
+                      '# TYPE http_requests_total counter']
+            for endpoint, stats in items:
+                for (method, status), count in sorted(stats.status_counts.items()):
+                    lines.append(f'http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+            for name, attr, help_text in (
+                ('db_statements_total', 'statements', 'Sentencias SQL ejecutadas por endpoint.'),
+                ('db_rows_fetched_total', 'rows', 'Filas ORM leídas por endpoint.'),
+                ('http_response_bytes_total', 'response_bytes', 'Bytes de respuesta por endpoint.'),
+            ):
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+                for endpoint, stats in items:
+                    lines.append(f'{name}{{endpoint="{endpoint}"}} {getattr(stats, attr)}')
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+
+
+def _request_state():
+    """Devuelve el estado de métricas de la petición actual, o None fuera de una petición."""
+    if not has_request_context():
+        return None
+    return g.get('_metrics')
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    state = _request_state()
+    if state is not None:
+        state['statements'] += 1
+
+
+def _count_rows(orm_execute_state):
+    state = _request_state()
+    if state is None or not orm_execute_state.is_select:
+        return None
+    options = orm_execute_state.execution_options
+    # Las consultas en streaming (export) no se materializan para contarlas
+    if options.get('yield_per') or options.get('stream_results'):
+        return None
+    frozen = orm_execute_state.invoke_statement().freeze()
+    state['rows'] += len(frozen.data)
+    return frozen()
+
+
+def _start_request():
+    g._metrics = {'start': time.perf_counter(), 'statements': 0, 'rows': 0}
+
+
+def add_rows(count):
+    """
+    Suma filas leídas a la petición actual. Lo usan las consultas en streaming
+    (export), que _count_rows no puede contar sin materializarlas.
+    """
+    state = _request_state()
+    if state is not None:
+        state['rows'] += count
+
+
+def _count_bytes(chunks, state):
+    for chunk in chunks:
+        state['response_bytes'] += len(chunk)
+        yield chunk
+
+
+def _observe(endpoint, method, status, state):
+    metrics.observe(
+        endpoint=endpoint,
+        method=method,
+        status=status,
+        duration=time.perf_counter() - state['start'],
+        statements=state['statements'],
+        rows=state['rows'],
+        response_bytes=state['response_bytes'],
+    )
+
+
+def _record_request(response):
+    state = g.get('_metrics')
+    if state is None:
+        return response
+    endpoint, method = request.endpoint or 'unmatched', request.method
+    if response.is_streamed:
+        # Se registra al cerrar la respuesta, con los bytes enviados y las
+        # filas y sentencias de todo el stream (el generador sigue usando g)
+        state['response_bytes'] = 0
+        response.response = _count_bytes(response.iter_encoded(), state)
+        response.call_on_close(lambda: _observe(endpoint, method, response.status_code, state))
+        return response
+    g.pop('_metrics')
+    state['response_bytes'] = response.content_length or 0
+    _observe(endpoint, method, response.status_code, state)
+    return response
+
+
+def init_metrics(app):
+    """
+    Activa la instrumentación: tiempos por petición con before/after_request y
+    conteo de SQL y filas con eventos de SQLAlchemy. Las respuestas en
+    streaming se miden hasta que terminan de enviarse.
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    if not event.contains(Engine, 'before_cursor_execute', _count_statement):
+        event.listen(Engine, 'before_cursor_execute', _count_statement)
+        event.listen(Session, 'do_orm_execute', _count_rows)
+    app.before_request(_start_request)
+    app.after_request(_record_request)
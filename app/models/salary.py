@@ -1,4 +1,10 @@
+from sqlalchemy import select
+
 from app import db
+from app.models.employmentType import EmploymentType
+from app.models.experienceLevel import ExperienceLevel
+from app.models.jobTitle import JobTitle
+from app.models.location import Location
 
 class Salary(db.Model):
     __tablename__ = 'salaries'
@@ -11,12 +17,75 @@ class Salary(db.Model):
     experience_level = db.Column(db.Integer, db.ForeignKey('experience_levels.id'))
     created_date = db.Column(db.DateTime)
     updated_date = db.Column(db.DateTime)
+    # Posición de la fila en el archivo en la última importación y hash de
+    # su contenido normalizado (la clave del seed incremental)
+    source_row = db.Column(db.Integer)
+    source_hash = db.Column(db.String(16))
 
     employment_type_ref = db.relationship('EmploymentType', backref='salaries', lazy=True)
     job_title_type_ref = db.relationship('JobTitle', backref='salaries', lazy=True)
     location_type_ref = db.relationship('Location', backref='salaries', lazy=True)
     experience_level_type_ref = db.relationship('ExperienceLevel', backref='salaries', lazy=True)
 
+    # Índices según los filtros reales de /average-salary, /distribution, el batch
+    # y los rollups; todos incluyen salary_in_usd para que las agregaciones se
+    # resuelvan solo con el índice (covering), sin leer la tabla.
+    __table_args__ = (
+        db.Index('ix_salaries_group', 'job_title', 'location', 'experience_level',
+                 'employment_type', 'year', 'salary_in_usd'),
+        db.Index('ix_salaries_location_level', 'location', 'experience_level', 'salary_in_usd'),
+        db.Index('ix_salaries_level_salary', 'experience_level', 'salary_in_usd'),
+    )
+
+    @classmethod
+    def _dimension_columns(cls):
+        return (
+            cls.id,
+            cls.year,
+            cls.salary_in_usd,
+            EmploymentType.employment_type.label('employment_type'),
+            JobTitle.job_title.label('job_title'),
+            Location.location.label('location'),
+            ExperienceLevel.experience_level.label('experience_level'),
+            cls.created_date,
+            cls.updated_date,
+        )
+
+    @classmethod
+    def _join_dimensions(cls, query):
+        return query.outerjoin(EmploymentType, cls.employment_type == EmploymentType.id) \
+                    .outerjoin(JobTitle, cls.job_title == JobTitle.id) \
+                    .outerjoin(Location, cls.location == Location.id) \
+                    .outerjoin(ExperienceLevel, cls.experience_level == ExperienceLevel.id)
+
+    @classmethod
+    def query_with_dimensions(cls):
+        """
+        Devuelve una consulta de tuplas con los nombres de las dimensiones
+        ya resueltos mediante LEFT JOIN (una sola consulta, sin cargas lazy).
+        """
+        return cls._join_dimensions(db.session.query(*cls._dimension_columns()))
+
+    @classmethod
+    def select_with_dimensions(cls):
+        """La misma consulta que query_with_dimensions() como select() (sirve también con AsyncSession)."""
+        return cls._join_dimensions(select(*cls._dimension_columns()).select_from(cls))
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serializa una fila de query_with_dimensions() con el mismo formato que to_dict()."""
+        return {
+            'id': row.id,
+            'year': row.year,
+            'salary_in_usd': row.salary_in_usd,
+            'employment_type': row.employment_type,
+            'job_title': row.job_title,
+            'location': row.location,
+            'experience_level': row.experience_level,
+            'created_date': row.created_date.isoformat() if row.created_date else None,
+            'updated_date': row.updated_date.isoformat() if row.updated_date else None
+        }
+
     def to_dict(self):
         employment_type = self.employment_type_ref.employment_type if self.employment_type_ref else None
         job_title = self.job_title_type_ref.job_title if self.job_title_type_ref else None
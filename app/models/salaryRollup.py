@@ -0,0 +1,34 @@
+from app import db
+
+class SalaryRollup(db.Model):
+    __tablename__ = 'salary_rollups'
+    id = db.Column(db.Integer, primary_key=True)
+    job_title = db.Column(db.Integer, db.ForeignKey('job_titles.id'))
+    location = db.Column(db.Integer, db.ForeignKey('locations.id'))
+    experience_level = db.Column(db.Integer, db.ForeignKey('experience_levels.id'))
+    employment_type = db.Column(db.Integer, db.ForeignKey('employment_types.id'))
+    year = db.Column(db.String(100))
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+    salary_count = db.Column(db.Integer, nullable=False, default=0)
+    salary_sum = db.Column(db.Integer, nullable=False, default=0)
+    salary_min = db.Column(db.Integer)
+    salary_max = db.Column(db.Integer)
+
+    __table_args__ = (
+        db.UniqueConstraint('job_title', 'location', 'experience_level', 'employment_type', 'year',
+                            name='uq_salary_rollups_group'),
+    )
+
+    def to_dict(self):
+        return {
+            'job_title': self.job_title,
+            'location': self.location,
+            'experience_level': self.experience_level,
+            'employment_type': self.employment_type,
+            'year': self.year,
+            'row_count': self.row_count,
+            'salary_count': self.salary_count,
+            'salary_sum': self.salary_sum,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max
+        }
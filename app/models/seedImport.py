@@ -0,0 +1,24 @@
+from app import db
+
+class SeedImport(db.Model):
+    __tablename__ = 'seed_imports'
+    id = db.Column(db.Integer, primary_key=True)
+    source_path = db.Column(db.String(255), nullable=False, index=True)
+    file_hash = db.Column(db.String(64), nullable=False)
+    row_count = db.Column(db.Integer)
+    inserted = db.Column(db.Integer)
+    updated = db.Column(db.Integer)
+    deleted = db.Column(db.Integer)
+    imported_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'source_path': self.source_path,
+            'file_hash': self.file_hash,
+            'row_count': self.row_count,
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'deleted': self.deleted,
+            'imported_at': self.imported_at.isoformat() if self.imported_at else None
+        }
@@ -0,0 +1,69 @@
+# app/query_budget.py
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Una petición ejecutó más sentencias SQL que las declaradas para su endpoint."""
+
+    def __init__(self, endpoint, budget, statements):
+        self.endpoint = endpoint
+        self.budget = budget
+        self.statements = statements
+        listing = '\n'.join(f'  {i}. {sql}' for i, sql in enumerate(statements, start=1))
+        super().__init__(
+            f'{endpoint} ejecutó {len(statements)} consultas (presupuesto: {budget}):\n{listing}'
+        )
+
+
+def query_budget(max_queries):
+    """
+    Declara el máximo de sentencias SQL que puede ejecutar un endpoint.
+
+    Se coloca debajo del decorador de la ruta:
+
+        @salary_bp.route('/', methods=['GET'])
+        @query_budget(2)
+        def get_salaries(): ...
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+def _log_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        log = g.get('_query_budget_log')
+        if log is not None:
+            log.append(statement)
+
+
+def _start_request():
+    g._query_budget_log = []
+
+
+def _check_budget(response):
+    statements = g.pop('_query_budget_log', None)
+    if statements is None or request.endpoint is None:
+        return response
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, 'query_budget', None)
+    if budget is not None and len(statements) > budget:
+        raise QueryBudgetExceeded(request.endpoint, budget, statements)
+    return response
+
+
+def init_query_budget(app):
+    """
+    Activa el control de presupuesto de consultas (pensado para tests y
+    desarrollo). Cada petición cuenta sus sentencias con un evento del engine y,
+    si supera el presupuesto de su endpoint, lanza QueryBudgetExceeded con la
+    lista de sentencias. Las respuestas en streaming solo cuentan las
+    consultas hechas antes de empezar a enviar el cuerpo.
+    """
+    if not event.contains(Engine, 'before_cursor_execute', _log_statement):
+        event.listen(Engine, 'before_cursor_execute', _log_statement)
+    app.before_request(_start_request)
+    app.after_request(_check_budget)
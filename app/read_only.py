@@ -0,0 +1,79 @@
+# app/read_only.py
+import logging
+import os
+from urllib.parse import quote
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from app.sqlite_tuning import init_sqlite_tuning
+
+logger = logging.getLogger(__name__)
+
+# Métodos HTTP que siempre se atienden con el engine de solo lectura
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+
+def read_only(view):
+    """
+    Marca un endpoint que no escribe (p. ej. un POST analítico) para que sus
+    consultas usen el engine de solo lectura. Se coloca debajo de la ruta:
+
+        @salary_bp.route('/average-salary', methods=['POST'])
+        @read_only
+        def get_average_salary(): ...
+    """
+    view.read_only = True
+    return view
+
+
+class RoutingSession(Session):
+    """
+    Session que envía las consultas de las peticiones de lectura al engine de
+    solo lectura. Los flush y todo lo que ocurre fuera de una petición de
+    lectura (POST/PUT/DELETE, CLI, seed) siguen usando el engine principal.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_request_context() and g.get('db_read_only'):
+            engine = current_app.extensions.get('sqlalchemy_read_only')
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_only_url(database):
+    """URL SQLAlchemy que abre el mismo archivo SQLite con mode=ro."""
+    return f'sqlite:///file:{quote(os.path.abspath(database))}?mode=ro&uri=true'
+
+
+def _mark_request():
+    view = current_app.view_functions.get(request.endpoint)
+    g.db_read_only = request.method in READ_ONLY_METHODS or getattr(view, 'read_only', False)
+
+
+def init_read_only(app):
+    """
+    Crea un segundo engine (con su propio pool) que abre la base SQLite en
+    modo solo lectura (mode=ro + PRAGMA query_only) y enruta hacia él las
+    peticiones GET/HEAD y los endpoints marcados con @read_only.
+
+    Solo aplica a bases SQLite en archivo; con otras bases no hace nada.
+    """
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    if (not app.config.get('DB_READ_ONLY_ENABLED', True) or url.get_backend_name() != 'sqlite'
+            or url.database in (None, '', ':memory:')):
+        return None
+
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    options['pool_size'] = app.config.get('DB_READ_POOL_SIZE', options.get('pool_size', 5))
+    engine = create_engine(read_only_url(url.database), **options)
+    init_sqlite_tuning(app, engine, read_only=True)
+
+    app.extensions['sqlalchemy_read_only'] = engine
+    app.before_request(_mark_request)
+    logger.info('database.read_only', extra={'fields': {'pool_size': options['pool_size']}})
+    return engine
+
@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify
 from app import db
 from app.models.employmentType import EmploymentType
+from app.query_budget import query_budget
 
 employment_type_bp = Blueprint('employment_type_bp', __name__)
 
 @employment_type_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_employment_types():
     employment_type = EmploymentType.query.all()
     return jsonify([u.to_dict() for u in employment_type])
@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify
 from app import db
 from app.models.experienceLevel import ExperienceLevel
+from app.query_budget import query_budget
 
 experience_level_bp = Blueprint('experience_level_bp', __name__)
 
 @experience_level_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_experience_levels():
     experience_level = ExperienceLevel.query.all()
     return jsonify([u.to_dict() for u in experience_level])
@@ -1,19 +1,49 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from app import db
 from app.models.jobTitle import JobTitle
+from app.services.dimension_registry import dimension_registry
+from app.services.job_title_search import job_title_index, parse_search
+from app.fieldsets import FieldSet, list_response
+from app.query_budget import query_budget
 
 job_title_bp = Blueprint('job_title_bp', __name__)
 
+JOB_TITLE_FIELDS = FieldSet(JobTitle, {'id': JobTitle.id, 'job_title': JobTitle.job_title})
+
 
 @job_title_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_job_titles():
-    """Obtiene y devuelve todos los títulos de trabajo."""
+    """Obtiene y devuelve todos los títulos de trabajo (?fields= para elegir campos)."""
     try:
+        if 'fields' in request.args:
+            return list_response(JOB_TITLE_FIELDS, request.args['fields'])
         job_titles = JobTitle.query.all()
         return jsonify([jt.to_dict() for jt in job_titles]), 200
     except Exception as e:
         return jsonify({'message': 'Error al obtener títulos de trabajo', 'error': str(e)}), 500
 
+@job_title_bp.route('/search', methods=['GET'])
+@query_budget(2)
+def search_job_titles():
+    """
+    Autocompletado de títulos: ?q=texto&limit=10.
+
+    Busca por prefijo de cualquier palabra del título o de sus alias
+    (ML Engineer -> Machine Learning Engineer) en un índice en memoria y
+    ordena por cantidad de salarios; solo consulta la base al reconstruirlo.
+    """
+    try:
+        q, limit = parse_search(request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    try:
+        results = job_title_index.search(q, limit, ttl=current_app.config.get('JOB_TITLE_SEARCH_TTL', 300))
+        return jsonify({'query': q, 'results': results}), 200
+    except Exception as e:
+        return jsonify({'message': 'Error al buscar títulos de trabajo', 'error': str(e)}), 500
+
 @job_title_bp.route('/<int:id>', methods=['GET'])
 def get_job_title(id):
     """Obtiene y devuelve un título de trabajo por su ID."""
@@ -38,6 +68,7 @@ def create_job_title():
         
         db.session.add(new_job_title)
         db.session.commit()
+        dimension_registry.invalidate('job_title')
         return jsonify(new_job_title.to_dict()), 201 
     
     except Exception as e:
@@ -57,6 +88,7 @@ def update_job_title(id):
             return jsonify({'message': 'Se requiere el campo job_title para la actualización'}), 400
 
         db.session.commit()
+        dimension_registry.invalidate('job_title')
         return jsonify(job_title.to_dict()), 200 # 200 OK
         
     except Exception as e:
@@ -71,6 +103,7 @@ def delete_job_title(id):
     try:
         db.session.delete(job_title)
         db.session.commit()
+        dimension_registry.invalidate('job_title')
         return jsonify({'message': 'Título de trabajo eliminado exitosamente'}), 204
         
     except Exception as e:
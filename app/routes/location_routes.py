@@ -1,11 +1,18 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from app import db
 from app.models.location import Location
+from app.fieldsets import FieldSet, list_response
+from app.query_budget import query_budget
 
 location_bp = Blueprint('location_bp', __name__)
 
+LOCATION_FIELDS = FieldSet(Location, {'id': Location.id, 'location': Location.location})
+
 @location_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_locations():
+    if 'fields' in request.args:
+        return list_response(LOCATION_FIELDS, request.args['fields'])
     location = Location.query.all()
     return jsonify([u.to_dict() for u in location])
 
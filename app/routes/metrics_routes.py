@@ -0,0 +1,9 @@
+from flask import Blueprint, Response
+from app.metrics import metrics
+
+metrics_bp = Blueprint('metrics_bp', __name__)
+
+@metrics_bp.route('', methods=['GET'])
+def get_metrics():
+    """Devuelve las métricas por endpoint en formato de texto de Prometheus."""
+    return Response(metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify
 from app import db
 from app.models.role import Role
+from app.query_budget import query_budget
 
 role_bp = Blueprint('role_bp', __name__)
 
 @role_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_roles():
     role = Role.query.all()
     return jsonify([u.to_dict() for u in role])
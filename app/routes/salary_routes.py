@@ -1,30 +1,154 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context, current_app
 from app import db
-from app.models.salary import Salary
-from app.models.jobTitle import JobTitle
-from app.models.location import Location  
+from app.models.employmentType import EmploymentType
 from app.models.experienceLevel import ExperienceLevel
+from app.models.jobTitle import JobTitle
+from app.models.location import Location
+from app.models.salary import Salary
+from app.services.salary_cube import salary_cube
+from app.services import salary_rollups, salary_distribution, salary_batch, salary_bulk, salary_analytics
+from app import fieldsets
+from app.fieldsets import FieldSet
+from app.metrics import add_rows
+from app.query_budget import query_budget
+from app.read_only import read_only
 from datetime import datetime
-from sqlalchemy import func
+import csv
+import io
+import json
+import logging
 
 salary_bp = Blueprint('salary_bp', __name__)
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ['id', 'year', 'salary_in_usd', 'employment_type', 'job_title',
+                  'location', 'experience_level', 'created_date', 'updated_date']
+
+# Campos de ?fields= (los mismos nombres que Salary.row_to_dict()); las
+# dimensiones solo hacen JOIN si se piden
+SALARY_FIELDS = FieldSet(Salary, {
+    'id': Salary.id,
+    'year': Salary.year,
+    'salary_in_usd': Salary.salary_in_usd,
+    'employment_type': EmploymentType.employment_type,
+    'job_title': JobTitle.job_title,
+    'location': Location.location,
+    'experience_level': ExperienceLevel.experience_level,
+    'created_date': Salary.created_date,
+    'updated_date': Salary.updated_date,
+}, joins={
+    'employment_type': (EmploymentType, Salary.employment_type == EmploymentType.id),
+    'job_title': (JobTitle, Salary.job_title == JobTitle.id),
+    'location': (Location, Salary.location == Location.id),
+    'experience_level': (ExperienceLevel, Salary.experience_level == ExperienceLevel.id),
+})
+
+def _get_salaries_fields():
+    """Lista o página de salarios (?fields=) seleccionando solo las columnas pedidas."""
+    try:
+        names = SALARY_FIELDS.parse(request.args['fields'])
+        statement, payload = salary_analytics.fields_query(SALARY_FIELDS, names, request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    return fieldsets.json_response(payload(db.session.execute(statement).all()))
 
 @salary_bp.route('/', methods=['GET'])
+@query_budget(2)
 def get_salaries():
-    """Obtiene y devuelve todos los registros de salarios."""
+    """
+    Obtiene y devuelve los registros de salarios.
+
+    Sin parámetros devuelve la lista completa. Con ?after_id=&limit= devuelve
+    una página por cursor (keyset sobre id) junto con next_cursor, que es null
+    cuando ya no quedan más registros. Con ?fields=id,salary_in_usd,... solo se
+    seleccionan y devuelven esos campos.
+    """
     try:
-        salaries = Salary.query.all()
-        return jsonify([s.to_dict() for s in salaries]), 200
+        if 'fields' in request.args:
+            return _get_salaries_fields()
+
+        query = Salary.query_with_dimensions()
+
+        if 'after_id' not in request.args and 'limit' not in request.args:
+            return jsonify([Salary.row_to_dict(r) for r in query.order_by(Salary.id).all()]), 200
+
+        try:
+            after_id, limit = salary_analytics.parse_page(request.args)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        # Se pide una fila extra para saber si existe una página siguiente
+        rows = query.filter(Salary.id > after_id).order_by(Salary.id).limit(limit + 1).all()
+        return jsonify(salary_analytics.page_payload(rows, limit, Salary.row_to_dict)), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'message': 'Error al obtener salarios', 'error': str(e)}), 500
 
+@salary_bp.route('/export', methods=['GET'])
+def export_salaries():
+    """
+    Exporta todos los salarios en streaming (?format=ndjson|csv).
+
+    Las filas se leen con un cursor del servidor en lotes de EXPORT_BATCH_SIZE
+    y se escriben a medida que llegan, así la memoria no crece con el tamaño
+    de la tabla y el primer byte sale sin esperar a serializar todo.
+    """
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'message': 'Formato no soportado, usa ndjson o csv'}), 400
+
+    query = Salary.query_with_dimensions() \
+        .order_by(Salary.id) \
+        .execution_options(stream_results=True) \
+        .yield_per(EXPORT_BATCH_SIZE)
+
+    def generate_ndjson():
+        batch = []
+        for row in query:
+            batch.append(json.dumps(Salary.row_to_dict(row), ensure_ascii=False))
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                add_rows(len(batch))
+                yield '\n'.join(batch) + '\n'
+                batch = []
+        if batch:
+            add_rows(len(batch))
+            yield '\n'.join(batch) + '\n'
+
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        i = 0
+        for i, row in enumerate(query, start=1):
+            data = Salary.row_to_dict(row)
+            writer.writerow([data[col] for col in EXPORT_COLUMNS])
+            if i % EXPORT_BATCH_SIZE == 0:
+                add_rows(EXPORT_BATCH_SIZE)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        add_rows(i % EXPORT_BATCH_SIZE)
+        yield buffer.getvalue()
+
+    if export_format == 'csv':
+        generator, mimetype = generate_csv(), 'text/csv'
+    else:
+        generator, mimetype = generate_ndjson(), 'application/x-ndjson'
+
+    return Response(
+        stream_with_context(generator),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=salaries.{export_format}'}
+    )
+
 @salary_bp.route('/', methods=['POST'])
 def create_salary():
     """Crea un nuevo registro de salario con los datos del formulario Angular."""
     data = request.get_json()
     
-    print("Datos recibidos:", data)
+    logger.debug('create_salary.request', extra={'fields': {'data': data}})
     
     required_fields = ['area', 'location', 'position', 'experienceLevel', 'salary']
     missing_fields = [field for field in required_fields if field not in data or not data[field]]
@@ -36,6 +160,7 @@ def create_salary():
         }), 400
 
     try:
+        rollups = salary_rollups.ensure_current()
         new_salary = Salary(
             year=datetime.now().year,
             salary_in_usd=data['salary'],
@@ -48,7 +173,10 @@ def create_salary():
         )
         
         db.session.add(new_salary)
+        if rollups:
+            salary_rollups.apply_insert(salary_rollups.snapshot(new_salary))
         db.session.commit()
+        salary_cube.apply_upsert(new_salary)
         
         return jsonify({
             'message': 'Salario creado exitosamente',
@@ -62,35 +190,119 @@ def create_salary():
             'error': str(e)
         }), 500
 
+@salary_bp.route('/bulk', methods=['POST'])
+def create_salaries_bulk():
+    """
+    Crea muchos salarios en una sola transacción.
+
+    Acepta un arreglo de filas (o {"rows": [...]}) con los mismos campos que
+    POST /api/salaries; las dimensiones pueden enviarse por nombre o por id.
+    Todas las filas se validan antes de escribir y las inválidas se devuelven
+    en errors sin impedir que se inserten las demás.
+    """
+    data = request.get_json(silent=True)
+    rows = data.get('rows') if isinstance(data, dict) else data
+
+    try:
+        values, errors = salary_bulk.validate_rows(rows)
+    except salary_bulk.BulkError as e:
+        return jsonify({'message': str(e)}), 400
+
+    if not values:
+        return jsonify({'message': 'Ninguna fila es válida', 'inserted': 0, 'errors': errors}), 400
+
+    try:
+        salary_bulk.insert_rows(values, refresh_rollups=salary_rollups.ensure_current())
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': 'Error al crear salarios', 'error': str(e)}), 500
+
+    # Las filas nuevas no pasan por el ORM: el cubo se recarga en la próxima consulta
+    salary_cube.invalidate()
+    logger.info('salaries.bulk_insert', extra={'fields': {'inserted': len(values), 'rejected': len(errors)}})
+
+    return jsonify({
+        'message': 'Salarios creados exitosamente',
+        'inserted': len(values),
+        'errors': errors
+    }), 201
+
+@salary_bp.route('/', methods=['PATCH'])
+def update_salaries_bulk():
+    """
+    Actualiza en bloque los salarios seleccionados por ids o por filtro.
+
+    Body: {"ids": [...]} y/o {"filter": {"jobTitle", "location", "experienceLevel",
+    "employmentType", "year", "createdFrom", "createdTo"}} más {"set": {...}} con
+    jobTitle, location, experienceLevel, employmentType, year o salary.
+    Se ejecuta como un único UPDATE en una transacción.
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        conditions = salary_bulk.build_selection(data)
+        values = salary_bulk.parse_changes(data.get('set'))
+    except salary_bulk.BulkError as e:
+        return jsonify({'message': str(e)}), 400
+
+    try:
+        affected = salary_bulk.update_rows(conditions, values, refresh_rollups=salary_rollups.ensure_current())
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': 'Error al actualizar salarios', 'error': str(e)}), 500
+
+    salary_cube.invalidate()
+    logger.info('salaries.bulk_update', extra={'fields': {'affected': affected, 'columns': sorted(values)}})
+
+    return jsonify({'message': 'Salarios actualizados exitosamente', 'affected': affected}), 200
+
+@salary_bp.route('/', methods=['DELETE'])
+def delete_salaries_bulk():
+    """
+    Elimina en bloque los salarios seleccionados por ids o por filtro (mismo
+    formato que el PATCH masivo), con un único DELETE en una transacción.
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        conditions = salary_bulk.build_selection(data)
+    except salary_bulk.BulkError as e:
+        return jsonify({'message': str(e)}), 400
+
+    try:
+        affected = salary_bulk.delete_rows(conditions, refresh_rollups=salary_rollups.ensure_current())
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': 'Error al eliminar salarios', 'error': str(e)}), 500
+
+    salary_cube.invalidate()
+    logger.info('salaries.bulk_delete', extra={'fields': {'affected': affected}})
+
+    return jsonify({'message': 'Salarios eliminados exitosamente', 'affected': affected}), 200
+
 @salary_bp.route('/filters', methods=['GET'])
+@query_budget(3)
 def get_filter_options():
-    """Devuelve las opciones de filtro desde la base de datos."""
+    """
+    Devuelve las opciones de filtro desde la base de datos.
+
+    La respuesta se guarda en memoria junto con la versión del registro de
+    dimensiones y solo se reconstruye cuando alguna dimensión cambia. Lleva un
+    ETag fuerte, así que If-None-Match con el mismo valor recibe 304.
+    """
     try:
-        print("🔄 Obteniendo filtros desde la base de datos...")
-        
-        job_titles = JobTitle.query.all()
-        locations = Location.query.all()
-        experience_levels = ExperienceLevel.query.all()
-        
-        areas = [job.job_title for job in job_titles if job.job_title]
-        locations_list = [loc.location for loc in locations if loc.location]
-        exp_levels = [exp.experience_level for exp in experience_levels if exp.experience_level]
-        
-        print(f"📊 Filtros obtenidos: {len(areas)} áreas, {len(locations_list)} ubicaciones, {len(exp_levels)} niveles")
-        
-        filter_options = {
-            "areas": areas,
-            "locations": locations_list,
-            "positions": areas,
-            "experienceLevels": exp_levels
-        }
-        
-        return jsonify(filter_options), 200
+        body, etag = salary_analytics.filter_options()
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'public, no-cache'
+        return response.make_conditional(request)
     
     except Exception as e:
-        print(f"❌ Error obteniendo filtros: {str(e)}")
+        logger.exception('filters.error')
         try:
-            print("🔄 Intentando fallback con tabla salaries...")
             from sqlalchemy import distinct
             job_titles = db.session.query(distinct(Salary.job_title)).all()
             locations = db.session.query(distinct(Salary.location)).all()
@@ -108,225 +320,100 @@ def get_filter_options():
             }
             return jsonify(filter_options), 200
         except Exception as fallback_error:
-            print(f"❌ Fallback también falló: {fallback_error}")
+            logger.error('filters.fallback_error', extra={'fields': {'error': str(fallback_error)}})
             return jsonify({'message': 'Error al obtener filtros', 'error': str(e)}), 500
 
 # ✅ ENDPOINT CORREGIDO: Calcular salario promedio
 @salary_bp.route('/average-salary', methods=['POST'])
+@read_only
 def get_average_salary():
     """Calcula el salario promedio basado en los filtros seleccionados."""
     try:
         data = request.get_json()
-        print(f"📥 Datos recibidos para cálculo de promedio: {data}")
-        
-        area_text = data.get('area')
-        location_text = data.get('location')
-        experience_level_text = data.get('experienceLevel')
-        
-        print(f"🔍 Filtros extraídos - Area: '{area_text}', Location: '{location_text}', Experience: '{experience_level_text}'")
-        
-        # ✅ MAPEAR job_title de texto a número (ID)
-        # Primero obtenemos todos los job_titles de la tabla JobTitle
-        job_titles_from_table = JobTitle.query.all()
-        job_title_map = {job.job_title: job.id for job in job_titles_from_table}
-        print(f"🔍 Mapa de Job Titles: {job_title_map}")
-        
-        area_id = None
-        if area_text:
-            area_id = job_title_map.get(area_text)
-            print(f"🔍 Job Title mapeado: '{area_text}' -> {area_id}")
-        
-        # ✅ MAPEAR location de texto a número (ID)
-        locations_from_table = Location.query.all()
-        location_map = {loc.location: loc.id for loc in locations_from_table}
-        print(f"🔍 Mapa de Locations: {location_map}")
-        
-        location_id = None
-        if location_text:
-            location_id = location_map.get(location_text)
-            print(f"🔍 Location mapeada: '{location_text}' -> {location_id}")
-        
-        # ✅ MAPEAR experience level de texto a número
-        experience_level_map = {
-            'Junior': 1,
-            'Semi-Senior': 2, 
-            'Senior': 3,
-            'Executive': 4
-        }
-        
-        experience_level_number = None
-        if experience_level_text:
-            experience_level_number = experience_level_map.get(experience_level_text)
-            print(f"🔍 Experience Level mapeado: '{experience_level_text}' -> {experience_level_number}")
-        
-        # DEBUG: Ver qué valores únicos existen en la BD
-        print("🔍 VALORES ÚNICOS EN LA BASE DE DATOS:")
-        
-        # Ver job_titles únicos en Salary (son IDs)
-        job_titles_in_salary = db.session.query(Salary.job_title).distinct().all()
-        job_titles_list = [title[0] for title in job_titles_in_salary if title[0]]
-        print(f"   Job Titles en Salary (IDs): {job_titles_list[:10]}")
-        
-        # Ver locations únicas en Salary (son IDs)
-        locations_in_salary = db.session.query(Salary.location).distinct().all()
-        locations_list = [loc[0] for loc in locations_in_salary if loc[0]]
-        print(f"   Locations en Salary (IDs): {locations_list[:10]}")
-        
-        # Ver experience levels únicos
-        exp_levels = db.session.query(Salary.experience_level).distinct().all()
-        exp_levels_list = [level[0] for level in exp_levels if level[0]]
-        print(f"   Experience Levels: {exp_levels_list}")
-        
-        # Construir la consulta
-        query = db.session.query(
-            func.avg(Salary.salary_in_usd).label('average_salary'),
-            func.count(Salary.id).label('sample_size')
-        )
-        
-        # Aplicar filtros si se proporcionaron (usando IDs)
-        conditions_applied = []
-        if area_id:
-            query = query.filter(Salary.job_title == area_id)
-            conditions_applied.append(f"job_title = {area_id}")
-        if location_id:
-            query = query.filter(Salary.location == location_id)
-            conditions_applied.append(f"location = {location_id}")
-        if experience_level_number:
-            query = query.filter(Salary.experience_level == experience_level_number)
-            conditions_applied.append(f"experience_level = {experience_level_number}")
         
-        print(f"🔍 Condiciones aplicadas: {conditions_applied}")
+        # ✅ MAPEAR nombres a IDs con el registro de dimensiones (cargado una vez por proceso)
+        filters, requested = salary_analytics.resolve_filters(data)
+        logger.debug('average_salary.filters', extra={'fields': {**requested, 'resolved': filters}})
+
+        if current_app.config.get('SALARY_CUBE_ENABLED'):
+            # ✅ Respuesta desde el cubo en memoria (sin consulta SQL)
+            average_salary, sample_size = salary_cube.average(**filters)
+        elif salary_rollups.ensure_current():
+            # ✅ Respuesta desde la tabla resumen salary_rollups
+            average_salary, sample_size = salary_rollups.average_from_rollups(**filters)
+        else:
+            average_salary, sample_size = salary_rollups.average_from_salaries(**filters)
         
-        # Ejecutar la consulta
-        result = query.first()
+        logger.debug('average_salary.result', extra={'fields': {
+            'average_salary': round(average_salary, 2), 'sample_size': sample_size
+        }})
         
-        average_salary = result.average_salary if result.average_salary else 0
-        sample_size = result.sample_size if result.sample_size else 0
+        response = salary_analytics.average_payload(average_salary, sample_size, requested)
         
-        print(f"📊 Resultado del cálculo: ${average_salary:.2f} USD (muestra: {sample_size} registros)")
+        # Modo de verificación: compara rollups contra la tabla salaries (solo
+        # con SALARY_ROLLUPS_ENABLED; apagado, nadie mantiene los rollups)
+        if data.get('consistencyCheck') and salary_rollups.ensure_current():
+            response["consistency"] = salary_rollups.check_consistency(**filters)
         
-        return jsonify({
-            "averageSalary": round(float(average_salary), 2),
-            "sampleSize": sample_size,
-            "currency": "USD",
-            "filters": {
-                "jobTitle": area_text,
-                "location": location_text,
-                "experienceLevel": experience_level_text
-            }
-        })
+        return jsonify(response)
         
     except Exception as e:
-        print(f"❌ Error calculando promedio: {str(e)}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.exception('average_salary.error')
         return jsonify({"error": str(e)}), 500
-    """Calcula el salario promedio basado en los filtros seleccionados."""
+
+@salary_bp.route('/average-salary/batch', methods=['POST'])
+@read_only
+def get_average_salary_batch():
+    """
+    Calcula muchos promedios en una sola petición.
+
+    Acepta {"combinations": [{"area": ..., "location": ..., "experienceLevel": ...}, ...]}
+    o {"groupBy": ["experienceLevel", "location"], "filters": {"area": ...}}.
+    """
+    data = request.get_json() or {}
+
     try:
-        data = request.get_json()
-        print(f"📥 Datos recibidos para cálculo de promedio: {data}")
-        
-        area = data.get('area')
-        location = data.get('location')
-        experience_level_text = data.get('experienceLevel')
-        
-        print(f"🔍 Filtros extraídos - Area: '{area}', Location: '{location}', Experience: '{experience_level_text}'")
-        
-        # ✅ MAPEAR experience level de texto a número
-        experience_level_map = {
-            'Junior': 1,
-            'Semi-Senior': 2, 
-            'Senior': 3,
-            'Executive': 4
-        }
-        
-        experience_level_number = None
-        if experience_level_text:
-            experience_level_number = experience_level_map.get(experience_level_text)
-            print(f"🔍 Experience Level mapeado: '{experience_level_text}' -> {experience_level_number}")
-        
-        # DEBUG: Ver qué valores únicos existen en la BD
-        print("🔍 VALORES ÚNICOS EN LA BASE DE DATOS:")
-        
-        # Ver job_titles únicos (sin filtro para ver todos)
-        job_titles = db.session.query(Salary.job_title).distinct().all()
-        job_titles_list = [title[0] for title in job_titles if title[0]]
-        print(f"   Job Titles totales: {len(job_titles_list)}")
-        print(f"   Algunos Job Titles: {job_titles_list[:10]}")
-        
-        # Verificar si el job_title existe exactamente
-        if area:
-            exact_match = area in job_titles_list
-            print(f"🔍 ¿'{area}' existe exactamente en job_titles? {exact_match}")
-            if not exact_match:
-                print(f"🔍 Búsqueda parcial de '{area}':")
-                similar_titles = [title for title in job_titles_list if area.lower() in title.lower()]
-                print(f"   Títulos similares: {similar_titles}")
-        
-        # Ver locations únicas (sin filtro para ver todas)
-        locations = db.session.query(Salary.location).distinct().all()
-        locations_list = [loc[0] for loc in locations if loc[0]]
-        print(f"   Locations totales: {len(locations_list)}")
-        print(f"   Algunas Locations: {locations_list[:10]}")
-        
-        # Verificar si la location existe exactamente
-        if location:
-            exact_match = location in locations_list
-            print(f"🔍 ¿'{location}' existe exactamente en locations? {exact_match}")
-            if not exact_match:
-                print(f"🔍 Búsqueda parcial de '{location}':")
-                similar_locations = [loc for loc in locations_list if location.lower() in loc.lower()]
-                print(f"   Locations similares: {similar_locations}")
-        
-        # Ver experience levels únicos
-        exp_levels = db.session.query(Salary.experience_level).distinct().all()
-        exp_levels_list = [level[0] for level in exp_levels if level[0]]
-        print(f"   Experience Levels: {exp_levels_list}")
-        
-        # Construir la consulta
-        query = db.session.query(
-            func.avg(Salary.salary_in_usd).label('average_salary'),
-            func.count(Salary.id).label('sample_size')
-        )
-        
-        # Aplicar filtros si se proporcionaron
-        conditions_applied = []
-        if area:
-            query = query.filter(Salary.job_title == area)
-            conditions_applied.append(f"job_title = '{area}'")
-        if location:
-            query = query.filter(Salary.location == location)
-            conditions_applied.append(f"location = '{location}'")
-        if experience_level_number:
-            query = query.filter(Salary.experience_level == experience_level_number)
-            conditions_applied.append(f"experience_level = {experience_level_number}")
-        
-        print(f"🔍 Condiciones aplicadas: {conditions_applied}")
-        
-        # Ejecutar la consulta
-        result = query.first()
-        
-        average_salary = result.average_salary if result.average_salary else 0
-        sample_size = result.sample_size if result.sample_size else 0
-        
-        print(f"📊 Resultado del cálculo: ${average_salary:.2f} USD (muestra: {sample_size} registros)")
-        
-        return jsonify({
-            "averageSalary": round(float(average_salary), 2),
-            "sampleSize": sample_size,
-            "currency": "USD",
-            "filters": {
-                "jobTitle": area,
-                "location": location,
-                "experienceLevel": experience_level_text
-            }
-        })
-        
+        if 'combinations' in data:
+            results = salary_batch.average_combinations(data['combinations'])
+        elif 'groupBy' in data:
+            results = salary_batch.average_group_by(data['groupBy'], data.get('filters'))
+        else:
+            return jsonify({'message': 'Se requiere combinations o groupBy'}), 400
+
+        return jsonify({'results': results, 'currency': 'USD'}), 200
+
+    except salary_batch.BatchError as e:
+        return jsonify({'message': str(e)}), 400
     except Exception as e:
-        print(f"❌ Error calculando promedio: {str(e)}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
-        return jsonify({"error": str(e)}), 500
+        return jsonify({'message': 'Error al calcular promedios', 'error': str(e)}), 500
+
+@salary_bp.route('/distribution', methods=['POST'])
+@read_only
+def get_salary_distribution():
+    """
+    Devuelve percentiles (p10/p25/p50/p75/p90) e histograma de salarios para
+    los mismos filtros que /average-salary (area, location, experienceLevel).
+    """
+    try:
+        data = request.get_json() or {}
+
+        try:
+            bins = salary_analytics.parse_bins(data)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        filters, requested = salary_analytics.resolve_filters(data)
+
+        if current_app.config.get('SALARY_CUBE_ENABLED'):
+            values = salary_cube.values(**filters)
+        else:
+            values = salary_distribution.salary_values(**filters)
+
+        response = salary_analytics.distribution_payload(values, bins, requested)
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({'message': 'Error al calcular la distribución', 'error': str(e)}), 500
 
 @salary_bp.route('/<int:id>', methods=['GET'])
 def get_salary(id):
@@ -340,8 +427,16 @@ def get_salary(id):
 @salary_bp.route('/<int:id>', methods=['PUT'])
 def update_salary(id):
     """Actualiza un registro de salario existente por su ID."""
+    rollups = salary_rollups.ensure_current()
     salary = Salary.query.get_or_404(id)
     data = request.get_json()
+
+    if 'salary_in_usd' in data:
+        salary_in_usd = salary_bulk.parse_salary(data['salary_in_usd'])
+        if salary_in_usd is None:
+            return jsonify({'message': 'salary_in_usd debe ser un número positivo'}), 400
+        data = {**data, 'salary_in_usd': salary_in_usd}
+    previous = salary_rollups.snapshot(salary) if rollups else None
     
     try:
         if 'year' in data:
@@ -358,7 +453,12 @@ def update_salary(id):
             salary.experience_level = data['experience_level']
         salary.updated_date = db.func.current_timestamp()
 
+        if rollups:
+            db.session.flush()
+            salary_rollups.apply_remove(previous)
+            salary_rollups.apply_insert(salary_rollups.snapshot(salary))
         db.session.commit()
+        salary_cube.apply_upsert(salary)
         return jsonify(salary.to_dict()), 200 
         
     except Exception as e:
@@ -368,11 +468,17 @@ def update_salary(id):
 @salary_bp.route('/<int:id>', methods=['DELETE'])
 def delete_salary(id):
     """Elimina un registro de salario por su ID."""
+    rollups = salary_rollups.ensure_current()
     salary = Salary.query.get_or_404(id)
+    previous = salary_rollups.snapshot(salary) if rollups else None
     
     try:
         db.session.delete(salary)
+        if rollups:
+            db.session.flush()
+            salary_rollups.apply_remove(previous)
         db.session.commit()
+        salary_cube.apply_delete(id)
         return jsonify({'message': 'Salario eliminado exitosamente'}), 204 
         
     except Exception as e:
@@ -1,13 +1,28 @@
 from flask import Blueprint, request, jsonify
 from app import db
+from app.models.role import Role
 from app.models.user import User
+from app.fieldsets import FieldSet, list_response
+from app.query_budget import query_budget
 
 user_bp = Blueprint('user_bp', __name__)
 
+# Campos de ?fields= (los mismos nombres que User.to_dict(), sin la contraseña)
+USER_FIELDS = FieldSet(User, {
+    'id': User.id,
+    'name': User.name,
+    'email': User.email,
+    'role': Role.role,
+    'created_date': User.created_date,
+}, joins={'role': (Role, User.role_id == Role.id)})
+
 @user_bp.route('/', methods=['GET'])
+@query_budget(1)
 def get_users():
-    """Devuelve la lista de todos los usuarios serializados."""
-    users = User.query.all()
+    """Devuelve la lista de todos los usuarios serializados (?fields= para elegir campos)."""
+    if 'fields' in request.args:
+        return list_response(USER_FIELDS, request.args['fields'])
+    users = User.query.options(db.joinedload(User.role_type_ref)).all()
     return jsonify([u.to_dict() for u in users]), 200
 
 @user_bp.route('/<int:id>', methods=['GET'])
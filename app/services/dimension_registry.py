@@ -0,0 +1,173 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import select
+
+from app import db
+from app.models.employmentType import EmploymentType
+from app.models.experienceLevel import ExperienceLevel
+from app.models.jobTitle import JobTitle
+from app.models.location import Location
+from app.models.role import Role
+
+# Clave de la dimensión -> (modelo, atributo con el nombre)
+DIMENSIONS = {
+    'job_title': (JobTitle, 'job_title'),
+    'location': (Location, 'location'),
+    'experience_level': (ExperienceLevel, 'experience_level'),
+    'employment_type': (EmploymentType, 'employment_type'),
+    'role': (Role, 'role'),
+}
+
+# Mínimo de segundos entre recargas de una misma dimensión por nombres desconocidos
+MISS_RELOAD_INTERVAL = 1.0
+
+# False dentro de preloaded_only(): el modo async no puede consultar con db.session
+_sync_loads = contextvars.ContextVar('dimension_registry_sync_loads', default=True)
+
+
+class DimensionNotLoaded(RuntimeError):
+    """Se pidió una dimensión no cargada donde no se permiten cargas síncronas."""
+
+
+class DimensionRegistry:
+    """
+    Caché de proceso con los mapas nombre↔id de las tablas de dimensiones.
+
+    Cada dimensión se carga una sola vez (la primera vez que se consulta) y se
+    mantiene hasta que una ruta de escritura llama a invalidate(). Cada
+    invalidación incrementa version, que sirve como token para cachés derivados.
+
+    Con varios procesos, las escrituras de otro proceso no invalidan este
+    caché: por eso un nombre desconocido en id_for() recarga la dimensión
+    (como máximo una vez cada MISS_RELOAD_INTERVAL segundos) antes de
+    devolver None.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_name = {}
+        self._by_id = {}
+        self._reloaded_at = {}
+        self.version = 0
+
+    def statement(self, dimension):
+        """SELECT (id, nombre) de la dimensión; lo usan _load() y el modo async."""
+        model, attr = DIMENSIONS[dimension]
+        return select(model.id, getattr(model, attr)).order_by(model.id)
+
+    def is_loaded(self, dimension):
+        return dimension in self._by_name and dimension in self._by_id
+
+    def store(self, dimension, rows, version):
+        """
+        Guarda los mapas de una dimensión a partir de las filas de statement().
+        Si hubo una invalidación desde version (leída antes de consultar) no se
+        guarda el resultado.
+        """
+        by_id = {id_: name for id_, name in rows}
+        by_name = {name: id_ for id_, name in rows if name is not None}
+        with self._lock:
+            if version == self.version:
+                self._by_id[dimension] = by_id
+                self._by_name[dimension] = by_name
+        return by_name, by_id
+
+    def refresh(self, dimension, rows):
+        """
+        Reemplaza los mapas de una dimensión con las filas de statement() si
+        difieren de los guardados; en ese caso incrementa version. Devuelve
+        True si hubo cambios.
+        """
+        by_id = {id_: name for id_, name in rows}
+        with self._lock:
+            self._reloaded_at[dimension] = time.monotonic()
+            if self._by_id.get(dimension) == by_id and dimension in self._by_name:
+                return False
+            self._by_id[dimension] = by_id
+            self._by_name[dimension] = {name: id_ for id_, name in rows if name is not None}
+            self.version += 1
+        return True
+
+    @contextmanager
+    def preloaded_only(self):
+        """
+        Dentro del bloque, pedir una dimensión que no está en memoria lanza
+        DimensionNotLoaded en lugar de consultarla con db.session. Lo usa el
+        modo async, donde esa consulta síncrona bloquearía el event loop.
+        """
+        token = _sync_loads.set(False)
+        try:
+            yield
+        finally:
+            _sync_loads.reset(token)
+
+    def _query(self, dimension):
+        if not _sync_loads.get():
+            raise DimensionNotLoaded(
+                f"La dimensión '{dimension}' no está cargada: en modo async hay que precargarla"
+            )
+        return db.session.execute(self.statement(dimension)).all()
+
+    def reload(self, dimension):
+        """Vuelve a leer una dimensión de la base (ver refresh)."""
+        return self.refresh(dimension, self._query(dimension))
+
+    def _load(self, dimension):
+        version = self.version
+        rows = self._query(dimension)
+        self._reloaded_at[dimension] = time.monotonic()
+        return self.store(dimension, rows, version)
+
+    def _maps(self, dimension):
+        by_name = self._by_name.get(dimension)
+        by_id = self._by_id.get(dimension)
+        if by_name is None or by_id is None:
+            by_name, by_id = self._load(dimension)
+        return by_name, by_id
+
+    def id_for(self, dimension, name, reload=True):
+        """
+        Devuelve el id del nombre dado, o None si no existe. Si el nombre no
+        está en memoria se recarga la dimensión una vez (salvo reload=False o
+        si se recargó hace menos de MISS_RELOAD_INTERVAL segundos).
+        """
+        id_ = self._maps(dimension)[0].get(name)
+        if id_ is None and name is not None and reload and self.should_reload(dimension):
+            self.reload(dimension)
+            id_ = self._maps(dimension)[0].get(name)
+        return id_
+
+    def should_reload(self, dimension):
+        """True si la dimensión no se recargó en los últimos MISS_RELOAD_INTERVAL segundos."""
+        return time.monotonic() - self._reloaded_at.get(dimension, float('-inf')) >= MISS_RELOAD_INTERVAL
+
+    def name_for(self, dimension, id_):
+        """Devuelve el nombre del id dado, o None si no existe."""
+        return self._maps(dimension)[1].get(id_)
+
+    def names(self, dimension):
+        """Devuelve los nombres no vacíos de la dimensión ordenados por id."""
+        return [name for name in self._maps(dimension)[1].values() if name]
+
+    def items(self, dimension):
+        """Devuelve los pares (id, nombre) con nombre no vacío ordenados por id."""
+        return [(id_, name) for id_, name in self._maps(dimension)[1].items() if name]
+
+    def invalidate(self, dimension=None):
+        """Descarta una dimensión (o todas) para recargarla en la próxima consulta."""
+        with self._lock:
+            if dimension is None:
+                self._by_name.clear()
+                self._by_id.clear()
+                self._reloaded_at.clear()
+            else:
+                self._by_name.pop(dimension, None)
+                self._by_id.pop(dimension, None)
+                self._reloaded_at.pop(dimension, None)
+            self.version += 1
+
+
+dimension_registry = DimensionRegistry()
@@ -0,0 +1,130 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import func, select
+
+from app import db
+from app.models.salary import Salary
+from app.services.dimension_registry import dimension_registry
+
+# Alias -> título canónico. El seed normaliza con este mapa y la búsqueda lo
+# usa para que "ML Engineer" encuentre "Machine Learning Engineer".
+JOB_TITLE_ALIASES = {
+    "ML Engineer": "Machine Learning Engineer",
+    "MLOps Engineer": "Machine Learning Operations Engineer",
+    "Finance Data Analyst": "Financial Data Analyst",
+    "BI Analyst": "Business Intelligence Analyst",
+    "BI Data Engineer": "Business Intelligence Data Engineer",
+    "BI Developer": "Business Intelligence Developer",
+    "BI Data Analyst": "Business Intelligence Data Analyst",
+    "Data Modeller": "Data Modeler",
+    "Data DevOps Engineer": "Data Developer Operations Engineer",
+}
+
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+
+def normalize(text):
+    """Minúsculas (casefold) y espacios colapsados, igual para índice y consulta."""
+    return ' '.join(str(text).casefold().split())
+
+
+def _keys(text):
+    """Claves de un título: el texto completo desde cada palabra ("data engineer", "engineer")."""
+    words = normalize(text).split(' ')
+    return [' '.join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class JobTitleIndex:
+    """
+    Índice de prefijos en memoria sobre job_titles.job_title.
+
+    Guarda una lista ordenada de (clave, id, alias) con cada título y alias a
+    partir de cada una de sus palabras; una búsqueda es un bisect hasta la
+    primera clave >= q y un recorrido mientras la clave empiece por q. Los
+    resultados se ordenan por cantidad de salarios del título.
+
+    Se reconstruye cuando cambia la versión del registro de dimensiones y,
+    como los conteos cambian con cada salario nuevo, cuando pasan más de
+    JOB_TITLE_SEARCH_TTL segundos desde la última construcción.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (versión del registro, instante de construcción, claves, entradas, títulos, conteos)
+        self._state = None
+
+    def _build(self):
+        version = dimension_registry.version
+        titles = dict(dimension_registry.items('job_title'))
+        counts = dict(db.session.execute(
+            select(Salary.job_title, func.count()).group_by(Salary.job_title)
+        ).all())
+
+        by_name = {normalize(name): id_ for id_, name in titles.items()}
+        entries = [(key, id_, None) for id_, name in titles.items() for key in _keys(name)]
+        for alias, canonical in JOB_TITLE_ALIASES.items():
+            id_ = by_name.get(normalize(canonical))
+            if id_ is not None:
+                entries.extend((key, id_, alias) for key in _keys(alias))
+        entries.sort(key=lambda entry: entry[0])
+
+        state = (version, time.monotonic(), [entry[0] for entry in entries], entries, titles, counts)
+        with self._lock:
+            self._state = state
+        return state
+
+    def _current(self, ttl):
+        state = self._state
+        if (state is None or state[0] != dimension_registry.version
+                or time.monotonic() - state[1] > ttl):
+            state = self._build()
+        return state
+
+    def search(self, q, limit=DEFAULT_SEARCH_LIMIT, ttl=300):
+        """
+        Devuelve hasta limit títulos cuyo nombre (o alias) tiene una palabra
+        que empieza por q, ordenados por cantidad de salarios y luego por nombre.
+        """
+        _, _, keys, entries, titles, counts = self._current(ttl)
+        prefix = normalize(q)
+        matches = {}
+        for i in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key, id_, alias = entries[i]
+            if not key.startswith(prefix):
+                break
+            # Una coincidencia por el nombre real tiene prioridad sobre la del alias
+            if alias is None:
+                matches[id_] = None
+            else:
+                matches.setdefault(id_, alias)
+
+        ranked = sorted(matches, key=lambda id_: (-counts.get(id_, 0), titles[id_]))
+        return [
+            {
+                'id': id_,
+                'job_title': titles[id_],
+                'sampleSize': counts.get(id_, 0),
+                'alias': matches[id_],
+            }
+            for id_ in ranked[:limit]
+        ]
+
+
+def parse_search(args):
+    """Devuelve (q, limit) de ?q=&limit=; lanza ValueError con el mensaje para el cliente."""
+    q = args.get('q', '').strip()
+    if not q:
+        raise ValueError('El parámetro q es requerido')
+    try:
+        limit = int(args.get('limit', DEFAULT_SEARCH_LIMIT))
+    except ValueError:
+        raise ValueError('El parámetro limit debe ser un entero')
+    if limit < 1:
+        raise ValueError('El parámetro limit debe ser mayor que 0')
+    return q, min(limit, MAX_SEARCH_LIMIT)
+
+
+job_title_index = JobTitleIndex()
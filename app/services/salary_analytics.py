@@ -0,0 +1,167 @@
+"""
+Lógica de los endpoints de lectura de salarios compartida por las rutas Flask
+(app/routes/salary_routes.py) y el modo ASGI (app/asgi.py): paginación,
+resolución de filtros, forma de las respuestas y caché de /filters.
+
+Nada de este módulo hace consultas por sí mismo salvo a través del registro
+de dimensiones, que el modo async precarga con dimension_registry.store().
+"""
+import hashlib
+import json
+import logging
+
+from app.fieldsets import rows_to_dicts
+from app.services import salary_distribution
+from app.services.dimension_registry import dimension_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+# Dimensiones que necesitan /filters, /average-salary y /distribution
+FILTER_DIMENSIONS = ('job_title', 'location', 'experience_level')
+
+# Dimensión -> campo del body con su nombre
+FILTER_FIELDS = {'job_title': 'area', 'location': 'location', 'experience_level': 'experienceLevel'}
+
+# Respuesta serializada de /filters y la versión de dimensiones con la que se generó
+_filters_cache = {}
+
+
+def parse_page(args):
+    """
+    Devuelve (after_id, limit) de los parámetros ?after_id=&limit= (limit se
+    recorta a MAX_PAGE_LIMIT); lanza ValueError con el mensaje para el cliente.
+    """
+    try:
+        after_id = int(args.get('after_id', 0))
+        limit = int(args.get('limit', DEFAULT_PAGE_LIMIT))
+    except ValueError:
+        raise ValueError('Parámetros de paginación inválidos')
+    if limit < 1:
+        raise ValueError('El parámetro limit debe ser mayor que 0')
+    return after_id, min(limit, MAX_PAGE_LIMIT)
+
+
+def page_payload(rows, limit, row_to_dict):
+    """
+    Arma la página a partir de hasta limit + 1 filas ordenadas por id: la fila
+    extra solo indica que existe una página siguiente.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        'data': [row_to_dict(r) for r in rows],
+        'next_cursor': rows[-1].id if has_more else None,
+        'limit': limit
+    }
+
+
+def fields_query(fieldset, names, args):
+    """
+    Devuelve (statement, payload) de una lista con ?fields=: la lista completa
+    o, con ?after_id=&limit=, una página por cursor; payload(rows) arma la
+    respuesta. Lanza ValueError si la paginación es inválida.
+    """
+    id_column = fieldset.model.id
+    if 'after_id' not in args and 'limit' not in args:
+        return fieldset.select(names).order_by(id_column), lambda rows: rows_to_dicts(rows, names)
+
+    after_id, limit = parse_page(args)
+    # next_cursor necesita el id aunque no se haya pedido (va al final y no se devuelve)
+    columns = names if 'id' in names else names + ['id']
+    statement = fieldset.select(columns).where(id_column > after_id).order_by(id_column).limit(limit + 1)
+    return statement, lambda rows: page_payload(rows, limit, lambda row: dict(zip(names, row)))
+
+
+def resolve_filters(data, reload=True):
+    """
+    Traduce area/location/experienceLevel (nombres) del body a filtros por id.
+
+    Devuelve (filters, requested): requested son los textos recibidos, que se
+    devuelven tal cual en la clave "filters" de la respuesta. Con reload=False
+    un nombre desconocido no recarga el registro (el modo async lo recarga con
+    sus propias consultas, ver unresolved_filters).
+    """
+    area_text = data.get('area')
+    location_text = data.get('location')
+    experience_level_text = data.get('experienceLevel')
+
+    filters = {
+        'job_title': dimension_registry.id_for('job_title', area_text, reload) if area_text else None,
+        'location': dimension_registry.id_for('location', location_text, reload) if location_text else None,
+        'experience_level': dimension_registry.id_for('experience_level', experience_level_text, reload)
+        if experience_level_text else None
+    }
+    requested = {
+        "jobTitle": area_text,
+        "location": location_text,
+        "experienceLevel": experience_level_text
+    }
+    return filters, requested
+
+
+def unresolved_filters(data, filters):
+    """Dimensiones cuyo nombre llegó en el body pero no está en el registro."""
+    return [dimension for dimension, field in FILTER_FIELDS.items()
+            if data.get(field) and filters[dimension] is None]
+
+
+def average_payload(average_salary, sample_size, requested):
+    return {
+        "averageSalary": round(float(average_salary), 2),
+        "sampleSize": sample_size,
+        "currency": "USD",
+        "filters": requested
+    }
+
+
+def parse_bins(data):
+    """Devuelve bins validado; lanza ValueError con el mensaje para el cliente."""
+    try:
+        bins = int(data.get('bins', salary_distribution.DEFAULT_BINS))
+    except (TypeError, ValueError):
+        raise ValueError('El campo bins debe ser un entero')
+    if not 1 <= bins <= salary_distribution.MAX_BINS:
+        raise ValueError(f'El campo bins debe estar entre 1 y {salary_distribution.MAX_BINS}')
+    return bins
+
+
+def distribution_payload(values, bins, requested):
+    response = salary_distribution.describe(values, bins=bins)
+    response["currency"] = "USD"
+    response["filters"] = requested
+    return response
+
+
+def filter_options():
+    """
+    Devuelve (body, etag) de /filters. La respuesta se guarda en memoria junto
+    con la versión del registro de dimensiones y solo se reconstruye cuando
+    alguna dimensión cambia.
+    """
+    version = dimension_registry.version
+    if _filters_cache.get('version') != version:
+        areas = dimension_registry.names('job_title')
+        locations_list = dimension_registry.names('location')
+        exp_levels = dimension_registry.names('experience_level')
+
+        logger.info('filters.rebuilt', extra={'fields': {
+            'version': version, 'areas': len(areas),
+            'locations': len(locations_list), 'experience_levels': len(exp_levels)
+        }})
+
+        filter_options = {
+            "areas": areas,
+            "locations": locations_list,
+            "positions": areas,
+            "experienceLevels": exp_levels
+        }
+        body = json.dumps(filter_options, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        _filters_cache.update({
+            'version': version,
+            'body': body,
+            'etag': hashlib.sha256(body).hexdigest()[:32]
+        })
+    return _filters_cache['body'], _filters_cache['etag']
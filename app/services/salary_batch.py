@@ -0,0 +1,121 @@
+from sqlalchemy import func
+
+from app import db
+from app.models.salary import Salary
+from app.services.dimension_registry import dimension_registry
+
+MAX_BATCH_COMBINATIONS = 1000
+
+# Nombre del campo en el formulario -> (columna en salaries, dimensión del registro)
+DIMENSIONS = {
+    'area': (Salary.job_title, 'job_title'),
+    'location': (Salary.location, 'location'),
+    'experienceLevel': (Salary.experience_level, 'experience_level'),
+    'employmentType': (Salary.employment_type, 'employment_type'),
+    'year': (Salary.year, None),
+}
+
+
+class BatchError(ValueError):
+    """Error de validación de una petición batch."""
+
+
+def _validate_keys(keys):
+    unknown = [k for k in keys if k not in DIMENSIONS]
+    if unknown:
+        raise BatchError(f"Dimensiones no soportadas: {unknown}. Usa {list(DIMENSIONS)}")
+
+
+def _resolve(key, value):
+    dimension = DIMENSIONS[key][1]
+    if dimension is None:
+        return str(value)
+    return dimension_registry.id_for(dimension, value)
+
+
+def _result(salary_sum, salary_count, row_count):
+    average = salary_sum / salary_count if salary_count else 0
+    return {'averageSalary': round(float(average), 2), 'sampleSize': int(row_count)}
+
+
+def average_combinations(combinations):
+    """
+    Responde una lista de combinaciones de filtros (como el cuerpo de
+    /average-salary) con una sola consulta agrupada.
+
+    Los nombres se resuelven con el registro de dimensiones; cada celda se obtiene sumando los
+    grupos de la consulta que coinciden con sus filtros. Un nombre que no existe
+    produce una celda vacía (sampleSize 0).
+    """
+    if not isinstance(combinations, list) or not all(isinstance(c, dict) for c in combinations):
+        raise BatchError('combinations debe ser una lista de objetos')
+    if len(combinations) > MAX_BATCH_COMBINATIONS:
+        raise BatchError(f'Máximo {MAX_BATCH_COMBINATIONS} combinaciones por petición')
+
+    keys = sorted({k for comb in combinations for k, v in comb.items() if v not in (None, '')})
+    _validate_keys(keys)
+
+    resolved = []
+    for comb in combinations:
+        ids = {k: _resolve(k, comb[k]) for k in keys if comb.get(k) not in (None, '')}
+        resolved.append(None if None in ids.values() else ids)
+
+    columns = [DIMENSIONS[k][0] for k in keys]
+    query = db.session.query(
+        *columns,
+        func.coalesce(func.sum(Salary.salary_in_usd), 0),
+        func.count(Salary.salary_in_usd),
+        func.count(Salary.id),
+    )
+    # Si todas las combinaciones fijan una dimensión, se restringe la consulta a esos valores
+    for key, column in zip(keys, columns):
+        values = {ids.get(key) for ids in resolved if ids is not None}
+        if values and None not in values:
+            query = query.filter(column.in_(values))
+    groups = query.group_by(*columns).all() if columns else query.all()
+
+    results = []
+    for comb, ids in zip(combinations, resolved):
+        salary_sum = salary_count = row_count = 0
+        if ids is not None:
+            for group in groups:
+                if all(group[keys.index(k)] == v for k, v in ids.items()):
+                    salary_sum += group[-3]
+                    salary_count += group[-2]
+                    row_count += group[-1]
+        results.append(dict(_result(salary_sum, salary_count, row_count), filters=comb))
+    return results
+
+
+def average_group_by(group_by, filters):
+    """
+    Calcula el promedio para cada combinación de valores de las dimensiones en
+    group_by (con filtros opcionales) con un único GROUP BY.
+    """
+    if not isinstance(group_by, list) or not group_by:
+        raise BatchError('groupBy debe ser una lista no vacía de dimensiones')
+    filters = {k: v for k, v in (filters or {}).items() if v not in (None, '')}
+    _validate_keys(group_by)
+    _validate_keys(filters)
+
+    columns = [DIMENSIONS[k][0] for k in group_by]
+    query = db.session.query(
+        *columns,
+        func.coalesce(func.sum(Salary.salary_in_usd), 0),
+        func.count(Salary.salary_in_usd),
+        func.count(Salary.id),
+    )
+    for key, value in filters.items():
+        value_id = _resolve(key, value)
+        if value_id is None:
+            return []
+        query = query.filter(DIMENSIONS[key][0] == value_id)
+
+    results = []
+    for group in query.group_by(*columns).all():
+        cell = {
+            key: group[i] if DIMENSIONS[key][1] is None else dimension_registry.name_for(DIMENSIONS[key][1], group[i])
+            for i, key in enumerate(group_by)
+        }
+        results.append(dict(_result(*group[-3:]), group=cell))
+    return results
@@ -0,0 +1,269 @@
+from datetime import datetime
+from numbers import Number
+
+from sqlalchemy import delete, insert, update
+
+from app import db
+from app.models.salary import Salary
+from app.services import salary_rollups
+from app.services.dimension_registry import dimension_registry
+
+MAX_BULK_ROWS = 10_000
+
+# Campo del formulario (los mismos que POST /api/salaries) -> (columna en salaries, dimensión)
+DIMENSION_FIELDS = {
+    'area': ('employment_type', 'employment_type'),
+    'position': ('job_title', 'job_title'),
+    'location': ('location', 'location'),
+    'experienceLevel': ('experience_level', 'experience_level'),
+}
+REQUIRED_FIELDS = ['area', 'location', 'position', 'experienceLevel', 'salary']
+
+
+class BulkError(ValueError):
+    """Error de validación que afecta a toda la petición bulk."""
+
+
+def _name_lookup(dimension):
+    """Mapa nombre en minúsculas -> id de la dimensión, construido una vez por petición."""
+    return {name.casefold(): dimension_registry.id_for(dimension, name)
+            for name in dimension_registry.names(dimension)}
+
+
+def _lookup_for(dimension, values):
+    """
+    _name_lookup de la dimensión; si algún valor no se resuelve (p. ej. un
+    nombre creado desde otro proceso) recarga la dimensión una vez.
+    """
+    lookup = _name_lookup(dimension)
+    values = {v for v in values if isinstance(v, (str, int)) and not isinstance(v, bool) and v != ''}
+    if any(_resolve(dimension, v, lookup) is None for v in values) and dimension_registry.should_reload(dimension):
+        dimension_registry.reload(dimension)
+        lookup = _name_lookup(dimension)
+    return lookup
+
+
+def _resolve(dimension, value, lookup):
+    """Devuelve el id de un nombre (sin distinguir mayúsculas) o de un id existente, o None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if dimension_registry.name_for(dimension, value) is not None else None
+    if isinstance(value, str):
+        return lookup.get(value.strip().casefold())
+    return None
+
+
+def parse_salary(value):
+    """Importe entero positivo (acepta números y textos numéricos) o None si no es válido."""
+    if isinstance(value, bool) or not isinstance(value, (Number, str)):
+        return None
+    try:
+        amount = float(value)
+    except ValueError:
+        return None
+    return int(round(amount)) if amount > 0 else None
+
+
+def _parse_year(value, current_year):
+    if value is None:
+        return str(current_year)
+    if isinstance(value, bool):
+        return None
+    try:
+        year = int(value)
+    except (TypeError, ValueError):
+        return None
+    return str(year) if 1900 <= year <= current_year + 1 else None
+
+
+def validate_rows(rows):
+    """
+    Valida todas las filas antes de escribir.
+
+    Devuelve (valores, errores): valores son los dicts de columnas listos para
+    insertar y errores una lista de {'index': i, 'errors': {campo: mensaje}}.
+    Los nombres de dimensión se resuelven con el registro en memoria, sin
+    distinguir mayúsculas.
+    """
+    if not isinstance(rows, list):
+        raise BulkError('Se espera un arreglo de filas')
+    if not rows:
+        raise BulkError('El arreglo de filas está vacío')
+    if len(rows) > MAX_BULK_ROWS:
+        raise BulkError(f'Máximo {MAX_BULK_ROWS} filas por petición (se recibieron {len(rows)})')
+
+    current_year = datetime.now().year
+    lookups = {dimension: _lookup_for(dimension, [row.get(field) for row in rows if isinstance(row, dict)])
+               for field, (_, dimension) in DIMENSION_FIELDS.items()}
+    values, errors = [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({'index': index, 'errors': {'row': 'La fila debe ser un objeto'}})
+            continue
+
+        row_errors = {field: 'Campo requerido' for field in REQUIRED_FIELDS
+                      if row.get(field) in (None, '')}
+        value = {}
+        for field, (column, dimension) in DIMENSION_FIELDS.items():
+            if field in row_errors:
+                continue
+            value[column] = _resolve(dimension, row[field], lookups[dimension])
+            if value[column] is None:
+                row_errors[field] = f"'{row[field]}' no existe en {dimension}"
+        if 'salary' not in row_errors:
+            value['salary_in_usd'] = parse_salary(row['salary'])
+            if value['salary_in_usd'] is None:
+                row_errors['salary'] = 'Debe ser un número positivo'
+        value['year'] = _parse_year(row.get('year'), current_year)
+        if value['year'] is None:
+            row_errors['year'] = f'Debe ser un año entre 1900 y {current_year + 1}'
+
+        if row_errors:
+            errors.append({'index': index, 'errors': row_errors})
+        else:
+            values.append(value)
+    return values, errors
+
+
+def insert_rows(values, refresh_rollups=True):
+    """
+    Inserta las filas validadas con un único executemany y, con
+    refresh_rollups, recalcula los grupos afectados de salary_rollups. No
+    hace commit.
+    """
+    now = db.func.current_timestamp()
+    db.session.execute(insert(Salary.__table__).values(created_date=now, updated_date=now), values)
+    if refresh_rollups:
+        salary_rollups.refresh_groups(values)
+
+
+# Campo de filtros/cambios masivos -> dimensión (misma columna en salaries)
+COLUMN_FIELDS = {
+    'jobTitle': 'job_title',
+    'location': 'location',
+    'experienceLevel': 'experience_level',
+    'employmentType': 'employment_type',
+}
+FILTER_FIELDS = list(COLUMN_FIELDS) + ['year', 'createdFrom', 'createdTo']
+CHANGE_FIELDS = list(COLUMN_FIELDS) + ['year', 'salary']
+
+
+def _resolve_field(field, value):
+    dimension = COLUMN_FIELDS[field]
+    id_ = _resolve(dimension, value, _lookup_for(dimension, [value]))
+    if id_ is None:
+        raise BulkError(f"{field}: '{value}' no existe en {dimension}")
+    return id_
+
+
+def _parse_datetime(field, value):
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise BulkError(f'{field}: se espera una fecha ISO 8601 (p. ej. 2024-01-31 o 2024-01-31T12:00:00)')
+
+
+def build_selection(data):
+    """
+    Traduce {"ids": [...]} y/o {"filter": {...}} a condiciones sobre salaries.
+
+    Se exige al menos un criterio para no modificar la tabla completa por error.
+    """
+    if not isinstance(data, dict):
+        raise BulkError('Se espera un objeto JSON con ids o filter')
+    ids = data.get('ids')
+    filters = data.get('filter')
+    if ids is None and not filters:
+        raise BulkError('Se requiere ids o filter')
+
+    conditions = []
+    if ids is not None:
+        if (not isinstance(ids, list) or not ids
+                or any(isinstance(i, bool) or not isinstance(i, int) for i in ids)):
+            raise BulkError('ids debe ser un arreglo no vacío de enteros')
+        if len(ids) > MAX_BULK_ROWS:
+            raise BulkError(f'Máximo {MAX_BULK_ROWS} ids por petición (se recibieron {len(ids)})')
+        conditions.append(Salary.id.in_(ids))
+
+    if filters:
+        if not isinstance(filters, dict):
+            raise BulkError('filter debe ser un objeto')
+        unknown = [k for k in filters if k not in FILTER_FIELDS]
+        if unknown:
+            raise BulkError(f'Filtros no soportados: {unknown}. Usa {FILTER_FIELDS}')
+        for field, value in filters.items():
+            if field in COLUMN_FIELDS:
+                conditions.append(getattr(Salary, COLUMN_FIELDS[field]) == _resolve_field(field, value))
+            elif field == 'year':
+                conditions.append(Salary.year == str(value))
+            elif field == 'createdFrom':
+                conditions.append(Salary.created_date >= _parse_datetime(field, value))
+            elif field == 'createdTo':
+                conditions.append(Salary.created_date <= _parse_datetime(field, value))
+    return conditions
+
+
+def parse_changes(changes):
+    """Valida {"set": {...}} y devuelve los valores de columna a asignar."""
+    if not isinstance(changes, dict) or not changes:
+        raise BulkError('Se requiere set con al menos un campo')
+    unknown = [k for k in changes if k not in CHANGE_FIELDS]
+    if unknown:
+        raise BulkError(f'Campos no soportados: {unknown}. Usa {CHANGE_FIELDS}')
+
+    values = {}
+    for field, value in changes.items():
+        if field in COLUMN_FIELDS:
+            values[COLUMN_FIELDS[field]] = _resolve_field(field, value)
+        elif field == 'salary':
+            values['salary_in_usd'] = parse_salary(value)
+            if values['salary_in_usd'] is None:
+                raise BulkError('salary: debe ser un número positivo')
+        elif field == 'year':
+            current_year = datetime.now().year
+            values['year'] = None if value is None else _parse_year(value, current_year)
+            if values['year'] is None:
+                raise BulkError(f'year: debe ser un año entre 1900 y {current_year + 1}')
+    return values
+
+
+def _affected_groups(conditions):
+    """Grupos de salary_rollups (una fila por grupo) que tocan las filas seleccionadas."""
+    columns = [getattr(Salary, col) for col in salary_rollups.GROUP_COLUMNS]
+    rows = db.session.query(*columns).filter(*conditions).distinct().all()
+    return [dict(zip(salary_rollups.GROUP_COLUMNS, row)) for row in rows]
+
+
+def update_rows(conditions, values, refresh_rollups=True):
+    """
+    Aplica values a todas las filas seleccionadas con un único UPDATE y, con
+    refresh_rollups, recalcula los grupos de salary_rollups de antes y de
+    después. No hace commit; devuelve la cantidad de filas afectadas.
+    """
+    groups = _affected_groups(conditions) if refresh_rollups else []
+    result = db.session.execute(
+        update(Salary).where(*conditions).values(**values, updated_date=db.func.current_timestamp()),
+        execution_options={'synchronize_session': False}
+    )
+    if refresh_rollups:
+        moved = [{**group, **{col: values[col] for col in salary_rollups.GROUP_COLUMNS if col in values}}
+                 for group in groups]
+        salary_rollups.refresh_groups(groups + moved)
+    return result.rowcount
+
+
+def delete_rows(conditions, refresh_rollups=True):
+    """
+    Borra todas las filas seleccionadas con un único DELETE y, con
+    refresh_rollups, recalcula sus grupos de salary_rollups. No hace commit;
+    devuelve la cantidad de filas borradas.
+    """
+    groups = _affected_groups(conditions) if refresh_rollups else []
+    result = db.session.execute(
+        delete(Salary).where(*conditions),
+        execution_options={'synchronize_session': False}
+    )
+    if refresh_rollups:
+        salary_rollups.refresh_groups(groups)
+    return result.rowcount
@@ -0,0 +1,209 @@
+import threading
+import time
+
+import numpy as np
+from flask import current_app
+
+from app import db
+from app.models.salary import Salary
+
+# Código usado cuando una columna es nula o no es un entero válido
+MISSING_CODE = -1
+
+DIMENSIONS = ('job_title', 'location', 'experience_level', 'employment_type', 'year')
+
+# Intentos de load() antes de usar una carga aunque haya cambiado la generación
+MAX_LOAD_ATTEMPTS = 3
+
+# Filas que se reservan como mínimo cada vez que los arrays crecen
+MIN_GROWTH = 1024
+
+# id de las posiciones reservadas sin usar: mayor que cualquier id, así ids sigue ordenado
+UNUSED_ID = np.iinfo(np.int64).max
+
+
+def _code(value):
+    """Convierte un id de dimensión (o el año) a entero; MISSING_CODE si no se puede."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return MISSING_CODE
+
+
+class SalaryCube:
+    """
+    Copia columnar en memoria de la tabla salaries.
+
+    Cada dimensión se guarda como un array de enteros (los ids de las tablas de
+    dimensiones y el año como número) y salary_in_usd como float64 con NaN para
+    los nulos. Los promedios filtrados se calculan con máscaras booleanas
+    vectorizadas en lugar de una consulta AVG/COUNT por petición.
+
+    Los cambios se aplican con apply_upsert/apply_delete después de cada commit;
+    si algo no se puede parchear, el cubo se marca como sucio y se reconstruye
+    en la siguiente consulta.
+
+    Cada cambio (invalidate, apply_upsert, apply_delete) incrementa generation.
+    load() consulta fuera del lock y descarta su resultado si la generación
+    cambió mientras tanto, así una escritura concurrente con la carga no se
+    pierde.
+
+    Los arrays tienen capacidad de sobra (posiciones con valid=False e id
+    UNUSED_ID) y crecen al doble cuando se llenan, así insertar una fila no
+    copia el cubo entero en cada POST mientras se tiene el lock.
+
+    Los parches solo llegan al cubo del proceso que hizo la escritura: con
+    varios workers, los cubos de los demás se reconstruyen cuando pasan más de
+    SALARY_CUBE_TTL segundos desde su última carga.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.generation = 0
+        self.loaded_at = None
+        self.size = 0
+        self.ids = None
+        self.salary = None
+        self.valid = None
+        self.columns = {}
+
+    def invalidate(self):
+        """Marca el cubo para reconstruirlo en la próxima consulta."""
+        with self._lock:
+            self._loaded = False
+            self.generation += 1
+
+    def load(self, force=False):
+        """
+        Reconstruye los arrays desde la base de datos (requiere app context).
+
+        Devuelve True si la carga quedó vigente. Si la generación cambió durante
+        la consulta el resultado se descarta y devuelve False, salvo con
+        force=True, en cuyo caso se usa igual pero el cubo sigue marcado para
+        reconstruirse en la próxima consulta.
+        """
+        generation = self.generation
+        rows = db.session.query(
+            Salary.id,
+            Salary.salary_in_usd,
+            Salary.job_title,
+            Salary.location,
+            Salary.experience_level,
+            Salary.employment_type,
+            Salary.year,
+        ).order_by(Salary.id).all()
+
+        with self._lock:
+            current = self.generation == generation
+            if not current and not force:
+                return False
+            self.ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            self.salary = np.fromiter(
+                (np.nan if r[1] is None else r[1] for r in rows), dtype=np.float64, count=len(rows)
+            )
+            self.columns = {
+                name: np.fromiter((_code(r[i]) for r in rows), dtype=np.int64, count=len(rows))
+                for i, name in enumerate(DIMENSIONS, start=2)
+            }
+            self.valid = np.ones(len(rows), dtype=bool)
+            self.size = len(rows)
+            self._loaded = current
+            self.loaded_at = time.monotonic()
+        return current
+
+    def _ensure_loaded(self):
+        ttl = current_app.config.get('SALARY_CUBE_TTL', 60)
+        if self._loaded and time.monotonic() - self.loaded_at > ttl:
+            self.invalidate()
+        for attempt in range(1, MAX_LOAD_ATTEMPTS + 1):
+            if self._loaded or self.load(force=attempt == MAX_LOAD_ATTEMPTS):
+                return
+
+    def _mask(self, filters):
+        mask = self.valid.copy()
+        for name, value in filters.items():
+            if value is None:
+                continue
+            mask &= self.columns[name] == _code(value)
+        return mask
+
+    def average(self, **filters):
+        """
+        Devuelve (promedio, cantidad) para los filtros dados (los valores None
+        se ignoran), con la misma semántica que AVG/COUNT en SQL.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            mask = self._mask(filters)
+            sample_size = int(mask.sum())
+            values = self.salary[mask]
+        values = values[~np.isnan(values)]
+        average = float(values.mean()) if values.size else 0.0
+        return average, sample_size
+
+    def values(self, **filters):
+        """Devuelve los salary_in_usd no nulos que cumplen los filtros."""
+        self._ensure_loaded()
+        with self._lock:
+            values = self.salary[self._mask(filters)]
+        return values[~np.isnan(values)]
+
+    def apply_upsert(self, salary):
+        """Inserta o actualiza una fila del cubo a partir de una instancia de Salary ya confirmada."""
+        with self._lock:
+            self.generation += 1
+            if not self._loaded:
+                return
+            values = {
+                'job_title': salary.job_title,
+                'location': salary.location,
+                'experience_level': salary.experience_level,
+                'employment_type': salary.employment_type,
+                'year': salary.year,
+            }
+            amount = np.nan if salary.salary_in_usd is None else float(salary.salary_in_usd)
+
+            pos = int(np.searchsorted(self.ids, salary.id))
+            if pos < len(self.ids) and self.ids[pos] == salary.id:
+                self.salary[pos] = amount
+                for name, value in values.items():
+                    self.columns[name][pos] = _code(value)
+                self.valid[pos] = True
+            elif pos == self.size:
+                # Los ids nuevos son crecientes, así que basta con añadir al final
+                if self.size == len(self.ids):
+                    self._grow()
+                self.ids[pos] = salary.id
+                self.salary[pos] = amount
+                for name, value in values.items():
+                    self.columns[name][pos] = _code(value)
+                self.valid[pos] = True
+                self.size += 1
+            else:
+                self._loaded = False
+
+    def _grow(self):
+        """Duplica la capacidad de los arrays (con el lock tomado)."""
+        extra = max(MIN_GROWTH, len(self.ids))
+
+        def grow(array, fill):
+            return np.concatenate([array, np.full(extra, fill, dtype=array.dtype)])
+
+        self.ids = grow(self.ids, UNUSED_ID)
+        self.salary = grow(self.salary, np.nan)
+        self.columns = {name: grow(column, MISSING_CODE) for name, column in self.columns.items()}
+        self.valid = grow(self.valid, False)
+
+    def apply_delete(self, salary_id):
+        """Marca como eliminada la fila con el id dado."""
+        with self._lock:
+            self.generation += 1
+            if not self._loaded:
+                return
+            pos = int(np.searchsorted(self.ids, salary_id))
+            if pos < len(self.ids) and self.ids[pos] == salary_id:
+                self.valid[pos] = False
+
+
+salary_cube = SalaryCube()
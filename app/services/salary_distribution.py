@@ -0,0 +1,59 @@
+import numpy as np
+from sqlalchemy import select
+
+from app import db
+from app.models.salary import Salary
+
+PERCENTILES = (10, 25, 50, 75, 90)
+DEFAULT_BINS = 20
+MAX_BINS = 200
+
+
+def salary_values_statement(**filters):
+    """SELECT de los salary_in_usd no nulos que cumplen los filtros."""
+    statement = select(Salary.salary_in_usd).where(Salary.salary_in_usd.isnot(None))
+    for name, value in filters.items():
+        if value is not None:
+            statement = statement.where(getattr(Salary, name) == value)
+    return statement
+
+
+def values_from_rows(rows):
+    """Array float64 a partir de las filas de salary_values_statement()."""
+    return np.fromiter((r[0] for r in rows), dtype=np.float64, count=len(rows))
+
+
+def salary_values(**filters):
+    """Devuelve un array con los salary_in_usd no nulos que cumplen los filtros."""
+    return values_from_rows(db.session.execute(salary_values_statement(**filters)).all())
+
+
+def describe(values, bins=DEFAULT_BINS):
+    """
+    Calcula percentiles e histograma de bins fijos sobre un array de salarios
+    en una sola pasada vectorizada.
+    """
+    if values.size == 0:
+        return {
+            'sampleSize': 0,
+            'percentiles': {f'p{p}': None for p in PERCENTILES},
+            'min': None,
+            'max': None,
+            'mean': None,
+            'histogram': {'binEdges': [], 'counts': []}
+        }
+
+    quantiles = np.percentile(values, PERCENTILES)
+    counts, edges = np.histogram(values, bins=bins)
+
+    return {
+        'sampleSize': int(values.size),
+        'percentiles': {f'p{p}': round(float(q), 2) for p, q in zip(PERCENTILES, quantiles)},
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'mean': round(float(values.mean()), 2),
+        'histogram': {
+            'binEdges': [round(float(e), 2) for e in edges],
+            'counts': counts.tolist()
+        }
+    }
@@ -0,0 +1,221 @@
+import threading
+
+from flask import current_app
+from sqlalchemy import and_, delete, func, insert, or_, select
+
+from app import db
+from app.models.salary import Salary
+from app.models.salaryRollup import SalaryRollup
+
+GROUP_COLUMNS = ('job_title', 'location', 'experience_level', 'employment_type', 'year')
+ROLLUP_COLUMNS = list(GROUP_COLUMNS) + ['row_count', 'salary_count', 'salary_sum', 'salary_min', 'salary_max']
+
+# Grupos recalculados por sentencia en refresh_groups
+REFRESH_CHUNK_SIZE = 100
+
+
+def _normalize_id(value):
+    """Normaliza un id de dimensión como lo guarda SQLite en una columna INTEGER."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def rollups_enabled():
+    return bool(current_app.config.get('SALARY_ROLLUPS_ENABLED'))
+
+
+def ensure_current():
+    """
+    Devuelve True si SALARY_ROLLUPS_ENABLED está activo y los rollups están al
+    día en este proceso.
+
+    Con el flag apagado las escrituras no mantienen salary_rollups, así que al
+    encenderlo el resumen puede estar desactualizado: cada proceso lo
+    reconstruye una vez, en su propia transacción sobre el engine principal,
+    antes de la primera lectura o escritura que lo usa. Debe llamarse al
+    principio de la petición, antes de escribir con la sesión.
+    """
+    if not rollups_enabled():
+        return False
+    state = current_app.extensions.setdefault('salary_rollups', {'current': False, 'lock': threading.Lock()})
+    if not state['current']:
+        with state['lock']:
+            if not state['current']:
+                with db.engine.begin() as connection:
+                    connection.execute(delete(SalaryRollup))
+                    connection.execute(insert(SalaryRollup).from_select(ROLLUP_COLUMNS, _aggregate()))
+                state['current'] = True
+    return True
+
+
+def snapshot(salary):
+    """
+    Captura la clave de grupo y el importe de un Salary antes de modificarlo,
+    para poder restar su aporte del rollup después.
+    """
+    return {
+        'job_title': _normalize_id(salary.job_title),
+        'location': _normalize_id(salary.location),
+        'experience_level': _normalize_id(salary.experience_level),
+        'employment_type': _normalize_id(salary.employment_type),
+        'year': None if salary.year is None else str(salary.year),
+        'salary_in_usd': None if salary.salary_in_usd is None else int(salary.salary_in_usd),
+    }
+
+
+def _group_filter(model, key):
+    return [getattr(model, col) == key[col] for col in GROUP_COLUMNS]
+
+
+def _aggregate(*conditions):
+    """SELECT ... GROUP BY que produce las filas de salary_rollups desde salaries."""
+    group_cols = [getattr(Salary, col) for col in GROUP_COLUMNS]
+    return select(
+        *group_cols,
+        func.count(Salary.id),
+        func.count(Salary.salary_in_usd),
+        func.coalesce(func.sum(Salary.salary_in_usd), 0),
+        func.min(Salary.salary_in_usd),
+        func.max(Salary.salary_in_usd),
+    ).where(*conditions).group_by(*group_cols)
+
+
+def rebuild_rollups():
+    """
+    Reconstruye salary_rollups completo con un único INSERT ... SELECT GROUP BY.
+    No hace commit.
+    """
+    db.session.flush()
+    db.session.query(SalaryRollup).delete(synchronize_session=False)
+    db.session.execute(insert(SalaryRollup).from_select(ROLLUP_COLUMNS, _aggregate()))
+
+
+def refresh_groups(keys):
+    """
+    Recalcula desde salaries los grupos de las claves dadas (snapshots o
+    filas insertadas) con DELETE + INSERT ... SELECT GROUP BY por tandas.
+
+    Pensado para escrituras masivas: el costo depende de los grupos afectados,
+    no de las filas. No hace commit.
+    """
+    groups = list({tuple(_normalize_id(key[col]) if col != 'year' else key[col] for col in GROUP_COLUMNS)
+                   for key in keys})
+    db.session.flush()
+    for start in range(0, len(groups), REFRESH_CHUNK_SIZE):
+        chunk = [dict(zip(GROUP_COLUMNS, group)) for group in groups[start:start + REFRESH_CHUNK_SIZE]]
+        db.session.query(SalaryRollup).filter(
+            or_(*[and_(*_group_filter(SalaryRollup, key)) for key in chunk])
+        ).delete(synchronize_session=False)
+        db.session.execute(insert(SalaryRollup).from_select(
+            ROLLUP_COLUMNS, _aggregate(or_(*[and_(*_group_filter(Salary, key)) for key in chunk]))
+        ))
+
+
+def apply_insert(key):
+    """Suma el aporte de una fila (snapshot) a su grupo. No hace commit."""
+    rollup = SalaryRollup.query.filter(*_group_filter(SalaryRollup, key)).first()
+    if rollup is None:
+        rollup = SalaryRollup(row_count=0, salary_count=0, salary_sum=0,
+                              **{col: key[col] for col in GROUP_COLUMNS})
+        db.session.add(rollup)
+
+    amount = key['salary_in_usd']
+    rollup.row_count += 1
+    if amount is not None:
+        rollup.salary_count += 1
+        rollup.salary_sum += amount
+        rollup.salary_min = amount if rollup.salary_min is None else min(rollup.salary_min, amount)
+        rollup.salary_max = amount if rollup.salary_max is None else max(rollup.salary_max, amount)
+
+
+def apply_remove(key):
+    """
+    Resta el aporte de una fila (snapshot) de su grupo. No hace commit.
+
+    La suma y los conteos se ajustan por delta; mínimo y máximo solo se
+    recalculan sobre el grupo cuando la fila eliminada era uno de los extremos.
+    Debe llamarse después de aplicar el cambio en salaries (tras flush).
+    """
+    rollup = SalaryRollup.query.filter(*_group_filter(SalaryRollup, key)).first()
+    if rollup is None:
+        return
+
+    amount = key['salary_in_usd']
+    rollup.row_count -= 1
+    if rollup.row_count <= 0:
+        db.session.delete(rollup)
+        return
+
+    if amount is not None:
+        rollup.salary_count -= 1
+        rollup.salary_sum -= amount
+        if amount in (rollup.salary_min, rollup.salary_max):
+            db.session.flush()
+            bounds = db.session.query(
+                func.min(Salary.salary_in_usd), func.max(Salary.salary_in_usd)
+            ).filter(*_group_filter(Salary, key)).one()
+            rollup.salary_min, rollup.salary_max = bounds
+
+
+def _apply_filters(query, model, filters):
+    for name, value in filters.items():
+        if value is not None:
+            query = query.filter(getattr(model, name) == value)
+    return query
+
+
+def rollups_average_statement(**filters):
+    """SELECT de suma y conteos sobre salary_rollups para los filtros dados."""
+    statement = select(
+        func.sum(SalaryRollup.salary_sum),
+        func.sum(SalaryRollup.salary_count),
+        func.sum(SalaryRollup.row_count),
+    )
+    return _apply_filters(statement, SalaryRollup, filters)
+
+
+def rollups_average_result(row):
+    """Convierte la fila de rollups_average_statement() en (promedio, cantidad)."""
+    salary_sum, salary_count, row_count = row
+    average = salary_sum / salary_count if salary_count else 0
+    return float(average), int(row_count or 0)
+
+
+def salaries_average_statement(**filters):
+    """SELECT AVG/COUNT sobre salaries para los filtros dados."""
+    statement = select(func.avg(Salary.salary_in_usd), func.count(Salary.id))
+    return _apply_filters(statement, Salary, filters)
+
+
+def salaries_average_result(row):
+    """Convierte la fila de salaries_average_statement() en (promedio, cantidad)."""
+    average, sample_size = row
+    return float(average or 0), int(sample_size or 0)
+
+
+def average_from_rollups(**filters):
+    """Devuelve (promedio, cantidad) leyendo solo las filas de salary_rollups que cumplen los filtros."""
+    return rollups_average_result(db.session.execute(rollups_average_statement(**filters)).one())
+
+
+def average_from_salaries(**filters):
+    """Devuelve (promedio, cantidad) agregando directamente la tabla salaries."""
+    return salaries_average_result(db.session.execute(salaries_average_statement(**filters)).one())
+
+
+def consistency_report(rollup, raw):
+    """Compara dos resultados (promedio, cantidad): desde rollups y desde salaries."""
+    rollup_avg, rollup_count = rollup
+    raw_avg, raw_count = raw
+    return {
+        'rollup': {'averageSalary': round(rollup_avg, 2), 'sampleSize': rollup_count},
+        'raw': {'averageSalary': round(raw_avg, 2), 'sampleSize': raw_count},
+        'consistent': rollup_count == raw_count and abs(rollup_avg - raw_avg) < 0.01
+    }
+
+
+def check_consistency(**filters):
+    """Compara la respuesta de los rollups con la de la tabla salaries para los mismos filtros."""
+    return consistency_report(average_from_rollups(**filters), average_from_salaries(**filters))
@@ -0,0 +1,66 @@
+from sqlalchemy.engine import Engine
+
+from app import db
+
+
+def _execute_ddl(bind, statement):
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            connection.exec_driver_sql(statement)
+    else:
+        bind.exec_driver_sql(statement)
+
+
+def ensure_columns(bind=None):
+    """
+    Añade con ALTER TABLE las columnas declaradas en los modelos que no existan
+    en tablas ya creadas y devuelve sus nombres (tabla.columna). Solo cubre
+    columnas que admiten NULL, que es lo que SQLite permite sin recrear la tabla.
+    """
+    bind = bind if bind is not None else db.engine
+    inspector = db.inspect(bind)
+    added = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {col['name'] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                column_type = column.type.compile(dialect=bind.dialect)
+                _execute_ddl(bind, f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+
+def ensure_indexes(bind=None):
+    """
+    Crea los índices declarados en los modelos que todavía no existan y
+    devuelve sus nombres.
+
+    db.create_all() solo crea índices junto con las tablas nuevas; esta función
+    los añade también a tablas que ya existían, así que es seguro llamarla en
+    cada arranque. bind puede ser una conexión con una transacción abierta.
+    """
+    bind = bind if bind is not None else db.engine
+    inspector = db.inspect(bind)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind)
+                created.append(index.name)
+    return created
+
+
+def drop_indexes(table, bind=None):
+    """
+    Elimina los índices declarados de una tabla (si existen). Se usa antes de
+    cargas masivas: reconstruirlos al final con ensure_indexes() es mucho más
+    rápido que mantenerlos fila a fila.
+    """
+    bind = bind if bind is not None else db.engine
+    for index in table.indexes:
+        index.drop(bind, checkfirst=True)
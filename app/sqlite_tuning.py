@@ -0,0 +1,59 @@
+import logging
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Orden en que se aplican los PRAGMA al abrir cada conexión:
+# (clave de config, PRAGMA de SQLite)
+SQLITE_PRAGMAS = (
+    ('SQLITE_BUSY_TIMEOUT_MS', 'busy_timeout'),
+    ('SQLITE_JOURNAL_MODE', 'journal_mode'),
+    ('SQLITE_SYNCHRONOUS', 'synchronous'),
+    ('SQLITE_CACHE_SIZE', 'cache_size'),
+    ('SQLITE_MMAP_SIZE', 'mmap_size'),
+    ('SQLITE_TEMP_STORE', 'temp_store'),
+)
+
+
+def sqlite_pragmas(config):
+    """Lista de (pragma, valor) configurados; los valores None se omiten."""
+    return [(pragma, config[key]) for key, pragma in SQLITE_PRAGMAS if config.get(key) is not None]
+
+
+def _apply_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas:
+                cursor.execute(f'PRAGMA {pragma}={value}')
+        finally:
+            cursor.close()
+    return on_connect
+
+
+def init_sqlite_tuning(app, engine, read_only=False):
+    """
+    Aplica el perfil de rendimiento de SQLite (WAL, synchronous, caché, mmap,
+    busy_timeout, temp_store) a cada conexión nueva del engine.
+
+    Con WAL los lectores no se bloquean detrás de un escritor y busy_timeout
+    hace que los escritores esperen al lock en vez de fallar con
+    "database is locked".
+
+    Con read_only=True se omite journal_mode (no se puede cambiar sin permiso
+    de escritura) y se añade query_only para rechazar cualquier escritura,
+    aunque el perfil esté desactivado.
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    pragmas = sqlite_pragmas(app.config) if app.config.get('SQLITE_TUNING_ENABLED', True) else []
+    if engine.url.database in (None, '', ':memory:'):
+        # WAL y mmap no aplican a bases en memoria
+        pragmas = [(p, v) for p, v in pragmas if p not in ('journal_mode', 'mmap_size')]
+    if read_only:
+        pragmas = [(p, v) for p, v in pragmas if p != 'journal_mode'] + [('query_only', 1)]
+    if not pragmas:
+        return
+    event.listen(engine, 'connect', _apply_pragmas(pragmas))
+    logger.info('sqlite.tuning', extra={'fields': {'read_only': read_only, **dict(pragmas)}})
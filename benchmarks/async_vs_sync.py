@@ -0,0 +1,142 @@
+"""
+Prueba de carga: app Flask (hilos) contra el modo ASGI (app/asgi.py).
+
+Ambas apps se ejecutan en este proceso sobre una copia de data/salarios.db,
+sin servidor HTTP de por medio, para medir solo el modelo de concurrencia:
+la app Flask con --concurrency hilos (como un servidor WSGI con hilos) y la
+app ASGI con --concurrency peticiones en vuelo en un solo event loop.
+La carga mezcla /average-salary con filtros al azar (agregación SQL sin
+rollups ni cubo), /distribution y /filters.
+
+Requiere aiosqlite.
+
+Uso:
+    python benchmarks/async_vs_sync.py --requests 2000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from app import create_app  # noqa: E402
+from app.asgi import create_asgi_app  # noqa: E402
+from app.cli import init_database  # noqa: E402
+from app.services.dimension_registry import dimension_registry  # noqa: E402
+
+
+def build_workload(app, count, seed=7):
+    """Lista de (método, ruta, body) reproducible."""
+    with app.app_context():
+        titles = dimension_registry.names('job_title')
+        locations = dimension_registry.names('location')
+        levels = dimension_registry.names('experience_level')
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(count):
+        kind = rng.random()
+        body = {
+            'area': rng.choice([None, *titles[:20]]),
+            'location': rng.choice([None, *locations[:10]]),
+            'experienceLevel': rng.choice([None, *levels]),
+        }
+        if kind < 0.6:
+            workload.append(('POST', '/api/salaries/average-salary', body))
+        elif kind < 0.8:
+            workload.append(('POST', '/api/salaries/distribution', body))
+        else:
+            workload.append(('GET', '/api/salaries/filters', None))
+    return workload
+
+
+def report(name, latencies, elapsed, errors):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f'  {name:<6} {len(latencies) / elapsed:8.1f} req/s   p50 {statistics.median(latencies) * 1000:7.1f} ms   '
+          f'p95 {p95 * 1000:7.1f} ms   errores {errors}')
+
+
+def run_sync(app, workload, concurrency):
+    def one(item):
+        method, path, body = item
+        client = app.test_client()
+        start = time.perf_counter()
+        response = client.open(path, method=method, json=body)
+        return time.perf_counter() - start, response.status_code >= 400
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, workload))
+    elapsed = time.perf_counter() - start
+    report('flask', [r[0] for r in results], elapsed, sum(r[1] for r in results))
+
+
+async def _asgi_call(app, method, path, body):
+    payload = json.dumps(body).encode() if body is not None else b''
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'headers': []}
+    status = {}
+
+    async def receive():
+        return {'type': 'http.request', 'body': payload, 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            status['code'] = message['status']
+
+    await app(scope, receive, send)
+    return status['code']
+
+
+async def run_async(app, workload, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(item):
+        async with semaphore:
+            start = time.perf_counter()
+            code = await _asgi_call(app, *item)
+            return time.perf_counter() - start, code >= 400
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(item) for item in workload))
+    elapsed = time.perf_counter() - start
+    report('asgi', [r[0] for r in results], elapsed, sum(r[1] for r in results))
+    await app.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=os.path.join(BASE_DIR, 'data', 'salarios.db'))
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    tmp_dir = tempfile.mkdtemp(prefix='async_vs_sync_')
+    db_path = os.path.join(tmp_dir, 'salarios.db')
+    shutil.copy(args.source, db_path)
+    config = {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}', 'METRICS_ENABLED': False,
+              'SALARY_CUBE_ENABLED': False, 'SALARY_ROLLUPS_ENABLED': False}
+    try:
+        flask_app = create_app(config)
+        with flask_app.app_context():
+            init_database()
+        workload = build_workload(flask_app, args.requests)
+        print(f'{args.requests} peticiones, concurrencia {args.concurrency}\n')
+        run_sync(flask_app, workload, args.concurrency)
+        asyncio.run(run_async(create_asgi_app(config), workload, args.concurrency))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
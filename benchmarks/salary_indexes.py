@@ -0,0 +1,118 @@
+"""
+Benchmark de los índices de la tabla salaries.
+
+Copia data/salarios.db a un archivo temporal, multiplica la tabla salaries
+hasta el tamaño pedido y ejecuta las consultas de /average-salary y los DISTINCT
+antes y después de crear los índices declarados en app/models/salary.py,
+mostrando EXPLAIN QUERY PLAN y el tiempo medio de cada una.
+
+Uso:
+    python benchmarks/salary_indexes.py --rows 1000000 --repeat 5
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect  # noqa: E402
+from sqlalchemy.schema import CreateIndex  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.cli import init_database  # noqa: E402
+from app.models.salary import Salary  # noqa: E402
+
+QUERIES = [
+    ('avg job_title+location+level',
+     'SELECT avg(salary_in_usd), count(id) FROM salaries '
+     'WHERE job_title = ? AND location = ? AND experience_level = ?', (9, 1, 2)),
+    ('avg job_title',
+     'SELECT avg(salary_in_usd), count(id) FROM salaries WHERE job_title = ?', (9,)),
+    ('avg location+level',
+     'SELECT avg(salary_in_usd), count(id) FROM salaries WHERE location = ? AND experience_level = ?', (1, 2)),
+    ('avg level',
+     'SELECT avg(salary_in_usd), count(id) FROM salaries WHERE experience_level = ?', (2,)),
+    ('distinct job_title', 'SELECT DISTINCT job_title FROM salaries', ()),
+    ('distinct location', 'SELECT DISTINCT location FROM salaries', ()),
+    ('group by level, location (batch)',
+     'SELECT experience_level, location, sum(salary_in_usd), count(id) FROM salaries '
+     'WHERE job_title = ? GROUP BY experience_level, location', (9,)),
+]
+
+
+def scale_table(conn, rows):
+    """Duplica las filas de salaries hasta alcanzar al menos `rows`."""
+    count = conn.execute('SELECT count(*) FROM salaries').fetchone()[0]
+    while count < rows:
+        conn.execute(
+            'INSERT INTO salaries (year, salary_in_usd, employment_type, job_title, location, '
+            'experience_level, created_date, updated_date) '
+            'SELECT year, salary_in_usd, employment_type, job_title, location, experience_level, '
+            'created_date, updated_date FROM salaries LIMIT ?', (rows - count,)
+        )
+        count = conn.execute('SELECT count(*) FROM salaries').fetchone()[0]
+    conn.commit()
+    return count
+
+
+def run_queries(conn, repeat):
+    for name, sql, params in QUERIES:
+        plan = [row[-1] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f'  {name:<36} {statistics.median(timings):9.2f} ms   {" | ".join(plan)}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=os.path.join(BASE_DIR, 'data', 'salarios.db'))
+    parser.add_argument('--rows', type=int, default=500_000, help='filas de salaries tras escalar')
+    parser.add_argument('--repeat', type=int, default=5, help='repeticiones por consulta (se usa la mediana)')
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='salary_indexes_')
+    db_path = os.path.join(tmp_dir, 'bench.db')
+    shutil.copyfile(args.source, db_path)
+
+    try:
+        # La copia puede venir de una versión anterior del esquema (columnas
+        # del seed incremental, etc.): se actualiza antes de tocar sus índices
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}', 'LOG_LEVEL': 'WARNING'})
+        with app.app_context():
+            init_database()
+            db.engine.dispose()
+
+        conn = sqlite3.connect(db_path)
+        for index in Salary.__table__.indexes:
+            conn.execute(f'DROP INDEX IF EXISTS {index.name}')
+        total = scale_table(conn, args.rows)
+        print(f'Tabla salaries: {total} filas ({db_path})\n')
+
+        print('SIN índices:')
+        run_queries(conn, args.repeat)
+
+        start = time.perf_counter()
+        for index in Salary.__table__.indexes:
+            conn.execute(str(CreateIndex(index).compile(dialect=sqlite_dialect.dialect())))
+        conn.execute('ANALYZE')
+        conn.commit()
+        print(f'\nÍndices creados en {(time.perf_counter() - start):.2f} s\n')
+
+        print('CON índices:')
+        run_queries(conn, args.repeat)
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
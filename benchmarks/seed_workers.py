@@ -0,0 +1,58 @@
+"""
+Benchmark de la etapa de parseo/validación del seed con distintos números de
+procesos.
+
+Genera un CSV grande replicando data/salarios.xlsx y mide cuántas filas por
+segundo produce iter_prepared_batches() para cada valor de --workers. No
+escribe en la base de datos: mide solo el trabajo que se reparte en el pool.
+
+Uso:
+    python benchmarks/seed_workers.py --rows 1000000 --workers 0 1 2 4
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+import pandas as pd  # noqa: E402
+
+from seed_from_excel import iter_prepared_batches  # noqa: E402
+
+
+def build_csv(source, rows, path):
+    df = pd.read_excel(source)
+    copies = -(-rows // len(df))
+    pd.concat([df] * copies, ignore_index=True).head(rows).to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=os.path.join(BASE_DIR, 'data', 'salarios.xlsx'))
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--batch-size', type=int, default=50_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4])
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='seed_workers_')
+    csv_path = os.path.join(tmp_dir, 'salaries.csv')
+    try:
+        build_csv(args.source, args.rows, csv_path)
+        print(f'CSV de prueba: {args.rows} filas ({os.path.getsize(csv_path) / 1e6:.1f} MB)\n')
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            rows = sum(count for _, _, count in
+                       iter_prepared_batches(csv_path, args.batch_size, workers=workers))
+            elapsed = time.perf_counter() - start
+            print(f'  workers={workers:<3} {elapsed:7.2f} s   {rows / elapsed:12,.0f} filas/s')
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark de concurrencia lectura/escritura sobre SQLite.
+
+Copia data/salarios.db a un archivo temporal (una copia por perfil, porque el
+modo WAL queda guardado en el archivo) y durante --seconds segundos lanza
+--readers hilos que leen páginas de /api/salaries/ mientras --writers hilos
+crean salarios con POST /api/salaries/. Compara el perfil por defecto de SQLite
+con el perfil de app/sqlite_tuning.py y cuenta los errores "database is locked".
+
+Uso:
+    python benchmarks/sqlite_concurrency.py --readers 4 --writers 1 --seconds 5
+"""
+import argparse
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from app import create_app, db  # noqa: E402
+from app.cli import init_database  # noqa: E402
+from app.models.salary import Salary  # noqa: E402
+
+PROFILES = {
+    'default': {'SQLITE_TUNING_ENABLED': False},
+    'tuned': {'SQLITE_TUNING_ENABLED': True},
+}
+
+
+def new_salary():
+    """
+    Cuerpo del POST con ids reales de las dimensiones (los de un salario
+    existente): POST /api/salaries/ guarda los valores tal cual en las FK.
+    """
+    template = Salary.query.order_by(Salary.id).first()
+    return {
+        'area': template.employment_type,
+        'location': template.location,
+        'position': template.job_title,
+        'experienceLevel': template.experience_level,
+        'salary': 120000,
+    }
+
+
+def run_profile(name, overrides, source, args):
+    tmp_dir = tempfile.mkdtemp(prefix='sqlite_concurrency_')
+    db_path = os.path.join(tmp_dir, 'salarios.db')
+    shutil.copy(source, db_path)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}', 'LOG_LEVEL': 'WARNING', **overrides})
+
+    with app.app_context():
+        init_database()
+        max_id = db.session.execute(db.text('SELECT MAX(id) FROM salaries')).scalar()
+        journal = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+        payload = new_salary()
+
+    stop = threading.Event()
+    counts = {'reads': 0, 'writes': 0, 'errors': 0, 'locked': 0}
+    lock = threading.Lock()
+
+    def record(response):
+        key = 'reads' if response.request.method == 'GET' else 'writes'
+        body = response.get_data(as_text=True)
+        with lock:
+            # Solo cuentan las respuestas 2xx: un 308 o un 404 no llegó a la base
+            if 200 <= response.status_code < 300:
+                counts[key] += 1
+            else:
+                counts['errors'] += 1
+                counts['locked'] += 'database is locked' in body
+
+    def reader():
+        client = app.test_client()
+        while not stop.is_set():
+            after_id = random.randint(0, max_id)
+            record(client.get(f'/api/salaries/?after_id={after_id}&limit=100'))
+
+    def writer():
+        client = app.test_client()
+        while not stop.is_set():
+            record(client.post('/api/salaries/', json=payload))
+
+    threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+    threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+    try:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        read_only = app.extensions.get('sqlalchemy_read_only')
+        if read_only is not None:
+            read_only.dispose()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(f'  {name:<8} journal={journal:<7} lecturas {counts["reads"] / elapsed:8.1f}/s   '
+          f'escrituras {counts["writes"] / elapsed:7.1f}/s   errores {counts["errors"]} '
+          f'(locked: {counts["locked"]})')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=os.path.join(BASE_DIR, 'data', 'salarios.db'))
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=1)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print(f'{args.readers} lectores, {args.writers} escritores, {args.seconds:g} s por perfil\n')
+    for name, overrides in PROFILES.items():
+        run_profile(name, overrides, args.source, args)
+
+
+if __name__ == '__main__':
+    main()
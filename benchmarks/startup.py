@@ -0,0 +1,60 @@
+"""
+Benchmark del arranque de la aplicación.
+
+Lanza N procesos nuevos y en cada uno mide el tiempo de `import app`, de
+create_app() y de `import main`, y comprueba si se cargaron pandas/openpyxl.
+Importar main no debe tocar la base de datos ni importar las dependencias
+del seed.
+
+Uso:
+    python benchmarks/startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PROBE = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+app.create_app()
+t2 = time.perf_counter()
+import main
+t3 = time.perf_counter()
+print(json.dumps({
+    'import_app': t1 - t0,
+    'create_app': t2 - t1,
+    'import_main': t3 - t2,
+    'heavy_modules': sorted(m for m in ('pandas', 'openpyxl') if m in sys.modules),
+}))
+"""
+
+
+def run_probe():
+    output = subprocess.run([sys.executable, '-c', PROBE], cwd=BASE_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    results = [run_probe() for _ in range(args.runs)]
+    for key in ('import_app', 'create_app', 'import_main'):
+        values = [r[key] * 1000 for r in results]
+        print(f'  {key:<12} mediana {statistics.median(values):8.1f} ms   máx {max(values):8.1f} ms')
+    heavy = sorted({m for r in results for m in r['heavy_modules']})
+    print(f'\n  módulos pesados cargados: {", ".join(heavy) if heavy else "ninguno"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,17 @@
+import argparse
+import hashlib
+import io
+import json
 import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import insert
 
 from app import create_app, db
 from app.models.employmentType import EmploymentType
@@ -10,9 +19,52 @@ from app.models.experienceLevel import ExperienceLevel
 from app.models.jobTitle import JobTitle
 from app.models.location import Location
 from app.models.salary import Salary
+from app.models.seedImport import SeedImport
+from app.services.salary_cube import salary_cube
+from app.services.salary_rollups import rebuild_rollups
+from app.services.dimension_registry import dimension_registry
+from app.services.job_title_search import JOB_TITLE_ALIASES
+from app.services.schema import drop_indexes, ensure_indexes
 
 EXCEL_PATH = os.path.join("data", "salarios.xlsx")
 
+# Filas de salaries por cada executemany
+INSERT_CHUNK_SIZE = 10_000
+
+# Filas por lote al leer el archivo en modo streaming
+STREAM_BATCH_SIZE = 50_000
+
+# Snapshots .npz del dataset ya normalizado (se regeneran si cambia el archivo)
+SNAPSHOT_DIR = os.path.join("data", "cache")
+# Subir si cambia normalize_dataframe, para descartar snapshots viejos
+SNAPSHOT_VERSION = 2
+
+SOURCE_COLUMNS = [
+    "work_year",
+    "salary_in_usd",
+    "employment_type",
+    "experience_level",
+    "job_title",
+    "employee_residence",
+]
+
+NORMALIZED_COLUMNS = [
+    "year",
+    "salary_in_usd",
+    "employment_type",
+    "experience_level",
+    "job_title",
+    "location",
+]
+
+# Columna en salaries -> (modelo de dimensión, columna con el nombre)
+DIMENSION_TABLES = {
+    "employment_type": (EmploymentType, "employment_type"),
+    "experience_level": (ExperienceLevel, "experience_level"),
+    "job_title": (JobTitle, "job_title"),
+    "location": (Location, "location"),
+}
+
 EMPLOYMENT_TYPE_MAP = {
     "FT": "Full-Time",
     "PT": "Part-Time",
@@ -103,17 +155,6 @@ COUNTRY_MAP = {
     "ZA": "South Africa",
 }
 
-JOB_TITLE_ALIASES = {
-    "ML Engineer": "Machine Learning Engineer",
-    "MLOps Engineer": "Machine Learning Operations Engineer",
-    "Finance Data Analyst": "Financial Data Analyst",
-    "BI Analyst": "Business Intelligence Analyst",
-    "BI Data Engineer": "Business Intelligence Data Engineer",
-    "BI Developer": "Business Intelligence Developer",
-    "BI Data Analyst": "Business Intelligence Data Analyst",
-    "Data Modeller": "Data Modeler",
-    "Data DevOps Engineer": "Data Developer Operations Engineer",
-}
 
 
 def clean_spaces(text: str) -> str:
@@ -141,169 +182,671 @@ def normalize_job_title(raw_title: str) -> str:
     return title
 
 
-def get_or_create(model, **kwargs):
+def normalize_dataframe(df):
     """
-    Busca un registro en model con los campos kwargs.
-    Si existe, lo devuelve.
-    Si no existe, lo crea (sin commit).
+    Valida y normaliza el DataFrame del Excel con operaciones vectorizadas.
+
+    Devuelve (normalizado, rechazos): un DataFrame con las columnas year,
+    salary_in_usd, employment_type, experience_level, job_title y location ya
+    traducidas a texto, y un dict motivo -> cantidad de filas descartadas.
+    Cada fila rechazada cuenta solo por el primer motivo que incumple, en el
+    mismo orden de validación que el seed original.
     """
-    instance = model.query.filter_by(**kwargs).first()
-    if instance:
-        return instance
+    # Mismos nombres de columna venga de read_excel, read_csv u openpyxl
+    df = df.rename(columns=lambda column: str(column).strip()).reindex(columns=SOURCE_COLUMNS)
+    rejected = {}
+    valid = pd.Series(True, index=df.index)
+
+    def reject(mask, reason):
+        nonlocal valid
+        mask = mask & valid
+        count = int(mask.sum())
+        if count:
+            rejected[reason] = rejected.get(reason, 0) + count
+        valid &= ~mask
+
+    reject(df.isna().any(axis=1), "datos esenciales faltantes")
+
+    year = pd.to_numeric(df["work_year"], errors="coerce")
+    reject(year.isna(), "work_year inválido")
+
+    salary = pd.to_numeric(df["salary_in_usd"], errors="coerce")
+    reject(salary.isna(), "salary_in_usd inválido")
+
+    emp_type = df["employment_type"].astype(str).str.strip().map(EMPLOYMENT_TYPE_MAP)
+    reject(emp_type.isna(), "employment_type código desconocido")
+
+    exp_level = df["experience_level"].astype(str).str.strip().map(EXPERIENCE_LEVEL_MAP)
+    reject(exp_level.isna(), "experience_level código desconocido")
+
+    # normalize_job_title se aplica una vez por título distinto, no por fila
+    raw_titles = df["job_title"].where(valid)
+    unique_titles = raw_titles.dropna().unique()
+    job_title = raw_titles.map({t: normalize_job_title(t) for t in unique_titles})
+    reject(job_title.isna() | (job_title == ""), "job_title vacío tras normalización")
+
+    residence = df["employee_residence"].astype(str).str.strip()
+    location = residence.map(COUNTRY_MAP).fillna(residence)
+
+    normalized = pd.DataFrame({
+        "year": year[valid].astype("int64").astype(str),
+        "salary_in_usd": salary[valid].astype("int64"),
+        "employment_type": emp_type[valid],
+        "experience_level": exp_level[valid],
+        "job_title": job_title[valid],
+        "location": location[valid],
+    })
+    return normalized, rejected
+
+
+def upsert_dimension(model, attr, names):
+    """
+    Inserta en una sola operación los nombres que aún no existen en la tabla
+    de dimensión y devuelve el mapa completo nombre -> id. No hace commit.
+    """
+    column = getattr(model, attr)
+    existing = dict(db.session.query(column, model.id).all())
+    missing = sorted(set(names) - set(existing))
+    if missing:
+        db.session.execute(insert(model), [{attr: name} for name in missing])
+        existing = dict(db.session.query(column, model.id).all())
+    return existing
+
 
-    instance = model(**kwargs)
-    db.session.add(instance)
-    db.session.flush()
-    return instance
+def file_fingerprint(path, chunk_size=1 << 20):
+    """Devuelve el SHA-256 del archivo fuente, leído por bloques."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
 
-def seed_from_excel():
+def fingerprint_rows(normalized):
     """
-    Función principal que crea el app context y ejecuta el seed
+    Devuelve un hash de contenido (16 hex) por fila normalizada. Usa
+    pd.util.hash_pandas_object, que es vectorizado y estable entre ejecuciones.
     """
-    # Crear la aplicación con configuración SQLite
-    app = create_app()
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///data/salarios.db'
-    
-    with app.app_context():
-        _seed_from_excel()
+    hashes = pd.util.hash_pandas_object(normalized[NORMALIZED_COLUMNS], index=False)
+    return hashes.map("{:016x}".format)
 
 
-def _seed_from_excel():
+def _facts(normalized):
     """
-    Lee el archivo Excel y carga los datos en las tablas:
-    EmploymentType, ExperienceLevel, JobTitle, Location y Salary.
+    Construye las filas de salaries (ids de dimensión, posición en el archivo
+    y huella) a partir del DataFrame normalizado, cuyo índice es la posición
+    de cada fila en el archivo fuente.
+    """
+    facts = normalized[["year", "salary_in_usd"]].copy()
+    for column, (model, attr) in DIMENSION_TABLES.items():
+        id_map = upsert_dimension(model, attr, normalized[column].unique())
+        facts[column] = normalized[column].map(id_map).astype("int64")
+    facts["source_row"] = normalized.index.astype("int64")
+    if "source_hash" in normalized:
+        facts["source_hash"] = normalized["source_hash"]
+    else:
+        facts["source_hash"] = fingerprint_rows(normalized)
+    return facts
+
+
+def _now():
+    # Mismo formato de texto que usa SQLAlchemy para DateTime en SQLite
+    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _executemany(statement, rows, chunk_size=INSERT_CHUNK_SIZE):
+    connection = db.session.connection()
+    for start in range(0, len(rows), chunk_size):
+        connection.exec_driver_sql(statement, rows[start:start + chunk_size])
+
+
+def _insert_facts(facts, chunk_size=INSERT_CHUNK_SIZE):
+    facts = facts.assign(created_date=_now(), updated_date=_now())
+    columns = list(facts.columns)
+    statement = (
+        f"INSERT INTO {Salary.__tablename__} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    rows = list(facts.itertuples(index=False, name=None))
+    _executemany(statement, rows, chunk_size)
+    return len(rows)
+
+
+def bulk_insert_salaries(normalized, chunk_size=INSERT_CHUNK_SIZE):
+    """
+    Traduce los nombres de dimensión a ids y escribe los salarios con
+    executemany del driver en bloques de chunk_size. Devuelve las filas
+    insertadas. No hace commit.
+    """
+    if normalized.empty:
+        return 0
+    return _insert_facts(_facts(normalized), chunk_size)
 
-    IMPORTANTE: esta función asume que YA ESTÁS dentro de app.app_context().
+
+def _occurrences(hashes, seen=None):
     """
-    print(f"Leyendo archivo Excel: {EXCEL_PATH}")
+    Número de aparición de cada huella (0 la primera vez, 1 la segunda, ...)
+    en el orden dado, continuando desde los conteos de seen si se indica.
+    Con (huella, aparición) las filas idénticas repetidas tienen clave única.
+    """
+    occurrence = hashes.groupby(hashes, sort=False).cumcount()
+    if seen:
+        occurrence = occurrence + hashes.map(seen).fillna(0).astype("int64")
+    return occurrence.astype("int64")
 
-    try:
-        df = pd.read_excel(EXCEL_PATH)
-        print("Lectura exitosa del archivo\n")
-    except FileNotFoundError:
-        print("ERROR: El archivo no fue encontrado.")
-        print("Verifica que exista en la carpeta 'data' y que el nombre sea correcto.")
-        return
-    except Exception as e:
-        print("ERROR al leer el archivo Excel:")
-        print(str(e))
+
+class IncrementalSeed:
+    """
+    Importación incremental que identifica cada fila por su contenido.
+
+    La clave de una fila es (source_hash, aparición): quitar o agregar una
+    fila en medio del archivo no afecta a las demás, aunque cambie su
+    posición. Con cada lote (add) las filas cuya clave ya está guardada no se
+    reescriben (solo se actualiza su source_row si cambió de posición) y las
+    demás se acumulan; al terminar (finish):
+
+    - una fila nueva en la misma posición (source_row) que una fila guardada
+      que ya no aparece en el archivo se considera modificada: UPDATE del
+      mismo id;
+    - las demás filas nuevas se insertan;
+    - las filas guardadas cuya clave ya no está en el archivo se borran.
+
+    Como toda fila que sigue en el archivo queda con su posición en esta
+    importación, el source_row guardado es siempre el de la última y la
+    coincidencia por posición no se desfasa de una importación a otra.
+
+    Solo participan las filas cargadas por el seed (con source_hash); las
+    creadas desde la API no se tocan. Las claves guardadas y las filas
+    pendientes se mantienen en memoria hasta finish(). No hace commit.
+    """
+
+    def __init__(self, chunk_size=INSERT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        stored = pd.DataFrame(
+            db.session.query(Salary.id, Salary.source_hash, Salary.source_row)
+            .filter(Salary.source_hash.isnot(None))
+            .order_by(Salary.source_row, Salary.id)
+            .all(),
+            columns=["stored_id", "source_hash", "stored_row"],
+        )
+        stored["occurrence"] = _occurrences(stored["source_hash"])
+        self.stored = stored
+        self.matched = []
+        self.moved = []
+        self.pending = []
+        self.seen = {}
+        self.unchanged = 0
+
+    def add(self, normalized):
+        """Separa las filas del lote que ya están guardadas de las que hay que escribir."""
+        if normalized.empty:
+            return
+        facts = _facts(normalized)
+        facts["occurrence"] = _occurrences(facts["source_hash"], self.seen)
+        for source_hash, count in facts["source_hash"].value_counts().items():
+            self.seen[source_hash] = self.seen.get(source_hash, 0) + int(count)
+
+        merged = facts.merge(self.stored[["source_hash", "occurrence", "stored_id", "stored_row"]],
+                             on=["source_hash", "occurrence"], how="left")
+        is_stored = merged["stored_id"].notna().to_numpy()
+        self.matched.append(merged.loc[is_stored, "stored_id"].astype("int64"))
+        is_moved = is_stored & (merged["source_row"] != merged["stored_row"]).to_numpy()
+        self.moved.append(merged.loc[is_moved, ["source_row", "stored_id"]].astype("int64"))
+        self.pending.append(facts[~is_stored].drop(columns="occurrence"))
+        self.unchanged += int(is_stored.sum())
+
+    def finish(self):
+        """
+        Aplica las actualizaciones, inserciones y borrados pendientes.
+
+        Devuelve (insertadas, actualizadas, sin cambios, borradas).
+        """
+        matched = pd.concat(self.matched) if self.matched else pd.Series(dtype="int64")
+        missing = self.stored[~self.stored["stored_id"].isin(matched)]
+        pending = pd.concat(self.pending) if self.pending else pd.DataFrame()
+
+        moved = pd.concat(self.moved) if self.moved else pd.DataFrame()
+        if not moved.empty:
+            statement = f"UPDATE {Salary.__tablename__} SET source_row = ? WHERE id = ?"
+            _executemany(statement, list(moved.itertuples(index=False, name=None)), self.chunk_size)
+
+        updated = 0
+        if not pending.empty and not missing.empty:
+            by_row = missing.drop_duplicates("stored_row").set_index("stored_row")["stored_id"]
+            stored_id = pending["source_row"].map(by_row)
+            is_changed = stored_id.notna().to_numpy()
+            changed = pending[is_changed].assign(
+                stored_id=stored_id[is_changed].astype("int64").to_numpy(), updated_date=_now()
+            )
+            if not changed.empty:
+                set_columns = ["year", "salary_in_usd", *DIMENSION_TABLES, "source_row", "source_hash", "updated_date"]
+                statement = (
+                    f"UPDATE {Salary.__tablename__} SET {', '.join(f'{c} = ?' for c in set_columns)} WHERE id = ?"
+                )
+                rows = list(changed[set_columns + ["stored_id"]].itertuples(index=False, name=None))
+                _executemany(statement, rows, self.chunk_size)
+                updated = len(changed)
+                missing = missing[~missing["stored_id"].isin(changed["stored_id"])]
+                pending = pending[~is_changed]
+
+        inserted = _insert_facts(pending, self.chunk_size) if not pending.empty else 0
+
+        if not missing.empty:
+            statement = f"DELETE FROM {Salary.__tablename__} WHERE id = ?"
+            _executemany(statement, [(int(id_),) for id_ in missing["stored_id"]], self.chunk_size)
+
+        return inserted, updated, self.unchanged, len(missing)
+
+
+def read_source(path):
+    """Lee el archivo fuente completo (Excel o CSV) en un DataFrame."""
+    if path.lower().endswith(".csv"):
+        return pd.read_csv(path)
+    return pd.read_excel(path)
+
+
+def iter_source_batches(path, batch_size=STREAM_BATCH_SIZE):
+    """
+    Lee el archivo fuente en streaming y produce DataFrames de batch_size filas.
+
+    Los CSV se leen con pd.read_csv(chunksize=...) y los Excel con openpyxl en
+    modo read_only (iter_rows), así que la memoria depende del tamaño del lote
+    y no del archivo.
+    """
+    if path.lower().endswith(".csv"):
+        yield from pd.read_csv(path, chunksize=batch_size)
         return
 
-    print("=== INFO BÁSICA DEL DATASET ===")
-    print(f"Filas: {len(df)}")
-    print(f"Columnas: {len(df.columns)}")
-    print("Columnas:", df.columns.tolist())
-    print()
+    from openpyxl import load_workbook
 
-    total = len(df)
-    insertados = 0
-    saltados = 0
-
-    for idx, row in df.iterrows():
-        try:
-            year_raw = row.get("work_year")
-            salary_raw = row.get("salary_in_usd")
-            emp_type_code = row.get("employment_type")
-            exp_level_code = row.get("experience_level")
-            job_title_raw = row.get("job_title")
-            residence_code = row.get("employee_residence")
-
-            if (
-                pd.isna(year_raw)
-                or pd.isna(salary_raw)
-                or pd.isna(emp_type_code)
-                or pd.isna(exp_level_code)
-                or pd.isna(job_title_raw)
-                or pd.isna(residence_code)
-            ):
-                print(f"Fila {idx}: datos esenciales faltantes, se salta.")
-                saltados += 1
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        # La primera hoja, como pd.read_excel (la activa puede ser otra)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [c if c is not None else "" for c in next(rows, ())]
+        batch, positions = [], []
+        # El índice de cada lote es la posición de la fila en el archivo (source_row)
+        for position, row in enumerate(rows):
+            if all(value is None for value in row):
                 continue
+            batch.append(row)
+            positions.append(position)
+            if len(batch) >= batch_size:
+                yield pd.DataFrame(batch, columns=header, index=positions)
+                batch, positions = [], []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, index=positions)
+    finally:
+        workbook.close()
+
+
+def prepare_batch(df):
+    """
+    Etapa de parseo/validación de un lote: normaliza el DataFrame crudo y
+    calcula la huella de cada fila. No toca la base de datos, así que puede
+    ejecutarse en otro proceso.
 
-            try:
-                year_int = int(year_raw)
-                year = str(year_int)
-            except ValueError:
-                print(f"Fila {idx}: work_year inválido ({year_raw}), se salta.")
-                saltados += 1
-                continue
+    Devuelve (normalizado, rechazos, filas leídas).
+    """
+    normalized, rejected = normalize_dataframe(df)
+    normalized["source_hash"] = fingerprint_rows(normalized)
+    return normalized, rejected, len(df)
 
-            try:
-                salary_in_usd = int(salary_raw)
-            except ValueError:
-                print(f"Fila {idx}: salary_in_usd inválido ({salary_raw}), se salta.")
-                saltados += 1
-                continue
 
-            emp_type_code = str(emp_type_code).strip()
-            emp_type_text = EMPLOYMENT_TYPE_MAP.get(emp_type_code)
-            if emp_type_text is None:
-                print(f"Fila {idx}: employment_type código desconocido ({emp_type_code}), se salta.")
-                saltados += 1
+def iter_csv_records(f):
+    """
+    Recorre un CSV abierto en binario y produce (offset, longitud, en_blanco)
+    por cada registro lógico. Un registro puede ocupar varias líneas si tiene
+    un campo entre comillas con saltos de línea, y está en blanco si solo
+    tiene espacios: pd.read_csv (skip_blank_lines) no lo cuenta como fila.
+    """
+    position = f.tell()
+    start, length, in_quotes, blank = position, 0, False, True
+    for line in f:
+        if not in_quotes and line.strip():
+            blank = False
+        # Las comillas escapadas ("") cambian el estado dos veces
+        in_quotes ^= line.count(b'"') % 2 == 1
+        length += len(line)
+        if not in_quotes:
+            yield start, length, blank
+            start, length, blank = start + length, 0, True
+    if length:
+        yield start, length, blank
+
+
+def csv_chunk_offsets(path, batch_size):
+    """
+    Recorre el CSV una vez en binario y devuelve (cabecera, [(inicio, fin, fila_inicial, filas), ...])
+    con el rango de bytes de cada bloque de batch_size filas. Las filas se
+    cuentan con la misma regla que pd.read_csv (registros entre comillas de
+    varias líneas y líneas en blanco), así fila_inicial coincide con el índice
+    que tendría la fila al leer el archivo completo o en modo streaming.
+    """
+    with open(path, "rb") as f:
+        header = pd.read_csv(f, nrows=0).columns.tolist()
+        f.seek(0)
+        records = iter_csv_records(f)
+        for _, _, blank in records:
+            if not blank:
+                break  # cabecera (read_csv también salta las líneas en blanco previas)
+
+        chunks = []
+        chunk = None  # [inicio, fin, fila_inicial, filas]
+        row = 0
+        for offset, length, blank in records:
+            if blank:
                 continue
+            if chunk is None or chunk[3] == batch_size:
+                chunk = [offset, offset, row, 0]
+                chunks.append(chunk)
+            chunk[1] = offset + length
+            chunk[3] += 1
+            row += 1
+    return header, [tuple(chunk) for chunk in chunks]
 
-            exp_level_code = str(exp_level_code).strip()
-            exp_level_text = EXPERIENCE_LEVEL_MAP.get(exp_level_code)
-            if exp_level_text is None:
-                print(f"Fila {idx}: experience_level código desconocido ({exp_level_code}), se salta.")
-                saltados += 1
-                continue
 
-            job_title = normalize_job_title(job_title_raw)
-            if not job_title:
-                print(f"Fila {idx}: job_title vacío tras normalización, se salta.")
-                saltados += 1
-                continue
+def _prepare_csv_chunk(path, header, start_byte, end_byte, start, nrows):
+    """
+    Tarea del pool: lee solo los bytes [start_byte, end_byte) del CSV, que
+    contienen nrows filas a partir de la fila start, y las prepara.
+    """
+    with open(path, "rb") as f:
+        f.seek(start_byte)
+        data = f.read(end_byte - start_byte)
+    df = pd.read_csv(io.BytesIO(data), header=None, names=header)
+    if len(df) != nrows:
+        raise ValueError(f"El bloque que empieza en la fila {start} tiene {len(df)} filas, se esperaban {nrows}")
+    df.index = pd.RangeIndex(start, start + len(df))
+    return prepare_batch(df)
+
+
+def _bounded_results(tasks, limit):
+    """Consume futures de tasks manteniendo como máximo limit en vuelo y los devuelve en orden."""
+    pending = deque()
+    for task in tasks:
+        pending.append(task)
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_prepared_batches(path, batch_size=STREAM_BATCH_SIZE, workers=0, stream=True):
+    """
+    Produce lotes ya preparados (ver prepare_batch) listos para el escritor.
 
-            residence_code = str(residence_code).strip()
-            location_text = COUNTRY_MAP.get(residence_code, residence_code)
+    Con workers > 0 el parseo y la validación se reparten en un pool de
+    procesos: los CSV se dividen en rangos de bytes que cada proceso lee por
+    su cuenta; los Excel se leen en este proceso (openpyxl no permite saltar a
+    una fila) y los procesos solo normalizan. Como máximo hay 2 * workers
+    lotes en vuelo, así que la memoria sigue acotada.
+    """
+    if workers <= 0:
+        raw_batches = iter_source_batches(path, batch_size) if stream else [read_source(path)]
+        for df in raw_batches:
+            yield prepare_batch(df)
+        return
 
-            employment_type_obj = get_or_create(
-                EmploymentType,
-                employment_type=emp_type_text,
-            )
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if path.lower().endswith(".csv"):
+            header, chunks = csv_chunk_offsets(path, batch_size)
+            tasks = (pool.submit(_prepare_csv_chunk, path, header, start_byte, end_byte, start, nrows)
+                     for start_byte, end_byte, start, nrows in chunks)
+        else:
+            tasks = (pool.submit(prepare_batch, df) for df in iter_source_batches(path, batch_size))
+        yield from _bounded_results(tasks, 2 * workers)
 
-            experience_level_obj = get_or_create(
-                ExperienceLevel,
-                experience_level=exp_level_text,
-            )
 
-            job_title_obj = get_or_create(
-                JobTitle,
-                job_title=job_title,
-            )
+def snapshot_path(path):
+    """Ruta del snapshot normalizado para un archivo fuente."""
+    return os.path.join(SNAPSHOT_DIR, os.path.basename(path) + ".npz")
 
-            location_obj = get_or_create(
-                Location,
-                location=location_text,
-            )
 
-            salary = Salary(
-                year=year,
-                salary_in_usd=salary_in_usd,
-                employment_type=employment_type_obj.id,
-                job_title=job_title_obj.id,
-                location=location_obj.id,
-                experience_level=experience_level_obj.id,
-                created_date=datetime.utcnow(),
-                updated_date=datetime.utcnow(),
-            )
+def save_snapshot(path, file_hash, prepared):
+    """
+    Guarda un lote preparado (prepare_batch) como snapshot columnar .npz.
+
+    Las dimensiones de texto se guardan como códigos enteros + categorías y
+    la cabecera registra ruta, mtime, tamaño y SHA-256 del archivo fuente.
+    """
+    normalized, rejected, row_count = prepared
+    stat = os.stat(path)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "source_path": os.path.abspath(path),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "file_hash": file_hash,
+        "row_count": row_count,
+        "rejected": rejected,
+    }
+    arrays = {
+        "meta": np.array(json.dumps(meta)),
+        "index": normalized.index.to_numpy(dtype=np.int64),
+        "year": normalized["year"].astype(np.int32).to_numpy(),
+        "salary_in_usd": normalized["salary_in_usd"].to_numpy(dtype=np.int64),
+        "source_hash": normalized["source_hash"].to_numpy().astype("S16"),
+    }
+    for column in DIMENSION_TABLES:
+        codes, categories = pd.factorize(normalized[column])
+        arrays[f"{column}_codes"] = codes.astype(np.int32)
+        arrays[f"{column}_categories"] = np.asarray(categories, dtype=str)
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    target = snapshot_path(path)
+    tmp = target + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, target)
+
+
+def load_snapshot(path, file_hash):
+    """
+    Devuelve el lote preparado guardado para path si el snapshot corresponde
+    al mismo archivo (misma ruta y SHA-256) y versión; si no, None.
+    """
+    target = snapshot_path(path)
+    if not os.path.exists(target):
+        return None
+    try:
+        with np.load(target, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if (meta.get("version") != SNAPSHOT_VERSION
+                    or meta.get("source_path") != os.path.abspath(path)
+                    or meta.get("file_hash") != file_hash):
+                return None
+            columns = {
+                "year": data["year"].astype(str),
+                "salary_in_usd": data["salary_in_usd"],
+            }
+            for column in DIMENSION_TABLES:
+                categories = data[f"{column}_categories"].astype(object)
+                columns[column] = categories[data[f"{column}_codes"]]
+            columns["source_hash"] = data["source_hash"].astype(str).astype(object)
+            normalized = pd.DataFrame(columns, index=pd.Index(data["index"]))
+    except (OSError, ValueError, KeyError):
+        return None
+    return normalized[NORMALIZED_COLUMNS + ["source_hash"]], meta["rejected"], meta["row_count"]
+
+
+def load_batches(batches, incremental=False):
+    """
+    Escritor único: aplica a la base cada lote preparado de batches y
+    reconstruye los rollups, informando el progreso en filas por segundo.
+    No hace commit.
+
+    Con incremental=True solo inserta filas nuevas, actualiza las que
+    cambiaron y borra las que ya no están en el archivo (ver IncrementalSeed).
+
+    Devuelve (total, insertados, actualizados, borrados, rechazos).
+    """
+    # Con la tabla vacía es más rápido crear los índices después de la carga
+    connection = db.session.connection()
+    rebuild_indexes = db.session.query(Salary.id).first() is None
+    if rebuild_indexes:
+        drop_indexes(Salary.__table__, bind=connection)
 
-            db.session.add(salary)
-            insertados += 1
+    total = 0
+    insertados = 0
+    actualizados = 0
+    borrados = 0
+    incremental_seed = IncrementalSeed() if incremental else None
+    rejected = {}
+    started = time.perf_counter()
+    for normalized, batch_rejected, row_count in batches:
+        if incremental:
+            incremental_seed.add(normalized)
+        else:
+            insertados += bulk_insert_salaries(normalized)
+        total += row_count
+        for reason, count in batch_rejected.items():
+            rejected[reason] = rejected.get(reason, 0) + count
+        elapsed = time.perf_counter() - started
+        print(f"  {total} filas procesadas ({total / elapsed:,.0f} filas/s)")
+
+    if incremental:
+        insertados, actualizados, _, borrados = incremental_seed.finish()
+
+    if rebuild_indexes:
+        ensure_indexes(bind=connection)
+    rebuild_rollups()
+    return total, insertados, actualizados, borrados, rejected
+
+
+def seed_from_excel(path=EXCEL_PATH, stream=False, batch_size=STREAM_BATCH_SIZE, incremental=False, workers=0):
+    """
+    Función principal que crea el app context y ejecuta el seed
+    """
+    # Crear la aplicación con configuración SQLite
+    app = create_app()
+    
+    with app.app_context():
+        _seed_from_excel(path, stream=stream, batch_size=batch_size, incremental=incremental, workers=workers)
+
+
+def print_rejected_summary(rejected):
+    """Imprime cuántas filas se descartaron por cada motivo."""
+    for reason, count in sorted(rejected.items(), key=lambda item: -item[1]):
+        print(f"  - {reason}: {count}")
+
+
+def _seed_from_excel(path=EXCEL_PATH, stream=False, batch_size=STREAM_BATCH_SIZE, incremental=False, workers=0):
+    """
+    Lee el archivo Excel (o CSV) y carga los datos en las tablas:
+    EmploymentType, ExperienceLevel, JobTitle, Location y Salary.
+
+    La validación es vectorizada, cada tabla de dimensión se actualiza una sola
+    vez por lote y los salarios se insertan con executemany por bloques. Con
+    stream=True el archivo se lee por lotes de batch_size filas y la memoria
+    queda acotada por el tamaño del lote.
+
+    Con incremental=True la carga se omite si el archivo no cambió desde la
+    última importación (mismo SHA-256); si cambió, las filas se comparan por
+    su contenido (huella) y solo se insertan las nuevas, se actualizan las
+    modificadas y se borran las que ya no están en el archivo.
+
+    Con workers > 0 el parseo y la validación corren en un pool de procesos y
+    este proceso solo escribe en SQLite (implica lectura por lotes).
+
+    En el modo normal (sin stream ni workers) el dataset normalizado se guarda
+    como snapshot .npz en data/cache y las siguientes cargas del mismo archivo
+    lo usan en lugar de volver a parsear el Excel.
+
+    IMPORTANTE: esta función asume que YA ESTÁS dentro de app.app_context().
+    """
+    print(f"Leyendo archivo: {path}")
+
+    if not os.path.exists(path):
+        print("ERROR: El archivo no fue encontrado.")
+        print("Verifica que exista en la carpeta 'data' y que el nombre sea correcto.")
+        return
+
+    file_hash = file_fingerprint(path)
+    if incremental:
+        last_import = SeedImport.query.filter_by(source_path=os.path.abspath(path)) \
+            .order_by(SeedImport.id.desc()).first()
+        if last_import is not None and last_import.file_hash == file_hash:
+            print("El archivo no cambió desde la última importación → no se hace nada.")
+            return
+        if SeedImport.query.first() is None and db.session.query(Salary.id).first() is not None:
+            print("ERROR: la tabla 'salaries' tiene datos cargados sin huellas de fila.")
+            print("La importación incremental necesita una primera carga completa sobre una base vacía.")
+            return
+
+    if workers > 0:
+        print(f"Modo paralelo: {workers} procesos, lotes de {batch_size} filas\n")
+        batches = iter_prepared_batches(path, batch_size, workers=workers)
+    elif stream:
+        print(f"Modo streaming: lotes de {batch_size} filas\n")
+        batches = iter_prepared_batches(path, batch_size)
+    else:
+        prepared = load_snapshot(path, file_hash)
+        if prepared is not None:
+            print(f"Usando snapshot normalizado: {snapshot_path(path)}\n")
+        else:
+            try:
+                df = read_source(path)
+                print("Lectura exitosa del archivo\n")
+            except Exception as e:
+                print("ERROR al leer el archivo:")
+                print(str(e))
+                return
+
+            print("=== INFO BÁSICA DEL DATASET ===")
+            print(f"Filas: {len(df)}")
+            print(f"Columnas: {len(df.columns)}")
+            print("Columnas:", df.columns.tolist())
+            print()
+            prepared = prepare_batch(df)
+            try:
+                save_snapshot(path, file_hash, prepared)
+            except OSError as e:
+                print(f"Aviso: no se pudo guardar el snapshot ({e})")
+        batches = [prepared]
+
+    try:
+        total, insertados, actualizados, borrados, rejected = load_batches(batches, incremental=incremental)
+        db.session.add(SeedImport(
+            source_path=os.path.abspath(path),
+            file_hash=file_hash,
+            row_count=total,
+            inserted=insertados,
+            updated=actualizados,
+            deleted=borrados
+        ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print("ERROR durante la carga:")
+        print(str(e))
+        return
 
-        except Exception as e:
-            print(f"Error en fila {idx}: {e}")
-            saltados += 1
+    dimension_registry.invalidate()
+    salary_cube.invalidate()
 
-    db.session.commit()
+    saltados = sum(rejected.values())
     print("\nSeed completado")
-    print(f"Total filas en Excel: {total}")
+    print(f"Total filas en el archivo: {total}")
     print(f"Registros de Salary insertados: {insertados}")
+    if incremental:
+        print(f"Registros de Salary actualizados: {actualizados}")
+        print(f"Registros de Salary borrados (ya no están en el archivo): {borrados}")
+        print(f"Filas sin cambios: {total - saltados - insertados - actualizados}")
     print(f"Filas saltadas por errores/validación: {saltados}")
+    print_rejected_summary(rejected)
 
 
 if __name__ == '__main__':
     # Para ejecutar el seed directamente
-    seed_from_excel()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Carga el Excel/CSV de salarios en la base de datos")
+    parser.add_argument("path", nargs="?", default=EXCEL_PATH, help="archivo .xlsx o .csv")
+    parser.add_argument("--stream", action="store_true", help="leer el archivo por lotes (memoria acotada)")
+    parser.add_argument("--batch-size", type=int, default=STREAM_BATCH_SIZE, help="filas por lote en modo streaming")
+    parser.add_argument("--incremental", action="store_true",
+                        help="insertar filas nuevas, actualizar las modificadas y borrar las que ya no están")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="procesos para parsear y validar en paralelo (0 = sin pool)")
+    args = parser.parse_args()
+    seed_from_excel(args.path, stream=args.stream, batch_size=args.batch_size,
+                    incremental=args.incremental, workers=args.workers)
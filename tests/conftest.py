@@ -0,0 +1,86 @@
+import csv
+import random
+
+import pytest
+
+from app import create_app, db
+from app.cli import init_database
+from app.services import salary_analytics
+from app.services.dimension_registry import dimension_registry
+from app.services.salary_cube import salary_cube
+
+JOB_TITLES = ['Data Engineer', 'Data Scientist', 'ML Engineer', 'BI Analyst', 'Research Engineer']
+RESIDENCES = ['US', 'ES', 'AR', 'DE']
+SOURCE_HEADER = ['work_year', 'salary_in_usd', 'employment_type', 'experience_level',
+                 'job_title', 'employee_residence']
+
+
+def reset_caches():
+    """Los cachés de proceso sobreviven entre apps: se vacían entre tests."""
+    dimension_registry.invalidate()
+    salary_cube.invalidate()
+    salary_analytics._filters_cache.clear()
+
+
+def make_app(path, **config):
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', **config})
+    with app.app_context():
+        init_database()
+    reset_caches()
+    return app
+
+
+def dispose(app):
+    with app.app_context():
+        db.engine.dispose()
+    read_only = app.extensions.get('sqlalchemy_read_only')
+    if read_only is not None:
+        read_only.dispose()
+    reset_caches()
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path / 'test.db')
+    yield app
+    dispose(app)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def source_rows(count, seed=0):
+    """Filas válidas del Excel/CSV de origen (mismas columnas que data/salarios.xlsx)."""
+    rng = random.Random(seed)
+    return [
+        [
+            rng.choice([2021, 2022, 2023, 2024]),
+            rng.randrange(30_000, 250_000),
+            rng.choice(['FT', 'PT', 'CT', 'FL']),
+            rng.choice(['EN', 'MI', 'SE', 'EX']),
+            rng.choice(JOB_TITLES),
+            rng.choice(RESIDENCES),
+        ]
+        for _ in range(count)
+    ]
+
+
+def write_csv(path, rows, header=SOURCE_HEADER):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+@pytest.fixture
+def seeded_app(app, tmp_path):
+    """app con 200 salarios cargados por el seed (modo streaming: no escribe snapshots)."""
+    import seed_from_excel
+
+    with app.app_context():
+        seed_from_excel._seed_from_excel(str(write_csv(tmp_path / 'seed.csv', source_rows(200))), stream=True)
+    reset_caches()
+    return app
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+pytest.importorskip('aiosqlite')
+
+from app.asgi import AsyncSalaryApp, create_asgi_app  # noqa: E402
+from app.services import dimension_registry as registry_module  # noqa: E402
+from app.services.dimension_registry import dimension_registry  # noqa: E402
+
+
+async def _call(app, method, path, body=None, headers=()):
+    """Ejecuta una petición HTTP contra la app ASGI y devuelve (status, headers, body)."""
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query.encode(),
+        'headers': [(k.lower().encode(), v.encode()) for k, v in headers],
+    }
+    payload = json.dumps(body).encode() if body is not None else b''
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': payload, 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start, body_message = messages
+    response_headers = {k.decode(): v.decode() for k, v in start['headers']}
+    return start['status'], response_headers, body_message['body']
+
+
+def _create_elsewhere(database, title, salary=None):
+    """Escribe como la app Flask de otro proceso: directo en el archivo, sin tocar el registro."""
+    with sqlite3.connect(database) as conn:
+        job_title = conn.execute('INSERT INTO job_titles (job_title) VALUES (?)', (title,)).lastrowid
+        if salary is not None:
+            conn.execute(
+                'INSERT INTO salaries (year, salary_in_usd, job_title, location, experience_level, employment_type) '
+                'SELECT year, ?, ?, location, experience_level, employment_type FROM salaries WHERE id = 1',
+                (salary, job_title)
+            )
+
+
+def _run(seeded_app, ttl, scenario):
+    uri = seeded_app.config['SQLALCHEMY_DATABASE_URI']
+
+    async def main():
+        app = create_asgi_app({'SQLALCHEMY_DATABASE_URI': uri, 'ASGI_DIMENSION_TTL': ttl})
+        try:
+            await scenario(app, uri.removeprefix('sqlite:///'))
+        finally:
+            await app.engine.dispose()
+
+    asyncio.run(main())
+
+
+def test_filters_etag_changes_after_ttl(seeded_app):
+    async def scenario(app, database):
+        status, headers, body = await _call(app, 'GET', '/api/salaries/filters')
+        assert status == 200
+        etag = headers['etag']
+
+        _create_elsewhere(database, 'Quantum Engineer')
+        status, headers, body = await _call(app, 'GET', '/api/salaries/filters', headers=[('If-None-Match', etag)])
+
+        assert status == 200
+        assert headers['etag'] != etag
+        assert 'Quantum Engineer' in json.loads(body)['areas']
+
+    _run(seeded_app, 0, scenario)
+
+
+def test_unchanged_dimensions_keep_the_etag(seeded_app):
+    async def scenario(app, database):
+        _, headers, _ = await _call(app, 'GET', '/api/salaries/filters')
+        status, _, _ = await _call(app, 'GET', '/api/salaries/filters', headers=[('If-None-Match', headers['etag'])])
+        assert status == 304
+
+    _run(seeded_app, 0, scenario)
+
+
+def test_unknown_name_reloads_instead_of_dropping_the_filter(seeded_app, monkeypatch):
+    monkeypatch.setattr(registry_module, 'MISS_RELOAD_INTERVAL', 0)
+
+    async def scenario(app, database):
+        await _call(app, 'GET', '/api/salaries/filters')
+        _create_elsewhere(database, 'Quantum Engineer', salary=500000)
+
+        # TTL largo: sin la relectura por nombre desconocido el filtro se perdería
+        status, _, body = await _call(app, 'POST', '/api/salaries/average-salary', {'area': 'Quantum Engineer'})
+
+        assert status == 200
+        assert json.loads(body)['sampleSize'] == 1
+
+    _run(seeded_app, 3600, scenario)
+
+
+@pytest.mark.parametrize('path', [
+    '/api/salaries/?fields=id,salary_in_usd,job_title',
+    '/api/salaries/?fields=salary_in_usd,location&after_id=20&limit=15',
+    '/api/locations/?fields=location',
+    '/api/salaries/?fields=nope',
+])
+def test_fields_match_the_flask_routes(seeded_app, path):
+    expected = seeded_app.test_client().get(path)
+
+    async def scenario(app, database):
+        status, _, body = await _call(app, 'GET', path)
+        assert status == expected.status_code
+        assert json.loads(body) == expected.get_json()
+
+    _run(seeded_app, 0, scenario)
+
+
+def test_compression_and_304_match_the_flask_routes(seeded_app):
+    seeded_app.config['COMPRESSION_MIN_SIZE'] = 0
+    client = seeded_app.test_client()
+    flask_200 = client.get('/api/salaries/filters', headers={'Accept-Encoding': 'gzip'})
+    flask_304 = client.get('/api/salaries/filters', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': flask_200.headers['ETag'],
+    })
+
+    async def scenario(app, database):
+        app.config['COMPRESSION_MIN_SIZE'] = 0
+        gzip_headers = [('Accept-Encoding', 'gzip')]
+        status, headers, body = await _call(app, 'GET', '/api/salaries/filters', headers=gzip_headers)
+        assert status == 200
+        assert headers['content-encoding'] == 'gzip'
+        assert headers['etag'] == flask_200.headers['ETag']
+        assert headers['vary'] == 'Accept-Encoding'
+        assert body == flask_200.get_data()
+
+        status, headers, body = await _call(app, 'GET', '/api/salaries/filters',
+                                            headers=[*gzip_headers, ('If-None-Match', headers['etag'])])
+        assert (status, body) == (flask_304.status_code, b'') == (304, b'')
+        assert headers['etag'] == flask_304.headers['ETag']
+        assert headers['vary'] == 'Accept-Encoding'
+        assert 'content-encoding' not in headers
+
+    _run(seeded_app, 0, scenario)
+
+
+def test_cold_registry_fails_instead_of_querying_synchronously(seeded_app, monkeypatch):
+    async def skip_preload(self, session, dimensions=(), force=False):
+        return None
+
+    monkeypatch.setattr(AsyncSalaryApp, 'load_dimensions', skip_preload)
+
+    async def scenario(app, database):
+        dimension_registry.invalidate()
+        status, _, body = await _call(app, 'GET', '/api/salaries/filters')
+        assert status == 500
+        assert 'no está cargada' in json.loads(body)['error']
+
+    _run(seeded_app, 0, scenario)
@@ -0,0 +1,57 @@
+import gzip
+
+import pytest
+
+
+@pytest.fixture
+def compressing_app(seeded_app):
+    # Umbral 0: la respuesta de /filters de prueba es más chica que el de producción
+    seeded_app.config['COMPRESSION_MIN_SIZE'] = 0
+    return seeded_app
+
+
+def test_gzipped_filters_get_a_weak_etag_and_vary(compressing_app):
+    response = compressing_app.test_client().get('/api/salaries/filters', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'].startswith('W/')
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert b'areas' in gzip.decompress(response.get_data())
+
+
+def test_304_repeats_the_validators_of_the_compressed_200(compressing_app):
+    client = compressing_app.test_client()
+    first = client.get('/api/salaries/filters', headers={'Accept-Encoding': 'gzip'})
+
+    response = client.get('/api/salaries/filters', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag'],
+    })
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.headers['ETag'] == first.headers['ETag']
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_uncompressed_304_keeps_the_strong_etag(compressing_app):
+    client = compressing_app.test_client()
+    first = client.get('/api/salaries/filters', headers={'Accept-Encoding': 'identity'})
+    assert not first.headers['ETag'].startswith('W/')
+
+    response = client.get('/api/salaries/filters', headers={
+        'Accept-Encoding': 'identity', 'If-None-Match': first.headers['ETag'],
+    })
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == first.headers['ETag']
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_small_responses_are_not_compressed(seeded_app):
+    response = seeded_app.test_client().get('/api/roles/', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
@@ -0,0 +1,75 @@
+import pytest
+
+from app import db
+from app.models.jobTitle import JobTitle
+from app.models.salary import Salary
+from app.services import dimension_registry as registry_module
+from app.services.dimension_registry import dimension_registry
+
+
+def _create_elsewhere(app, title, salary=None):
+    """Crea un título (y opcionalmente un salario) como otro proceso: sin invalidar el registro."""
+    with app.app_context():
+        job_title = JobTitle(job_title=title)
+        db.session.add(job_title)
+        db.session.flush()
+        if salary is not None:
+            template = db.session.get(Salary, 1)
+            db.session.add(Salary(year='2024', salary_in_usd=salary, job_title=job_title.id,
+                                  location=template.location, experience_level=template.experience_level,
+                                  employment_type=template.employment_type))
+        db.session.commit()
+        return job_title.id
+
+
+@pytest.fixture
+def no_reload_interval(monkeypatch):
+    monkeypatch.setattr(registry_module, 'MISS_RELOAD_INTERVAL', 0)
+
+
+def test_id_for_reloads_once_on_miss(seeded_app, no_reload_interval):
+    with seeded_app.app_context():
+        assert dimension_registry.names('job_title')
+        version = dimension_registry.version
+    id_ = _create_elsewhere(seeded_app, 'Quantum Engineer')
+
+    with seeded_app.app_context():
+        assert dimension_registry.id_for('job_title', 'Quantum Engineer') == id_
+        assert dimension_registry.version == version + 1
+        assert dimension_registry.id_for('job_title', 'Does Not Exist') is None
+        assert dimension_registry.version == version + 1
+
+
+def test_miss_reloads_are_rate_limited(seeded_app, monkeypatch):
+    reloads = []
+    monkeypatch.setattr(dimension_registry, 'reload', lambda dimension: reloads.append(dimension))
+    with seeded_app.app_context():
+        dimension_registry.names('job_title')
+        for _ in range(5):
+            assert dimension_registry.id_for('job_title', 'Does Not Exist') is None
+    # Recién cargada: no se vuelve a consultar dentro de MISS_RELOAD_INTERVAL
+    assert reloads == []
+
+
+def test_average_salary_filters_by_title_created_elsewhere(seeded_app, no_reload_interval):
+    client = seeded_app.test_client()
+    client.get('/api/salaries/filters')  # carga el registro
+    _create_elsewhere(seeded_app, 'Quantum Engineer', salary=500000)
+
+    body = client.post('/api/salaries/average-salary', json={'area': 'Quantum Engineer'}).get_json()
+
+    assert body['sampleSize'] == 1
+    assert body['averageSalary'] == 500000
+
+
+def test_bulk_accepts_title_created_elsewhere(seeded_app, no_reload_interval):
+    client = seeded_app.test_client()
+    client.get('/api/salaries/filters')
+    _create_elsewhere(seeded_app, 'Quantum Engineer')
+
+    response = client.post('/api/salaries/bulk', json=[{
+        'area': 'Full-Time', 'position': 'Quantum Engineer', 'location': 'United States',
+        'experienceLevel': 'Senior', 'salary': 100000,
+    }])
+
+    assert response.status_code == 201, response.get_json()
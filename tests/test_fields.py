@@ -0,0 +1,84 @@
+import pytest
+
+from app import db
+from app.models.role import Role
+from app.models.salary import Salary
+from app.models.user import User
+
+
+@pytest.fixture
+def fields_app(seeded_app):
+    with seeded_app.app_context():
+        role = Role(role='analyst')
+        db.session.add(role)
+        db.session.flush()
+        for i in range(3):
+            # Contraseña sin hashear: set_password haría el fixture lento y aquí no se usa
+            db.session.add(User(name=f'User {i}', email=f'user{i}@example.com', password='x', role_id=role.id))
+        db.session.commit()
+    return seeded_app
+
+
+@pytest.mark.parametrize('url, fields', [
+    ('/api/salaries/', ['salary_in_usd', 'job_title', 'location']),
+    ('/api/salaries/', ['id', 'created_date', 'experience_level', 'employment_type', 'year']),
+    ('/api/users/', ['email', 'role', 'created_date']),
+    ('/api/locations/', ['location']),
+    ('/api/jobTitles/', ['id', 'job_title']),
+])
+def test_fields_match_full_representation(fields_app, url, fields):
+    client = fields_app.test_client()
+
+    response = client.get(f"{url}?fields={','.join(fields)}")
+
+    assert response.status_code == 200
+    full = client.get(url).get_json()
+    assert response.get_json() == [{name: item[name] for name in fields} for item in full]
+    assert 'password' not in response.get_data(as_text=True)
+
+
+def test_fields_are_trimmed_and_deduplicated(fields_app):
+    response = fields_app.test_client().get('/api/salaries/?fields= id ,salary_in_usd,id,')
+
+    rows = response.get_json()
+    assert response.status_code == 200
+    assert len(rows) == 200
+    assert all(list(row) == ['id', 'salary_in_usd'] for row in rows)
+
+
+@pytest.mark.parametrize('url', ['/api/salaries/', '/api/users/', '/api/locations/', '/api/jobTitles/'])
+@pytest.mark.parametrize('fields, message', [
+    ('', 'El parámetro fields está vacío'),
+    (',,', 'El parámetro fields está vacío'),
+    ('id,password', 'Campos no soportados'),
+])
+def test_invalid_fields(fields_app, url, fields, message):
+    response = fields_app.test_client().get(f'{url}?fields={fields}')
+
+    assert response.status_code == 400
+    assert response.get_json()['message'].startswith(message)
+
+
+def test_fields_with_pagination(fields_app):
+    client = fields_app.test_client()
+    with fields_app.app_context():
+        ids = [id for (id,) in db.session.query(Salary.id).order_by(Salary.id)]
+
+    rows = []
+    cursor = 0
+    while cursor is not None:
+        page = client.get(f'/api/salaries/?fields=salary_in_usd,job_title&after_id={cursor}&limit=64').get_json()
+        assert all(list(row) == ['salary_in_usd', 'job_title'] for row in page['data'])
+        assert page['limit'] == 64
+        rows.extend(page['data'])
+        cursor = page['next_cursor']
+        assert cursor is None or cursor in ids
+
+    full = client.get('/api/salaries/').get_json()
+    assert rows == [{'salary_in_usd': s['salary_in_usd'], 'job_title': s['job_title']} for s in full]
+
+
+def test_fields_with_invalid_pagination(fields_app):
+    response = fields_app.test_client().get('/api/salaries/?fields=id&limit=0')
+
+    assert response.status_code == 400
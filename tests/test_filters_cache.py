@@ -0,0 +1,67 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def test_filters_have_a_strong_etag_and_answer_304(seeded_app):
+    client = seeded_app.test_client()
+    response = client.get('/api/salaries/filters')
+
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert not etag.startswith('W/')
+    assert response.headers['Cache-Control'] == 'public, no-cache'
+    assert set(response.get_json()) == {'areas', 'locations', 'positions', 'experienceLevels'}
+
+    cached = client.get('/api/salaries/filters', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b''
+    assert cached.headers['ETag'] == etag
+
+    other = client.get('/api/salaries/filters', headers={'If-None-Match': '"otro"'})
+    assert other.status_code == 200
+
+
+def test_etag_changes_when_a_dimension_changes(seeded_app):
+    client = seeded_app.test_client()
+    etag = client.get('/api/salaries/filters').headers['ETag']
+
+    assert client.post('/api/jobTitles/', json={'job_title': 'Quantum Engineer'}).status_code == 201
+    response = client.get('/api/salaries/filters', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert 'Quantum Engineer' in response.get_json()['areas']
+
+
+def test_gzipped_filters_answer_304_to_their_weak_etag(seeded_app):
+    seeded_app.config['COMPRESSION_MIN_SIZE'] = 0
+    client = seeded_app.test_client()
+    response = client.get('/api/salaries/filters', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    etag = response.headers['ETag']
+
+    cached = client.get('/api/salaries/filters', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == etag
+    # Un cliente sin gzip que tenía la versión comprimida también recibe 304 (comparación débil)
+    plain = client.get('/api/salaries/filters', headers={'If-None-Match': etag})
+    assert plain.status_code == 304
+
+
+def test_cached_filters_run_no_sql(seeded_app):
+    client = seeded_app.test_client()
+    first = client.get('/api/salaries/filters').get_data()
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', count)
+    try:
+        second = client.get('/api/salaries/filters').get_data()
+    finally:
+        event.remove(Engine, 'before_cursor_execute', count)
+
+    assert second == first
+    assert statements == []
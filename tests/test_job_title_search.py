@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import func
+
+from app import db
+from app.models.jobTitle import JobTitle
+from app.models.salary import Salary
+from app.services.job_title_search import MAX_SEARCH_LIMIT
+
+
+def _counts(app):
+    with app.app_context():
+        return dict(db.session.query(JobTitle.job_title, func.count(Salary.id))
+                    .outerjoin(Salary, Salary.job_title == JobTitle.id).group_by(JobTitle.job_title).all())
+
+
+def _search(client, query):
+    response = client.get(f'/api/jobTitles/search?{query}')
+    assert response.status_code == 200
+    return response.get_json()['results']
+
+
+def test_prefix_of_any_word_ranked_by_salary_count(seeded_app):
+    counts = _counts(seeded_app)
+
+    results = _search(seeded_app.test_client(), 'q=ENGIN')
+
+    expected = sorted(['Data Engineer', 'Machine Learning Engineer', 'Research Engineer'],
+                      key=lambda name: (-counts[name], name))
+    assert [r['job_title'] for r in results] == expected
+    assert [r['sampleSize'] for r in results] == [counts[name] for name in expected]
+    assert all(r['alias'] is None for r in results)
+
+
+@pytest.mark.parametrize('q, title, alias', [
+    ('ml', 'Machine Learning Engineer', 'ML Engineer'),
+    ('machine  learn', 'Machine Learning Engineer', None),
+    ('BI', 'Business Intelligence Analyst', 'BI Analyst'),
+    ('intelligence', 'Business Intelligence Analyst', None),
+])
+def test_aliases(seeded_app, q, title, alias):
+    results = _search(seeded_app.test_client(), f'q={q}')
+
+    assert [(r['job_title'], r['alias']) for r in results] == [(title, alias)]
+
+
+def test_no_matches(seeded_app):
+    assert _search(seeded_app.test_client(), 'q=astro') == []
+
+
+def test_limit(seeded_app):
+    client = seeded_app.test_client()
+    for i in range(MAX_SEARCH_LIMIT + 5):
+        assert client.post('/api/jobTitles/', json={'job_title': f'Data Role {i}'}).status_code == 201
+
+    assert len(_search(client, 'q=data')) == 10
+    assert len(_search(client, 'q=data&limit=3')) == 3
+    assert len(_search(client, 'q=data&limit=1000')) == MAX_SEARCH_LIMIT
+
+
+@pytest.mark.parametrize('query, message', [
+    ('', 'El parámetro q es requerido'),
+    ('q=%20%20', 'El parámetro q es requerido'),
+    ('q=data&limit=diez', 'El parámetro limit debe ser un entero'),
+    ('q=data&limit=0', 'El parámetro limit debe ser mayor que 0'),
+])
+def test_invalid_parameters(seeded_app, query, message):
+    response = seeded_app.test_client().get(f'/api/jobTitles/search?{query}')
+
+    assert response.status_code == 400
+    assert response.get_json()['message'] == message
+
+
+def test_new_job_title_rebuilds_index(seeded_app):
+    client = seeded_app.test_client()
+    assert _search(client, 'q=astro') == []
+
+    assert client.post('/api/jobTitles/', json={'job_title': 'Astronaut'}).status_code == 201
+
+    results = _search(client, 'q=astro')
+    assert [(r['job_title'], r['sampleSize']) for r in results] == [('Astronaut', 0)]
+
+
+def test_counts_refresh_after_ttl(seeded_app):
+    seeded_app.config['JOB_TITLE_SEARCH_TTL'] = 0
+    client = seeded_app.test_client()
+    before = _search(client, 'q=research')[0]['sampleSize']
+    with seeded_app.app_context():
+        salary = Salary.query.join(JobTitle, Salary.job_title == JobTitle.id) \
+            .filter(JobTitle.job_title == 'Research Engineer').first()
+        db.session.add(Salary(year=salary.year, salary_in_usd=1, employment_type=salary.employment_type,
+                              job_title=salary.job_title, location=salary.location,
+                              experience_level=salary.experience_level))
+        db.session.commit()
+
+    assert _search(client, 'q=research')[0]['sampleSize'] == before + 1
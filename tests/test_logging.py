@@ -0,0 +1,44 @@
+import json
+import logging
+
+from app.logging_config import JsonFormatter
+from conftest import dispose, make_app
+
+
+class _Lines(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(JsonFormatter())
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+def _record(fields):
+    record = logging.LogRecord('app.test', logging.WARNING, __file__, 1, 'test.event', None, None)
+    record.fields = fields
+    return json.loads(JsonFormatter().format(record))
+
+
+def test_fields_do_not_overwrite_reserved_keys():
+    entry = _record({'level': 6, 'event': 'other', 'rows': 3})
+
+    assert entry['level'] == 'WARNING'
+    assert entry['event'] == 'test.event'
+    assert (entry['field_level'], entry['field_event'], entry['rows']) == (6, 'other', 3)
+
+
+def test_compression_log_keeps_the_log_level(tmp_path):
+    handler = _Lines()
+    logger = logging.getLogger('app')
+    logger.addHandler(handler)
+    try:
+        app = make_app(tmp_path / 'test.db', COMPRESSION_LEVEL=9)
+    finally:
+        logger.removeHandler(handler)
+    dispose(app)
+
+    entry = next(line for line in handler.lines if line['event'] == 'compression.enabled')
+    assert entry['level'] == 'INFO'
+    assert entry['gzip_level'] == 9
@@ -0,0 +1,47 @@
+import gzip
+import re
+
+import pytest
+
+from app.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _counter(name, endpoint):
+    match = re.search(rf'^{name}{{endpoint="{endpoint}"}} (\d+)$', metrics.render_prometheus(), re.M)
+    return int(match.group(1)) if match else None
+
+
+@pytest.mark.parametrize('export_format, header_lines', [('ndjson', 0), ('csv', 1)])
+def test_streamed_export_records_rows_and_bytes(seeded_app, export_format, header_lines):
+    response = seeded_app.test_client().get(f'/api/salaries/export?format={export_format}')
+    body = response.get_data()
+    response.close()
+
+    assert response.status_code == 200
+    assert body.count(b'\n') == 200 + header_lines
+    assert _counter('db_rows_fetched_total', 'salary_bp.export_salaries') == 200
+    assert _counter('http_response_bytes_total', 'salary_bp.export_salaries') == len(body)
+
+
+def test_streamed_bytes_are_the_compressed_ones(seeded_app):
+    response = seeded_app.test_client().get('/api/salaries/export', headers={'Accept-Encoding': 'gzip'})
+    body = response.get_data()
+    response.close()
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(body).count(b'\n') == 200
+    assert _counter('http_response_bytes_total', 'salary_bp.export_salaries') == len(body)
+
+
+def test_buffered_responses_are_still_recorded_after_the_request(seeded_app):
+    response = seeded_app.test_client().get('/api/salaries/?limit=10')
+
+    assert response.status_code == 200
+    assert _counter('http_response_bytes_total', 'salary_bp.get_salaries') == len(response.get_data())
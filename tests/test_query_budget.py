@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import db
+from app.models.role import Role
+from app.models.user import User
+from app.query_budget import QueryBudgetExceeded, query_budget
+
+# Peticiones por endpoint con @query_budget: cada variante (?fields=, paginado...) cuenta
+REQUESTS = {
+    'user_bp.get_users': ['/api/users/', '/api/users/?fields=id,email,role'],
+    'role_bp.get_roles': ['/api/roles/'],
+    'location_bp.get_locations': ['/api/locations/', '/api/locations/?fields=id,location'],
+    'job_title_bp.get_job_titles': ['/api/jobTitles/', '/api/jobTitles/?fields=id,job_title'],
+    'job_title_bp.search_job_titles': ['/api/jobTitles/search?q=data', '/api/jobTitles/search?q=ml&limit=3'],
+    'experience_level_bp.get_experience_levels': ['/api/experienceLevels/'],
+    'employment_type_bp.get_employment_types': ['/api/employmentTypes/'],
+    'salary_bp.get_salaries': ['/api/salaries/', '/api/salaries/?after_id=50&limit=20',
+                               '/api/salaries/?fields=id,salary_in_usd,job_title'],
+    'salary_bp.get_filter_options': ['/api/salaries/filters'],
+}
+
+
+@pytest.fixture
+def budget_app(seeded_app):
+    """seeded_app con varios roles y usuarios: las relaciones N+1 se notan con más de una fila."""
+    with seeded_app.app_context():
+        roles = [Role(role=name) for name in ('admin', 'analyst', 'viewer')]
+        db.session.add_all(roles)
+        db.session.flush()
+        for i in range(12):
+            # Contraseña sin hashear: set_password haría el fixture lento y aquí no se usa
+            db.session.add(User(name=f'User {i}', email=f'user{i}@example.com', password='x',
+                                role_id=roles[i % 3].id))
+        db.session.commit()
+    return seeded_app
+
+
+def _budgeted_endpoints(app):
+    return {endpoint: view.query_budget for endpoint, view in app.view_functions.items()
+            if hasattr(view, 'query_budget')}
+
+
+def test_every_budgeted_endpoint_is_covered(budget_app):
+    assert set(_budgeted_endpoints(budget_app)) == set(REQUESTS)
+
+
+@pytest.mark.parametrize('endpoint, url', [(e, url) for e, urls in REQUESTS.items() for url in urls])
+def test_endpoint_stays_within_its_budget(budget_app, endpoint, url):
+    budget = _budgeted_endpoints(budget_app)[endpoint]
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Las lecturas van al engine de solo lectura: se escucha en la clase Engine
+    event.listen(Engine, 'before_cursor_execute', count)
+    try:
+        # Con TESTING, superar el presupuesto lanza QueryBudgetExceeded aquí mismo
+        response = budget_app.test_client().get(url)
+    finally:
+        event.remove(Engine, 'before_cursor_execute', count)
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert statements, 'el endpoint no ejecutó ninguna sentencia: el contador no está escuchando'
+    assert len(statements) <= budget
+
+
+def test_over_budget_view_raises_with_the_sql(budget_app):
+    @query_budget(1)
+    def n_plus_one():
+        return {'users': [u.to_dict() for u in User.query.order_by(User.id).limit(2).all()]}
+
+    budget_app.add_url_rule('/test/n-plus-one', 'n_plus_one', n_plus_one)
+
+    with pytest.raises(QueryBudgetExceeded) as excinfo:
+        budget_app.test_client().get('/test/n-plus-one')
+
+    error = excinfo.value
+    assert (error.endpoint, error.budget) == ('n_plus_one', 1)
+    assert len(error.statements) > 1
+    message = str(error)
+    assert f'ejecutó {len(error.statements)} consultas (presupuesto: 1)' in message
+    assert all(sql in message for sql in error.statements)
+    assert 'FROM users' in message and 'FROM roles' in message
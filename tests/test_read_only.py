@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app import db
+from app.models.salary import Salary
+from conftest import dispose, make_app
+
+
+@pytest.fixture
+def engines(seeded_app):
+    """Sentencias ejecutadas en cada engine durante el test: {'write': [...], 'read': [...]}."""
+    with seeded_app.app_context():
+        write_engine = db.engine
+    read_engine = seeded_app.extensions['sqlalchemy_read_only']
+    statements = {'write': [], 'read': []}
+    listeners = []
+    for name, engine in (('write', write_engine), ('read', read_engine)):
+        def listener(conn, cursor, statement, *args, name=name):
+            statements[name].append(statement)
+        event.listen(engine, 'before_cursor_execute', listener)
+        listeners.append((engine, listener))
+    yield statements
+    for engine, listener in listeners:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+
+def _new_salary(app):
+    with app.app_context():
+        template = db.session.get(Salary, 1)
+        return {'area': template.employment_type, 'location': template.location,
+                'position': template.job_title, 'experienceLevel': template.experience_level,
+                'salary': 120000}
+
+
+@pytest.mark.parametrize('url', ['/api/salaries/?limit=10', '/api/salaries/1', '/api/salaries/filters',
+                                 '/api/locations/', '/api/jobTitles/search?q=data'])
+def test_gets_run_on_the_read_only_engine(seeded_app, engines, url):
+    assert seeded_app.test_client().get(url).status_code == 200
+
+    assert engines['read']
+    assert engines['write'] == []
+
+
+def test_read_only_post_runs_on_the_read_only_engine(seeded_app, engines):
+    response = seeded_app.test_client().post('/api/salaries/average-salary', json={'area': 'Data Engineer'})
+
+    assert response.status_code == 200
+    assert engines['read']
+    assert engines['write'] == []
+
+
+def test_writes_run_on_the_write_engine(seeded_app, engines):
+    payload = _new_salary(seeded_app)
+    client = seeded_app.test_client()
+
+    assert client.post('/api/salaries/', json=payload).status_code == 201
+    assert client.put('/api/salaries/1', json={'salary_in_usd': 5}).status_code == 200
+    assert client.delete('/api/salaries/2').status_code == 204
+
+    assert any(sql.startswith('INSERT INTO salaries') for sql in engines['write'])
+    assert any(sql.startswith('UPDATE salaries') for sql in engines['write'])
+    assert any(sql.startswith('DELETE FROM salaries') for sql in engines['write'])
+    assert not any(sql.split()[0] in ('INSERT', 'UPDATE', 'DELETE') for sql in engines['read'])
+
+
+@pytest.mark.parametrize('tuning', [True, False])
+def test_read_only_engine_rejects_writes(tmp_path, tuning):
+    app = make_app(tmp_path / 'ro.db', SQLITE_TUNING_ENABLED=tuning)
+    try:
+        engine = app.extensions['sqlalchemy_read_only']
+        assert 'mode=ro' in str(engine.url)
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql('PRAGMA query_only').scalar() == 1
+            with pytest.raises(OperationalError):
+                connection.exec_driver_sql("INSERT INTO roles (role) VALUES ('x')")
+    finally:
+        dispose(app)
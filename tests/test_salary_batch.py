@@ -0,0 +1,80 @@
+import pytest
+
+from app.services import salary_batch
+
+COMBINATIONS = [
+    {},
+    {'area': 'Data Engineer'},
+    {'area': 'Data Scientist', 'location': 'United States'},
+    {'location': 'Spain', 'experienceLevel': 'Senior'},
+    {'area': 'Machine Learning Engineer', 'location': 'Germany', 'experienceLevel': 'Junior'},
+    {'area': 'Astronaut'},
+]
+
+
+def _single(client, combination):
+    response = client.post('/api/salaries/average-salary', json=combination)
+    assert response.status_code == 200
+    result = response.get_json()
+    return result['averageSalary'], result['sampleSize']
+
+
+def test_combinations_match_single_average(seeded_app):
+    client = seeded_app.test_client()
+
+    response = client.post('/api/salaries/average-salary/batch', json={'combinations': COMBINATIONS})
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['filters'] for r in results] == COMBINATIONS
+    for combination, result in zip(COMBINATIONS, results):
+        if combination.get('area') == 'Astronaut':
+            # Un nombre inexistente es una celda vacía (/average-salary lo ignoraría)
+            assert (result['averageSalary'], result['sampleSize']) == (0, 0)
+            continue
+        average, sample_size = _single(client, combination)
+        assert result['sampleSize'] == sample_size
+        assert result['averageSalary'] == pytest.approx(average, abs=0.01)
+    assert results[0]['sampleSize'] == 200
+
+
+def test_group_by_matches_single_average(seeded_app):
+    client = seeded_app.test_client()
+    body = {'groupBy': ['experienceLevel', 'location'], 'filters': {'area': 'Data Engineer'}}
+
+    response = client.post('/api/salaries/average-salary/batch', json=body)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert results
+    for result in results:
+        combination = {'area': 'Data Engineer', **result['group']}
+        average, sample_size = _single(client, combination)
+        assert result['sampleSize'] == sample_size > 0
+        assert result['averageSalary'] == pytest.approx(average, abs=0.01)
+    assert sum(r['sampleSize'] for r in results) == _single(client, {'area': 'Data Engineer'})[1]
+
+
+def test_group_by_year(seeded_app):
+    response = seeded_app.test_client().post('/api/salaries/average-salary/batch', json={'groupBy': ['year']})
+
+    results = response.get_json()['results']
+    assert {r['group']['year'] for r in results} <= {'2021', '2022', '2023', '2024'}
+    assert sum(r['sampleSize'] for r in results) == 200
+
+
+@pytest.mark.parametrize('body', [
+    {},
+    {'combinations': 'todas'},
+    {'combinations': [{'area': 'Data Engineer'}, 'x']},
+    {'combinations': [{'company': 'Acme'}]},
+    {'combinations': [{}] * (salary_batch.MAX_BATCH_COMBINATIONS + 1)},
+    {'groupBy': []},
+    {'groupBy': ['company']},
+    {'groupBy': ['location'], 'filters': {'company': 'Acme'}},
+])
+def test_invalid_requests(seeded_app, body):
+    response = seeded_app.test_client().post('/api/salaries/average-salary/batch', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['message']
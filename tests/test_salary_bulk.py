@@ -0,0 +1,149 @@
+import pytest
+
+from app import db
+from app.models.salary import Salary
+from app.models.salaryRollup import SalaryRollup
+from app.services import salary_rollups
+
+ROW = {'area': 'Full-Time', 'position': 'Data Engineer', 'location': 'United States',
+       'experienceLevel': 'Senior', 'salary': 100000}
+
+
+@pytest.fixture
+def client(seeded_app):
+    seeded_app.config['SALARY_ROLLUPS_ENABLED'] = True
+    return seeded_app.test_client()
+
+
+def _assert_rollups_match(app):
+    """Cada grupo de salary_rollups es igual al GROUP BY de salaries (y no sobra ninguno)."""
+    with app.app_context():
+        columns = [getattr(SalaryRollup, col) for col in salary_rollups.ROLLUP_COLUMNS]
+        stored = set(db.session.query(*columns).all())
+        raw = set(db.session.execute(salary_rollups._aggregate()).all())
+        assert stored == raw
+
+
+def _count(app, *conditions):
+    with app.app_context():
+        return db.session.query(Salary).filter(*conditions).count()
+
+
+def _ids(app, **filters):
+    with app.app_context():
+        return [id_ for (id_,) in db.session.query(Salary.id).filter_by(**filters).order_by(Salary.id).all()]
+
+
+def test_bulk_insert_reports_invalid_rows_by_index(client, seeded_app):
+    rows = [ROW, {**ROW, 'salary': -5}, 'nope', {**ROW, 'position': 'Astronaut', 'area': None},
+            {**ROW, 'position': 'data engineer', 'year': 2023}]
+
+    response = client.post('/api/salaries/bulk', json={'rows': rows})
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['inserted'] == 2
+    assert body['errors'] == [
+        {'index': 1, 'errors': {'salary': 'Debe ser un número positivo'}},
+        {'index': 2, 'errors': {'row': 'La fila debe ser un objeto'}},
+        {'index': 3, 'errors': {'area': 'Campo requerido', 'position': "'Astronaut' no existe en job_title"}},
+    ]
+    assert _count(seeded_app) == 202
+    _assert_rollups_match(seeded_app)
+
+
+@pytest.mark.parametrize('payload, message', [
+    ({'rows': []}, 'El arreglo de filas está vacío'),
+    ({'rows': {'area': 'x'}}, 'Se espera un arreglo de filas'),
+    (None, 'Se espera un arreglo de filas'),
+])
+def test_bulk_insert_rejects_the_whole_request(client, seeded_app, payload, message):
+    response = client.post('/api/salaries/bulk', json=payload)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'message': message}
+    assert _count(seeded_app) == 200
+
+
+def test_bulk_insert_with_only_invalid_rows_is_a_400(client, seeded_app):
+    response = client.post('/api/salaries/bulk', json=[{**ROW, 'salary': 'mucho'}])
+
+    assert response.status_code == 400
+    assert response.get_json()['inserted'] == 0
+    assert response.get_json()['errors'] == [{'index': 0, 'errors': {'salary': 'Debe ser un número positivo'}}]
+    assert _count(seeded_app) == 200
+
+
+@pytest.mark.parametrize('method', ['PATCH', 'DELETE'])
+@pytest.mark.parametrize('payload, message', [
+    ({}, 'Se requiere ids o filter'),
+    ({'filter': {}}, 'Se requiere ids o filter'),
+    ({'ids': []}, 'ids debe ser un arreglo no vacío de enteros'),
+    ({'ids': [1, '2']}, 'ids debe ser un arreglo no vacío de enteros'),
+    ({'ids': [], 'filter': {'year': '2024'}}, 'ids debe ser un arreglo no vacío de enteros'),
+    ({'filter': {'salary': 1}}, "Filtros no soportados: ['salary']"),
+    ({'filter': {'jobTitle': 'Astronaut'}}, "jobTitle: 'Astronaut' no existe en job_title"),
+    ({'filter': {'createdFrom': 'ayer'}}, 'createdFrom: se espera una fecha ISO 8601'),
+])
+def test_empty_or_invalid_selection_is_rejected(client, seeded_app, method, payload, message):
+    response = client.open('/api/salaries/', method=method, json={**payload, 'set': {'salary': 1}})
+
+    assert response.status_code == 400
+    assert response.get_json()['message'].startswith(message)
+    assert _count(seeded_app) == 200
+    assert _count(seeded_app, Salary.salary_in_usd == 1) == 0
+
+
+@pytest.mark.parametrize('changes, message', [
+    (None, 'Se requiere set con al menos un campo'),
+    ({}, 'Se requiere set con al menos un campo'),
+    ({'id': 3}, "Campos no soportados: ['id']"),
+    ({'salary': 0}, 'salary: debe ser un número positivo'),
+    ({'year': 1800}, 'year: debe ser un año entre 1900'),
+])
+def test_bulk_update_rejects_invalid_changes(client, changes, message):
+    response = client.patch('/api/salaries/', json={'ids': [1], 'set': changes})
+
+    assert response.status_code == 400
+    assert response.get_json()['message'].startswith(message)
+
+
+def test_bulk_update_by_filter_keeps_rollups_in_sync(client, seeded_app):
+    selected = _count(seeded_app, Salary.year == '2022')
+
+    response = client.patch('/api/salaries/', json={
+        'filter': {'year': '2022', 'jobTitle': 'data scientist'},
+        'set': {'salary': 123456, 'location': 'Spain'},
+    })
+
+    assert response.status_code == 200
+    affected = response.get_json()['affected']
+    assert 0 < affected < selected
+    assert _count(seeded_app, Salary.salary_in_usd == 123456) == affected
+    _assert_rollups_match(seeded_app)
+
+
+def test_bulk_update_moving_rows_to_another_year(client, seeded_app):
+    ids = _ids(seeded_app)[:30]
+
+    response = client.patch('/api/salaries/', json={'ids': ids, 'set': {'year': 2020}})
+
+    assert response.get_json() == {'message': 'Salarios actualizados exitosamente', 'affected': 30}
+    assert _count(seeded_app, Salary.year == '2020') == 30
+    _assert_rollups_match(seeded_app)
+
+
+def test_bulk_delete_by_ids_and_filter(client, seeded_app):
+    ids = _ids(seeded_app, year='2021')
+
+    response = client.delete('/api/salaries/', json={'ids': ids[:5] + [99999]})
+    assert response.get_json()['affected'] == 5
+    _assert_rollups_match(seeded_app)
+
+    response = client.delete('/api/salaries/', json={'filter': {'year': '2021'}})
+    assert response.get_json()['affected'] == len(ids) - 5
+    assert _count(seeded_app, Salary.year == '2021') == 0
+    _assert_rollups_match(seeded_app)
+
+    consistency = client.post('/api/salaries/average-salary', json={'consistencyCheck': True}).get_json()
+    assert consistency['consistency']['consistent'] is True
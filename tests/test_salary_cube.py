@@ -0,0 +1,92 @@
+from app import db
+from app.models.salary import Salary
+from app.services.salary_cube import SalaryCube
+
+
+def _add_salary(amount):
+    template = db.session.get(Salary, 1)
+    salary = Salary(year='2024', salary_in_usd=amount, job_title=template.job_title,
+                    location=template.location, experience_level=template.experience_level,
+                    employment_type=template.employment_type)
+    db.session.add(salary)
+    db.session.commit()
+    return salary
+
+
+class _WriteAfterRead:
+    """Query de load() que, después de leer, simula otra petición que escribe y parchea el cubo."""
+
+    def __init__(self, query, write):
+        self.query = query
+        self.write = write
+
+    def order_by(self, *args):
+        return _WriteAfterRead(self.query.order_by(*args), self.write)
+
+    def all(self):
+        rows = self.query.all()
+        self.write()
+        return rows
+
+
+def test_write_during_load_is_not_lost(seeded_app, monkeypatch):
+    cube = SalaryCube()
+    with seeded_app.app_context():
+        real_query = db.session.query
+
+        def write():
+            monkeypatch.setattr(db.session, 'query', real_query)
+            cube.apply_upsert(_add_salary(999_999))
+
+        monkeypatch.setattr(db.session, 'query', lambda *args: _WriteAfterRead(real_query(*args), write))
+
+        assert cube.load() is False
+        assert cube.average()[1] == 201
+        assert 999_999 in cube.values()
+
+
+def test_invalidate_during_load_is_not_lost(seeded_app, monkeypatch):
+    cube = SalaryCube()
+    with seeded_app.app_context():
+        real_query = db.session.query
+
+        def write():
+            monkeypatch.setattr(db.session, 'query', real_query)
+            _add_salary(999_999)
+            cube.invalidate()
+
+        monkeypatch.setattr(db.session, 'query', lambda *args: _WriteAfterRead(real_query(*args), write))
+
+        assert cube.load() is False
+        assert cube.average()[1] == 201
+
+
+def test_writes_from_other_workers_show_up_after_the_ttl(seeded_app):
+    cube = SalaryCube()
+    with seeded_app.app_context():
+        assert cube.average()[1] == 200
+        _add_salary(999_999)  # otro worker: no parchea este cubo
+
+        assert cube.average()[1] == 200
+        seeded_app.config['SALARY_CUBE_TTL'] = 0
+        assert cube.average()[1] == 201
+
+
+def test_inserts_grow_the_arrays_in_amortized_steps(seeded_app):
+    cube = SalaryCube()
+    with seeded_app.app_context():
+        assert cube.load() is True
+        reallocations, buffer = 0, cube.ids
+        for amount in range(1, 301):
+            cube.apply_upsert(_add_salary(amount))
+            if cube.ids is not buffer:
+                reallocations, buffer = reallocations + 1, cube.ids
+
+        assert reallocations == 1
+        assert cube.size == 500
+        assert cube.average()[1] == 500
+        assert sorted(cube.values())[:3] == [1, 2, 3]
+
+        cube.apply_delete(cube.ids[cube.size - 1])
+        assert cube.average()[1] == 499
+        assert 300 not in cube.values()
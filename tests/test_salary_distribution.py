@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from app import db
+from app.models.jobTitle import JobTitle
+from app.models.salary import Salary
+
+
+def _values(app, job_title=None):
+    with app.app_context():
+        query = db.session.query(Salary.salary_in_usd).join(JobTitle, Salary.job_title == JobTitle.id)
+        if job_title:
+            query = query.filter(JobTitle.job_title == job_title)
+        return np.array([amount for (amount,) in query.all()], dtype=np.float64)
+
+
+@pytest.mark.parametrize('cube', [False, True])
+@pytest.mark.parametrize('area', [None, 'Data Engineer'])
+def test_percentiles_and_histogram_match_numpy(seeded_app, cube, area):
+    seeded_app.config['SALARY_CUBE_ENABLED'] = cube
+    body = {'bins': 8, **({'area': area} if area else {})}
+
+    response = seeded_app.test_client().post('/api/salaries/distribution', json=body)
+
+    assert response.status_code == 200
+    result = response.get_json()
+    values = _values(seeded_app, area)
+    assert 0 < result['sampleSize'] == values.size
+    for p in (10, 25, 50, 75, 90):
+        assert result['percentiles'][f'p{p}'] == pytest.approx(np.percentile(values, p), abs=0.01)
+    assert (result['min'], result['max']) == (values.min(), values.max())
+    counts, edges = np.histogram(values, bins=8)
+    assert result['histogram']['counts'] == counts.tolist()
+    assert result['histogram']['binEdges'] == pytest.approx(edges, abs=0.01)
+    assert sum(result['histogram']['counts']) == values.size
+    assert result['filters']['jobTitle'] == area
+
+
+def test_no_matching_rows(seeded_app):
+    client = seeded_app.test_client()
+    assert client.post('/api/jobTitles/', json={'job_title': 'Astronaut'}).status_code == 201
+
+    response = client.post('/api/salaries/distribution', json={'area': 'Astronaut'})
+
+    result = response.get_json()
+    assert response.status_code == 200
+    assert result['sampleSize'] == 0
+    assert result['percentiles']['p50'] is None
+    assert result['histogram'] == {'binEdges': [], 'counts': []}
+
+
+@pytest.mark.parametrize('bins', [0, 201, 'muchos'])
+def test_invalid_bins(seeded_app, bins):
+    response = seeded_app.test_client().post('/api/salaries/distribution', json={'bins': bins})
+
+    assert response.status_code == 400
+    assert response.get_json()['message'].startswith('El campo bins')
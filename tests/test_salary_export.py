@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.routes import salary_routes
+
+
+@pytest.fixture(params=[1000, 7])
+def batch_size(request, monkeypatch):
+    """Tamaño de lote por defecto y uno que no divide a 200 filas (último lote incompleto)."""
+    monkeypatch.setattr(salary_routes, 'EXPORT_BATCH_SIZE', request.param)
+    return request.param
+
+
+def _expected(app):
+    return app.test_client().get('/api/salaries/').get_json()
+
+
+def test_ndjson_export_has_every_row(seeded_app, batch_size):
+    response = seeded_app.test_client().get('/api/salaries/export')
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=salaries.ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert rows == _expected(seeded_app)
+
+
+def test_csv_export_has_a_header_and_every_row(seeded_app, batch_size):
+    response = seeded_app.test_client().get('/api/salaries/export?format=CSV')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    reader = csv.DictReader(io.StringIO(response.get_data(as_text=True)))
+    assert reader.fieldnames == salary_routes.EXPORT_COLUMNS
+    rows = list(reader)
+    expected = _expected(seeded_app)
+    assert len(rows) == len(expected) == 200
+    assert [int(row['id']) for row in rows] == [row['id'] for row in expected]
+    assert all(row['job_title'] == e['job_title'] and int(row['salary_in_usd']) == e['salary_in_usd']
+               for row, e in zip(rows, expected))
+
+
+def test_empty_table_exports_only_the_csv_header(app):
+    response = app.test_client().get('/api/salaries/export?format=csv')
+
+    assert response.get_data(as_text=True).splitlines() == [','.join(salary_routes.EXPORT_COLUMNS)]
+    assert app.test_client().get('/api/salaries/export').get_data() == b''
+
+
+def test_unsupported_format(seeded_app):
+    response = seeded_app.test_client().get('/api/salaries/export?format=xml')
+
+    assert response.status_code == 400
+    assert response.get_json() == {'message': 'Formato no soportado, usa ndjson o csv'}
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import db
+from app.models.salary import Salary
+
+
+def test_pages_walk_the_whole_table_in_id_order(seeded_app):
+    client = seeded_app.test_client()
+    full = client.get('/api/salaries/').get_json()
+
+    pages, cursor = [], 0
+    while cursor is not None:
+        page = client.get(f'/api/salaries/?after_id={cursor}&limit=64').get_json()
+        assert page['limit'] == 64
+        assert len(page['data']) <= 64
+        pages.extend(page['data'])
+        cursor = page['next_cursor']
+
+    assert pages == full
+    assert [row['id'] for row in full] == sorted(row['id'] for row in full)
+    assert len(full) == 200
+
+
+def test_rows_match_the_orm_serialization(seeded_app):
+    page = seeded_app.test_client().get('/api/salaries/?limit=5').get_json()
+
+    with seeded_app.app_context():
+        expected = [db.session.get(Salary, row['id']).to_dict() for row in page['data']]
+    assert page['data'] == expected
+    assert page['next_cursor'] == page['data'][-1]['id']
+
+
+def test_last_page_has_no_cursor(seeded_app):
+    page = seeded_app.test_client().get('/api/salaries/?after_id=190&limit=50').get_json()
+
+    assert [row['id'] for row in page['data']] == list(range(191, 201))
+    assert page['next_cursor'] is None
+
+
+@pytest.mark.parametrize('query', ['limit=0', 'limit=abc', 'after_id=x'])
+def test_invalid_page_parameters(seeded_app, query):
+    response = seeded_app.test_client().get(f'/api/salaries/?{query}')
+
+    assert response.status_code == 400
+    assert 'message' in response.get_json()
+
+
+def test_limit_is_capped(seeded_app):
+    page = seeded_app.test_client().get('/api/salaries/?limit=100000').get_json()
+
+    assert page['limit'] == 1000
+
+
+def test_a_page_is_one_query_with_the_dimensions_joined(seeded_app):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    client = seeded_app.test_client()
+    event.listen(Engine, 'before_cursor_execute', count)
+    try:
+        response = client.get('/api/salaries/?limit=100')
+    finally:
+        event.remove(Engine, 'before_cursor_execute', count)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert statements[0].count('LEFT OUTER JOIN') == 4
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+
+from app import db
+from app.models.salary import Salary
+from app.models.salaryRollup import SalaryRollup
+from app.services import salary_rollups
+
+
+@pytest.fixture
+def rollups_app(seeded_app):
+    seeded_app.config['SALARY_ROLLUPS_ENABLED'] = True
+    return seeded_app
+
+
+def _template(app):
+    with app.app_context():
+        salary = db.session.get(Salary, 1)
+        return salary_rollups.snapshot(salary)
+
+
+def _group(app, key):
+    """(row_count, salary_sum, salary_min, salary_max) del grupo de key, o None."""
+    with app.app_context():
+        rollup = SalaryRollup.query.filter(*salary_rollups._group_filter(SalaryRollup, key)).first()
+        return None if rollup is None else (rollup.row_count, rollup.salary_sum, rollup.salary_min, rollup.salary_max)
+
+
+def _raw_group(app, key):
+    with app.app_context():
+        amounts = [amount for (amount,) in db.session.query(Salary.salary_in_usd)
+                   .filter(*salary_rollups._group_filter(Salary, key)).all()]
+        return (len(amounts), sum(amounts), min(amounts), max(amounts)) if amounts else None
+
+
+def _consistency(client):
+    response = client.post('/api/salaries/average-salary', json={'consistencyCheck': True})
+    assert response.status_code == 200
+    return response.get_json().get('consistency')
+
+
+def _new_salary(key, amount):
+    return {'area': key['employment_type'], 'location': key['location'], 'position': key['job_title'],
+            'experienceLevel': key['experience_level'], 'salary': amount}
+
+
+def test_post_put_delete_keep_the_group_in_sync(rollups_app):
+    client = rollups_app.test_client()
+    key = _template(rollups_app)
+    key['year'] = str(datetime.now().year)  # POST guarda el año actual
+    before = _group(rollups_app, key) or (0, 0, None, None)
+
+    response = client.post('/api/salaries/', json=_new_salary(key, 999_999))
+    assert response.status_code == 201
+    new_id = response.get_json()['data']['id']
+    after_post = _group(rollups_app, key)
+    assert after_post[:2] == (before[0] + 1, before[1] + 999_999)
+    assert after_post[3] == 999_999
+    assert after_post == _raw_group(rollups_app, key)
+
+    assert client.put(f'/api/salaries/{new_id}', json={'salary_in_usd': 1}).status_code == 200
+    assert _group(rollups_app, key) == _raw_group(rollups_app, key)
+    assert _group(rollups_app, key)[2] == 1
+
+    assert client.delete(f'/api/salaries/{new_id}').status_code == 204
+    assert _group(rollups_app, key) == _raw_group(rollups_app, key)
+    assert (_group(rollups_app, key) or (0, 0))[:2] == before[:2]
+    assert _consistency(client)['consistent'] is True
+
+
+def test_put_moving_a_row_to_another_group(rollups_app):
+    client = rollups_app.test_client()
+    source = _template(rollups_app)
+    target = {**source, 'year': '1999'}
+
+    assert client.put('/api/salaries/1', json={'year': '1999'}).status_code == 200
+
+    assert _group(rollups_app, source) == _raw_group(rollups_app, source)
+    assert _group(rollups_app, target) == _raw_group(rollups_app, target) == (1, source['salary_in_usd'],
+                                                                           source['salary_in_usd'],
+                                                                           source['salary_in_usd'])
+    assert _consistency(client)['consistent'] is True
+
+
+def test_put_rejects_a_non_numeric_salary(rollups_app):
+    response = rollups_app.test_client().put('/api/salaries/1', json={'salary_in_usd': 'abc'})
+
+    assert response.status_code == 400
+    assert 'salary_in_usd' in response.get_json()['message']
+
+
+def test_disabled_rollups_are_not_maintained_and_rebuilt_when_enabled(seeded_app):
+    client = seeded_app.test_client()
+    key = _template(seeded_app)
+    key['year'] = str(datetime.now().year)
+    before = _group(seeded_app, key)
+
+    assert client.post('/api/salaries/', json=_new_salary(key, 999_999)).status_code == 201
+    assert client.delete('/api/salaries/2').status_code == 204
+    assert _group(seeded_app, key) == before
+    assert _consistency(client) is None
+
+    seeded_app.config['SALARY_ROLLUPS_ENABLED'] = True
+    assert _consistency(client)['consistent'] is True
+    assert _group(seeded_app, key) == _raw_group(seeded_app, key)
@@ -0,0 +1,129 @@
+import pytest
+
+import seed_from_excel
+from app import db
+from app.models.salary import Salary
+from app.models.seedImport import SeedImport
+from conftest import source_rows, write_csv
+
+MODES = [{}, {'stream': True, 'batch_size': 50}, {'workers': 2, 'batch_size': 50}]
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_DIR', str(tmp_path / 'cache'))
+
+
+def _seed(app, path, **options):
+    with app.app_context():
+        seed_from_excel._seed_from_excel(str(path), **options)
+        return SeedImport.query.order_by(SeedImport.id.desc()).first().to_dict()
+
+
+def _rows(app):
+    """id -> (salary_in_usd, source_hash) de todas las filas."""
+    with app.app_context():
+        return {id_: (salary, hash_) for id_, salary, hash_ in
+                db.session.query(Salary.id, Salary.salary_in_usd, Salary.source_hash).all()}
+
+
+@pytest.mark.parametrize('options', MODES)
+def test_removing_a_middle_row_deletes_only_that_row(app, tmp_path, options):
+    rows = source_rows(300)
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+    before = _rows(app)
+
+    del rows[150]
+    result = _seed(app, write_csv(path, rows), incremental=True, **options)
+
+    assert (result['inserted'], result['updated'], result['deleted']) == (0, 0, 1)
+    after = _rows(app)
+    assert len(after) == 299
+    assert all(before[id_] == value for id_, value in after.items())
+
+
+@pytest.mark.parametrize('options', MODES)
+def test_inserted_and_modified_rows(app, tmp_path, options):
+    rows = source_rows(300)
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+    before = _rows(app)
+
+    rows.insert(100, [2024, 123456, 'FT', 'SE', 'Data Engineer', 'US'])
+    rows[200][1] = 777777  # fila 199 del archivo original, ahora en la posición 200
+    result = _seed(app, write_csv(path, rows), incremental=True, **options)
+
+    # La fila modificada cambió de posición: se borra la versión vieja y se inserta la nueva
+    assert (result['inserted'], result['updated'], result['deleted']) == (2, 0, 1)
+    after = _rows(app)
+    assert len(after) == 301
+    salaries = sorted(salary for salary, _ in after.values())
+    assert 123456 in salaries and 777777 in salaries
+    unchanged = [id_ for id_, value in before.items() if after.get(id_) == value]
+    assert len(unchanged) == 299
+
+
+def test_modified_row_keeps_its_id(app, tmp_path):
+    rows = source_rows(100)
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+    with app.app_context():
+        id_ = db.session.query(Salary.id).filter(Salary.source_row == 40).scalar()
+
+    rows[40][1] = 654321
+    result = _seed(app, write_csv(path, rows), incremental=True)
+
+    assert (result['inserted'], result['updated'], result['deleted']) == (0, 1, 0)
+    assert _rows(app)[id_][0] == 654321
+
+
+def test_duplicate_rows_are_matched_one_to_one(app, tmp_path):
+    rows = source_rows(50)
+    rows[10:10] = [list(rows[5]), list(rows[5])]  # tres filas idénticas
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+
+    del rows[10]
+    result = _seed(app, write_csv(path, rows), incremental=True)
+
+    assert (result['inserted'], result['updated'], result['deleted']) == (0, 0, 1)
+    assert len(_rows(app)) == 51
+
+
+def test_rows_created_from_the_api_are_kept(app, client, tmp_path):
+    rows = source_rows(60)
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+    response = client.post('/api/salaries/bulk', json=[{
+        'area': 'Full-Time', 'position': 'Data Engineer', 'location': 'United States',
+        'experienceLevel': 'Senior', 'salary': 100000,
+    }])
+    assert response.status_code == 201
+
+    result = _seed(app, write_csv(path, rows[:-5]), incremental=True)
+
+    assert result['deleted'] == 5
+    assert len(_rows(app)) == 56
+
+
+def test_positions_are_refreshed_on_every_import(app, tmp_path):
+    rows = source_rows(100)
+    path = tmp_path / 'salaries.csv'
+    _seed(app, write_csv(path, rows))
+
+    rows.insert(0, [2024, 111111, 'FT', 'SE', 'Data Engineer', 'US'])  # desplaza todas las filas
+    assert _seed(app, write_csv(path, rows), incremental=True)['inserted'] == 1
+    with app.app_context():
+        positions = dict(db.session.query(Salary.salary_in_usd, Salary.source_row).all())
+    assert all(positions[row[1]] == i for i, row in enumerate(rows))
+
+    # La fila 5 original (ahora en la posición 6) desaparece y aparece una nueva en
+    # la posición 5: con posiciones viejas se tomaría como la misma fila modificada
+    removed = rows.pop(6)
+    rows.insert(5, [2024, 222222, 'FT', 'SE', 'Data Engineer', 'US'])
+    result = _seed(app, write_csv(path, rows), incremental=True)
+
+    assert (result['inserted'], result['updated'], result['deleted']) == (1, 0, 1)
+    salaries = {salary for salary, _ in _rows(app).values()}
+    assert 222222 in salaries and removed[1] not in salaries
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+import seed_from_excel
+from app import db
+from conftest import dispose, make_app, source_rows, write_csv
+
+
+@pytest.fixture
+def messy_csv(tmp_path):
+    """CSV con líneas en blanco (sueltas y en el límite de un bloque) y un campo con saltos de línea."""
+    path = write_csv(tmp_path / 'salaries.csv', source_rows(250))
+    lines = path.read_text().splitlines(keepends=True)
+    lines.insert(41, '\n')        # justo después de la fila 39: límite de bloque con batch_size=40
+    lines.insert(100, '   \n')
+    lines.insert(180, '\r\n')
+    lines.append('2024,99000,FT,SE,"Data\nEngineer",US\n')
+    lines.append('\n')
+    path.write_text(''.join(lines))
+    return str(path)
+
+
+def _serial(path):
+    normalized, rejected, row_count = seed_from_excel.prepare_batch(seed_from_excel.read_source(path))
+    return normalized, row_count
+
+
+def test_chunk_offsets_follow_read_csv_rows(messy_csv):
+    header, chunks = seed_from_excel.csv_chunk_offsets(messy_csv, 40)
+    expected_rows = len(pd.read_csv(messy_csv))
+
+    assert header == list(pd.read_csv(messy_csv, nrows=0).columns)
+    assert sum(nrows for _, _, _, nrows in chunks) == expected_rows == 251
+    assert [start for _, _, start, _ in chunks] == list(range(0, expected_rows, 40))
+
+
+def test_workers_match_serial_prepare(messy_csv):
+    normalized, row_count = _serial(messy_csv)
+
+    batches = list(seed_from_excel.iter_prepared_batches(messy_csv, 40, workers=2))
+    parallel = pd.concat([batch for batch, _, _ in batches])
+
+    assert sum(count for _, _, count in batches) == row_count
+    pd.testing.assert_frame_equal(parallel, normalized, check_dtype=False)
+
+
+def _stored_rows(app):
+    with app.app_context():
+        return db.session.execute(db.text(
+            'SELECT source_row, source_hash, salary_in_usd, year FROM salaries ORDER BY source_row'
+        )).all()
+
+
+def test_seed_workers_matches_serial_seed(messy_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_DIR', str(tmp_path / 'cache'))
+    stored = {}
+    for name, options in [('serial', {}), ('stream', {'stream': True, 'batch_size': 40}),
+                          ('workers', {'workers': 2, 'batch_size': 40})]:
+        app = make_app(tmp_path / f'{name}.db')
+        with app.app_context():
+            seed_from_excel._seed_from_excel(messy_csv, **options)
+        stored[name] = _stored_rows(app)
+        dispose(app)
+
+    assert len(stored['serial']) == 251
+    assert stored['workers'] == stored['serial']
+    assert stored['stream'] == stored['serial']
@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+import seed_from_excel
+from app.models.salary import Salary
+from conftest import dispose, make_app, source_rows, write_csv
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_DIR', str(tmp_path / 'cache'))
+
+
+def _rows_with_errors(count):
+    rows = source_rows(count)
+    rows[3][1] = 'n/a'
+    rows[7][4] = ''
+    return rows
+
+
+def _seed(tmp_path, name, path):
+    """Carga path en una base nueva y devuelve los salarios con sus nombres de dimensión."""
+    app = make_app(tmp_path / f'{name}.db')
+    try:
+        with app.app_context():
+            seed_from_excel._seed_from_excel(str(path))
+            return [
+                (s.source_row, s.year, s.salary_in_usd, s.source_hash, s.job_title_type_ref.job_title,
+                 s.location_type_ref.location, s.experience_level_type_ref.experience_level,
+                 s.employment_type_ref.employment_type)
+                for s in Salary.query.order_by(Salary.source_row)
+            ]
+    finally:
+        dispose(app)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(write_csv(tmp_path / 'seed.csv', _rows_with_errors(60)))
+    file_hash = seed_from_excel.file_fingerprint(path)
+    prepared = seed_from_excel.prepare_batch(seed_from_excel.read_source(path))
+
+    seed_from_excel.save_snapshot(path, file_hash, prepared)
+    loaded = seed_from_excel.load_snapshot(path, file_hash)
+
+    assert os.path.exists(seed_from_excel.snapshot_path(path))
+    pd.testing.assert_frame_equal(loaded[0], prepared[0], check_dtype=False)
+    assert loaded[1:] == prepared[1:]
+    assert sum(prepared[1].values()) == 2
+
+
+def test_second_seed_uses_snapshot(tmp_path, capsys):
+    path = write_csv(tmp_path / 'seed.csv', _rows_with_errors(120))
+
+    first = _seed(tmp_path, 'first', path)
+    assert 'Usando snapshot normalizado' not in capsys.readouterr().out
+    second = _seed(tmp_path, 'second', path)
+    output = capsys.readouterr().out
+
+    assert 'Usando snapshot normalizado' in output
+    assert 'Filas saltadas por errores/validación: 2' in output
+    assert len(first) == 118
+    assert second == first
+
+
+def test_changed_file_invalidates_snapshot(tmp_path, capsys):
+    path = write_csv(tmp_path / 'seed.csv', source_rows(50))
+    _seed(tmp_path, 'first', path)
+    rows = source_rows(50)
+    rows[0][1] = 999_999
+    write_csv(path, rows)
+    capsys.readouterr()
+
+    salaries = _seed(tmp_path, 'second', path)
+
+    assert 'Usando snapshot normalizado' not in capsys.readouterr().out
+    assert salaries[0][2] == 999_999
+    # El snapshot se regenera para el archivo nuevo
+    assert seed_from_excel.load_snapshot(str(path), seed_from_excel.file_fingerprint(path)) is not None
+
+
+def test_snapshot_from_other_version_is_ignored(tmp_path, monkeypatch):
+    path = str(write_csv(tmp_path / 'seed.csv', source_rows(20)))
+    file_hash = seed_from_excel.file_fingerprint(path)
+    seed_from_excel.save_snapshot(path, file_hash, seed_from_excel.prepare_batch(seed_from_excel.read_source(path)))
+
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_VERSION', seed_from_excel.SNAPSHOT_VERSION + 1)
+
+    assert seed_from_excel.load_snapshot(path, file_hash) is None
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    path = str(write_csv(tmp_path / 'seed.csv', source_rows(20)))
+    os.makedirs(seed_from_excel.SNAPSHOT_DIR)
+    with open(seed_from_excel.snapshot_path(path), 'wb') as f:
+        f.write(b'no es un npz')
+
+    assert seed_from_excel.load_snapshot(path, seed_from_excel.file_fingerprint(path)) is None
@@ -0,0 +1,52 @@
+import pytest
+from openpyxl import Workbook
+
+import seed_from_excel
+from app import db
+from app.models.salary import Salary
+from conftest import SOURCE_HEADER, dispose, make_app, source_rows
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_DIR', str(tmp_path / 'cache'))
+
+
+def _write_xlsx(path, rows):
+    """Excel con los datos en la primera hoja, encabezados con espacios y otra hoja activa."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = 'salaries'
+    sheet.append([f' {column} ' for column in SOURCE_HEADER])
+    for row in rows:
+        sheet.append(row)
+    notes = workbook.create_sheet('notas')
+    notes.append(['work_year', 'salary_in_usd'])
+    notes.append([2024, 1])
+    workbook.active = 1
+    workbook.save(path)
+    return str(path)
+
+
+def _salaries(app):
+    with app.app_context():
+        return db.session.query(Salary.source_row, Salary.salary_in_usd, Salary.source_hash) \
+            .order_by(Salary.source_row).all()
+
+
+@pytest.mark.parametrize('options', [{'stream': True, 'batch_size': 40}, {'workers': 2, 'batch_size': 40}])
+def test_streaming_excel_matches_read_excel(tmp_path, options):
+    path = _write_xlsx(tmp_path / 'salaries.xlsx', source_rows(150))
+    results = []
+    for name, seed_options in (('serial', {}), ('stream', options)):
+        app = make_app(tmp_path / f'{name}.db')
+        try:
+            with app.app_context():
+                seed_from_excel._seed_from_excel(path, **seed_options)
+            results.append(_salaries(app))
+        finally:
+            dispose(app)
+
+    serial, streamed = results
+    assert len(serial) == 150
+    assert streamed == serial
@@ -0,0 +1,62 @@
+import threading
+import time
+
+import seed_from_excel
+from app import db
+from app.models.salary import Salary
+from conftest import dispose, make_app, source_rows, write_csv
+
+READERS = 3
+SECONDS = 1.5
+
+
+def test_readers_never_see_database_is_locked_with_wal(tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_from_excel, 'SNAPSHOT_DIR', str(tmp_path / 'cache'))
+    # Sin espera por locks (timeout del driver y busy_timeout en 0): un lector
+    # bloqueado por el escritor fallaría en el acto con "database is locked".
+    # Con WAL los lectores no esperan al escritor, así que no debe ocurrir.
+    app = make_app(tmp_path / 'concurrency.db', SQLITE_TUNING_ENABLED=True, SQLITE_BUSY_TIMEOUT_MS=0,
+                   SQLALCHEMY_ENGINE_OPTIONS={'connect_args': {'timeout': 0}})
+    try:
+        with app.app_context():
+            seed_from_excel._seed_from_excel(str(write_csv(tmp_path / 'salaries.csv', source_rows(500))))
+            journal = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+            template = db.session.get(Salary, 1)
+            new_salary = {
+                'area': template.employment_type,
+                'location': template.location,
+                'position': template.job_title,
+                'experienceLevel': template.experience_level,
+                'salary': 120000,
+            }
+        assert journal == 'wal'
+
+        stop = threading.Event()
+        results = []
+        lock = threading.Lock()
+
+        def run(request):
+            client = app.test_client()
+            while not stop.is_set():
+                response = request(client)
+                with lock:
+                    results.append((response.request.method, response.status_code,
+                                    response.get_data(as_text=True)))
+
+        threads = [threading.Thread(target=run, args=(lambda c: c.post('/api/salaries/', json=new_salary),))]
+        threads += [threading.Thread(target=run, args=(lambda c: c.get('/api/salaries/?after_id=100&limit=50'),))
+                    for _ in range(READERS)]
+        for thread in threads:
+            thread.start()
+        time.sleep(SECONDS)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        dispose(app)
+
+    failures = [(method, status, body[:200]) for method, status, body in results if not 200 <= status < 300]
+    assert not any('database is locked' in body for *_, body in failures)
+    assert failures == []
+    assert sum(method == 'POST' for method, *_ in results) > 0
+    assert sum(method == 'GET' for method, *_ in results) > 0